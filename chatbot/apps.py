@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ChatbotConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'chatbot'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        # Under gunicorn's preload_app this runs once in the master, so the
+        # forked workers share the model's memory copy-on-write.
+        if settings.CHATBOT_PRELOAD_SPACY:
+            from .nlp import get_nlp
+            get_nlp()
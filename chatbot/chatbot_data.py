@@ -6071,4 +6071,3268 @@ TOPIC_FALLBACKS = {
             {"text": "Skin Care Tips", "payload": "skin care tips"}
         ]}
     ]
-}
\ No newline at end of file
+}
+
+
+# Keyword scoring rules used by ``views.score_tag`` to pick the most likely tag
+# for a query. Each tag maps to a list of ``(points, clauses)`` rules: a rule
+# awards its points when every clause has at least one of its phrases occurring
+# as a substring of the lower-cased query. Ties go to the tag listed first.
+SCORING_RULES = {
+    # ROSACEA RULES
+    "rosacea vs acne": [
+        (2, [["rosacea"], ["acne"]]),
+        (2, [["vs", "difference", "compare"]]),
+    ],
+    "rosacea remedies": [
+        (2, [["rosacea"], ["remedy", "treat", "cure", "solution", "manage"]]),
+    ],
+    "rosacea causes": [
+        (2, [["rosacea"], ["cause", "why", "reason", "origin"]]),
+    ],
+    "rosacea symptoms": [
+        (2, [["rosacea"], ["symptom", "sign", "look like"]]),
+    ],
+    "rosacea triggers": [
+        (2, [["rosacea"], ["trigger", "flare", "flare-up"]]),
+    ],
+    "rosacea diet": [
+        (2, [["rosacea"], ["food", "diet", "eat", "avoid"]]),
+    ],
+    "rosacea prevention": [
+        (2, [["rosacea"], ["prevent", "avoid", "sun protection"]]),
+    ],
+    "rosacea myths": [
+        (2, [["rosacea"], ["myth", "misconception", "hygiene"]]),
+    ],
+    "what is rosacea": [
+        (1, [["rosacea"]]),
+    ],
+
+    # BLACKHEAD RULES
+    "what causes blackheads": [
+        (2, [
+            ["blackhead", "blackheads"],
+            [
+                "cause", "causes", "reason", "reasons", "origin", "leads to", "trigger", "form",
+                "develop", "formation", "why", "appear", "keep coming",
+            ],
+        ]),
+        (1, [["blackhead", "blackheads"]]),
+    ],
+    "blackhead remedies": [
+        (2, [
+            ["blackhead", "blackheads"],
+            ["remedy", "remedies", "treat", "treatment", "cure", "solution", "manage"],
+        ]),
+    ],
+    "blackhead symptoms": [
+        (2, [
+            ["blackhead", "blackheads"],
+            [
+                "symptom", "symptoms", "sign", "signs", "look like", "identify", "detect",
+                "appearance",
+            ],
+        ]),
+    ],
+    "blackhead prevention": [
+        (2, [["blackhead", "blackheads"], ["prevent", "prevention", "stop", "avoid", "block"]]),
+    ],
+    "blackhead removal": [
+        (2, [
+            ["blackhead", "blackheads"],
+            [
+                "remove", "removal", "extract", "get rid", "clean", "tool", "pore strip", "pop",
+                "squeeze",
+            ],
+        ]),
+    ],
+    "blackhead professional treatments": [
+        (2, [
+            ["blackhead", "blackheads"],
+            [
+                "dermatologist", "professional", "treatment", "facial", "chemical peel",
+                "microdermabrasion",
+            ],
+        ]),
+    ],
+    "blackhead myths": [
+        (2, [
+            ["blackhead", "blackheads"],
+            ["myth", "myths", "misconception", "misconceptions", "dirt", "scrub", "hygiene"],
+        ]),
+    ],
+    "blackheads and acne": [
+        (2, [
+            ["blackhead", "blackheads"],
+            ["acne"],
+            ["difference", "relation", "vs", "link", "compare"],
+        ]),
+    ],
+    "blackhead areas": [
+        (2, [
+            ["blackhead", "blackheads"],
+            ["nose", "chin", "forehead", "back", "chest", "shoulder", "t-zone", "face"],
+        ]),
+    ],
+    "blackheads on skin types": [
+        (2, [
+            ["blackhead", "blackheads"],
+            ["oily", "dry", "combination", "sensitive", "skin type", "skin"],
+        ]),
+    ],
+    "blackhead products": [
+        (2, [
+            ["blackhead", "blackheads"],
+            [
+                "product", "products", "ingredient", "ingredients", "cleanser", "mask", "salicylic",
+                "retinoid", "niacinamide", "benzoyl peroxide",
+            ],
+        ]),
+    ],
+    "blackhead diet": [
+        (2, [["blackhead", "blackheads"], ["diet", "food", "dairy", "sugar", "eat", "nutrition"]]),
+    ],
+    "blackheads by age": [
+        (2, [["blackhead", "blackheads"], ["teen", "adult", "age", "older", "younger", "puberty"]]),
+    ],
+    "what are blackheads": [
+        (1, [["blackhead", "blackheads"]]),
+    ],
+
+    # ACNE
+    "acne causes": [
+        (2, [["acne"], ["cause", "why", "reason", "origin", "trigger"]]),
+        (2, [
+            [
+                "excess oil", "clogged pores", "dead skin cells", "bacteria", "Cutibacterium",
+                "hormones", "puberty", "period", "PCOS", "genetics", "medications", "steroids",
+                "lithium", "stress", "diet", "dairy", "sugar", "greasy foods", "smoking",
+                "lack of sleep", "sweating", "makeup", "skincare", "poor hygiene", "pollution",
+                "environmental", "dirty pillowcase",
+            ],
+            ["acne"],
+        ]),
+    ],
+    "acne symptoms": [
+        (2, [["acne"], ["symptom", "sign", "look like", "identify", "how to know", "do i have"]]),
+    ],
+    "acne remedies": [
+        (2, [
+            ["acne"],
+            [
+                "remedy", "remedies", "treat", "get rid", "natural", "home", "cure", "solution",
+                "fix", "manage", "removal",
+            ],
+        ]),
+    ],
+    "acne and diet": [
+        (2, [
+            ["acne"],
+            [
+                "diet", "food", "eat", "avoid", "trigger", "prevent", "reduce", "worsen",
+                "best foods", "what to eat",
+            ],
+        ]),
+    ],
+    "acne treats": [
+        (2, [
+            ["acne"],
+            [
+                "prescription", "oral antibiotics", "doxycycline", "clindamycin", "isotretinoin",
+                "accutane", "hormonal therapy", "birth control", "spironolactone", "chemical peels",
+                "laser", "light therapy", "cortisone",
+            ],
+        ]),
+    ],
+    "acne skincare": [
+        (2, [
+            ["acne"],
+            [
+                "skincare", "cleanser", "moisturizer", "routine", "non-comedogenic", "products",
+                "ingredients", "sunscreen",
+            ],
+        ]),
+    ],
+    "acne prevention": [
+        (2, [
+            ["acne"],
+            [
+                "prevent", "avoid", "trigger", "dirty pillowcase", "maskne", "hygiene", "stop",
+                "lifestyle",
+            ],
+        ]),
+    ],
+    "acne myths": [
+        (2, [
+            ["acne"],
+            [
+                "myth", "misconception", "true", "false", "scrubbing", "dirt", "pop pimples",
+                "teenagers only",
+            ],
+        ]),
+    ],
+    "acne psychology": [
+        (2, [
+            ["acne"],
+            [
+                "self-esteem", "social anxiety", "depression", "emotional impact", "bullying",
+                "stigma",
+            ],
+        ]),
+    ],
+    "acne by age": [
+        (2, [["acne"], ["teenage", "adult", "baby", "pregnancy", "men", "women", "age"]]),
+    ],
+    "acne location": [
+        (2, [
+            [
+                "forehead acne", "chin acne", "nose acne", "cheek acne", "back acne", "chest acne",
+                "shoulder acne", "scalp acne", "butt acne", "acne on",
+            ],
+        ]),
+    ],
+    "acne scars": [
+        (2, [
+            ["acne"],
+            [
+                "scar", "scars", "ice pick", "boxcar", "rolling", "post-inflammatory",
+                "hyperpigmentation", "red spots", "acne marks", "microneedling", "laser",
+                "treat scars",
+            ],
+        ]),
+    ],
+    "acne and condition": [
+        (2, [
+            ["acne"],
+            ["PCOS", "hormonal imbalance", "gut health", "fungal acne", "bacterial acne"],
+        ]),
+    ],
+    "acne triggers": [
+        (2, [
+            ["acne"],
+            [
+                "trigger", "flare", "flare-up", "hormones", "stress", "food", "humidity", "sweat",
+                "medications", "hair products", "skincare products",
+            ],
+        ]),
+    ],
+    "what is acne": [
+        (2, [
+            ["acne"],
+            [
+                "what", "define", "meaning", "about", "info", "explain", "summary", "overview",
+                "description",
+            ],
+        ]),
+        (1, [["acne"]]),
+    ],
+
+    # DARK CIRCLES QUERY TAGGING
+    "what are dark circles": [
+        (2, [
+            ["dark circles"],
+            ["what", "define", "meaning", "explain", "about", "description", "overview"],
+        ]),
+        (1, [["dark circles"]]),
+    ],
+    "dark circles causes": [
+        (2, [
+            ["dark circles"],
+            ["cause", "causes", "why", "reason", "reasons", "origin", "due to", "from", "lead to"],
+        ]),
+    ],
+    "dark circles symptoms": [
+        (2, [["dark circles"], ["symptom", "sign", "appearance", "look like", "indicate"]]),
+    ],
+    "dark circles treatment": [
+        (2, [
+            ["dark circles"],
+            [
+                "treatment", "how to treat", "treat", "get rid", "fix", "remove", "reduce", "fade",
+                "solution", "healing",
+            ],
+        ]),
+    ],
+    "dark circles remedies": [
+        (2, [
+            ["dark circles"],
+            [
+                "remedy", "remedies", "home remedy", "natural remedy", "cure", "DIY",
+                "natural ways", "how to remove",
+            ],
+        ]),
+    ],
+    "dark circles prevention": [
+        (2, [
+            ["dark circles"],
+            ["prevent", "avoid", "stop", "reduce risk", "how to avoid", "preventing", "lifestyle"],
+        ]),
+    ],
+    "dark circles skincare": [
+        (2, [
+            ["dark circles"],
+            [
+                "skincare", "eye cream", "serum", "routine", "eye mask", "ingredients", "products",
+                "best for", "topical",
+            ],
+        ]),
+    ],
+    "dark circles by age": [
+        (2, [
+            ["dark circles"],
+            [
+                "child", "children", "teen", "adolescent", "adult", "elderly", "age", "aging",
+                "older", "young",
+            ],
+        ]),
+    ],
+    "dark circles and sleep": [
+        (2, [
+            ["dark circles"],
+            ["sleep", "lack of sleep", "rest", "insomnia", "sleep deprived", "sleep schedule"],
+        ]),
+    ],
+    "dark circles and diet": [
+        (2, [
+            ["dark circles"],
+            [
+                "diet", "food", "eat", "nutrition", "vitamin", "iron", "deficiency", "hydration",
+                "water intake", "foods for",
+            ],
+        ]),
+    ],
+    "dark circles and health": [
+        (2, [
+            ["dark circles"],
+            [
+                "health issue", "underlying", "allergy", "dehydration", "anemia", "sinus",
+                "hereditary", "genetics",
+            ],
+        ]),
+    ],
+    "dark circles myths": [
+        (2, [["dark circles"], ["myth", "misconception", "false", "truth", "common myths"]]),
+    ],
+    "eye bags vs dark circles": [
+        (2, [["eye bags"], ["dark circles"]]),
+        (2, [["vs", "difference", "compare", "distinguish"]]),
+    ],
+    "eye bags causes": [
+        (2, [["eye bags"], ["cause", "reason", "why", "origin", "lead", "makes", "get", "appear"]]),
+        (1, [["puffy eyes"], ["cause", "reason", "why"]]),
+    ],
+    "eye bags symptoms": [
+        (2, [["eye bags"], ["symptom", "sign", "look like", "identify", "know", "have"]]),
+        (1, [["puffy eyes"], ["symptom"]]),
+    ],
+    "eye bags remedies": [
+        (2, [
+            ["eye bags"],
+            ["remedy", "treat", "cure", "fix", "get rid", "solution", "manage", "remove"],
+        ]),
+        (1, [["puffy eyes"], ["reduce", "treat"]]),
+    ],
+    "eye bags types": [
+        (2, [["eye bags"], ["types", "kinds", "categories", "classification", "forms"]]),
+    ],
+    "eyebags vs hollowness": [
+        (2, [["eye bags"], ["hollowness"]]),
+        (2, [["difference", "vs", "compare"]]),
+    ],
+    "eyebags skincare": [
+        (2, [
+            ["eye bags"],
+            [
+                "skincare", "eye cream", "routine", "apply", "serum", "retinol", "hyaluronic",
+                "massage",
+            ],
+        ]),
+    ],
+    "eyebags prevention": [
+        (2, [["eye bags"], ["prevent", "avoid", "stop", "tips", "how to stop", "how to avoid"]]),
+    ],
+    "eyebags and aging": [
+        (2, [["eye bags"], ["aging", "age", "older", "get worse with age", "thinning", "fat"]]),
+    ],
+    "what are eye bags": [
+        (1, [["eye bags"], ["what", "define", "explain", "meaning", "info", "understand"]]),
+    ],
+    "freckles types": [
+        (2, [
+            ["freckles"],
+            ["types", "kinds", "categories", "classify", "variants", "variety", "different"],
+        ]),
+        (1, [["freckles"]]),
+    ],
+    "freckles skincare": [
+        (2, [
+            ["freckles"],
+            [
+                "skincare", "skin care", "routine", "sunscreen", "products", "cream", "serum",
+                "moisturizer",
+            ],
+        ]),
+    ],
+    "freckles and sun": [
+        (2, [
+            ["freckles"],
+            ["sun", "sunlight", "uv", "tanning", "summer", "sun exposure", "darken", "sunscreen"],
+        ]),
+    ],
+    "freckles treatments": [
+        (2, [
+            ["freckles"],
+            [
+                "remove", "removal", "treatment", "laser", "peel", "fade", "clinic",
+                "dermatologist", "solution", "cure",
+            ],
+        ]),
+    ],
+    "freckles and genetics": [
+        (2, [
+            ["freckles"],
+            ["genetic", "heredity", "inherited", "dna", "genes", "family", "ethnicity"],
+        ]),
+    ],
+    "freckles prevention": [
+        (2, [
+            ["freckles"],
+            ["prevent", "prevention", "avoid", "stop", "reduce", "sunblock", "sunscreen", "tips"],
+        ]),
+    ],
+    "freckles vs others": [
+        (2, [["freckles"], ["vs", "difference", "compare", "distinguish", "apart"]]),
+    ],
+    "freckles and makeup": [
+        (2, [["freckles"], ["makeup", "foundation", "concealer", "cover", "enhance", "routine"]]),
+    ],
+    "freckles causes": [
+        (2, [
+            ["freckles"],
+            ["cause", "causes", "why", "reason", "origin", "trigger", "make", "form", "factors"],
+        ]),
+    ],
+    "freckles symptoms": [
+        (2, [
+            ["freckles"],
+            ["symptom", "sign", "look like", "appearance", "identify", "recognize"],
+        ]),
+    ],
+    "freckles remedies": [
+        (2, [
+            ["freckles"],
+            ["remedy", "treat", "cure", "solution", "fix", "fade", "lighten", "home", "natural"],
+        ]),
+    ],
+    "what are freckles": [
+        (1, [
+            ["freckles"],
+            ["what", "define", "explain", "meaning", "tell", "info", "description"],
+        ]),
+    ],
+    "pigmentation causes": [
+        (2, [
+            [
+                "cause", "causes", "reason", "reasons", "why do i get", "why do i have", "origin",
+                "genesis", "lead to", "pigmentation causes", "dark spots causes",
+                "hyperpigmentation causes",
+            ],
+            ["pigmentation"],
+        ]),
+    ],
+    "body pigmentation": [
+        (2, [
+            [
+                "dark spots on hands", "dark spots on arms", "dark spots on body",
+                "pigmentation on body",
+            ],
+        ]),
+    ],
+    "pigmentation symptoms": [
+        (2, [
+            [
+                "symptoms", "signs", "look like", "how to identify", "how to know", "recognize",
+                "identify",
+            ],
+            ["pigmentation", "dark spots"],
+        ]),
+    ],
+    "pigmentation remedies": [
+        (2, [
+            [
+                "remedy", "treat", "treatment", "get rid of", "home remedy", "natural remedy",
+                "cure", "fix", "solution", "remove", "fade", "manage", "lighten",
+            ],
+            ["pigmentation", "dark spots"],
+        ]),
+    ],
+    "pigmentation types": [
+        (2, [
+            ["types", "kinds", "different types", "classify", "categories", "variety"],
+            ["pigmentation"],
+        ]),
+    ],
+    "dark spots vs freckles": [
+        (2, [["freckles"], ["difference", "vs", "compare"], ["dark spots"]]),
+    ],
+    "darkspots vs melasma": [
+        (2, [["melasma"], ["difference", "vs", "compare"], ["dark spots"]]),
+    ],
+    "darkspots vs age spots": [
+        (2, [["age spots"], ["difference", "vs", "compare"], ["dark spots"]]),
+    ],
+    "darkspots vs sun spots": [
+        (2, [["sunspots"], ["difference", "vs", "compare"], ["dark spots"]]),
+    ],
+    "darkspots vs acne scars": [
+        (2, [["acne scars"], ["difference", "vs", "compare"], ["dark spots"]]),
+    ],
+    "sun exposure and dark spots": [
+        (2, [
+            ["sun", "sunlight", "uv rays", "tanning", "sun exposure"],
+            ["dark spots", "pigmentation"],
+        ]),
+    ],
+    "prevent dark spots": [
+        (2, [["prevent", "preventing", "stop", "avoid"], ["dark spots", "pigmentation"]]),
+    ],
+    "sunscreen for pigmentation prevention": [
+        (2, [["sunscreen", "sunblock", "sun protection", "spf"], ["dark spots", "pigmentation"]]),
+    ],
+    "lifestyle tips dark spots": [
+        (2, [["lifestyle", "daily habits", "tips"], ["dark spots", "pigmentation"]]),
+    ],
+    "skincare routine pigmentation": [
+        (2, [["skincare", "routine", "products", "best skincare"], ["pigmentation", "dark spots"]]),
+    ],
+    "diet and pigmentation": [
+        (2, [["diet", "foods", "nutrition", "food"], ["pigmentation", "dark spots"]]),
+    ],
+    "avoiding pigmentation triggers": [
+        (2, [["trigger", "triggers", "avoid"], ["pigmentation", "dark spots"]]),
+    ],
+    "serious dark spot signs": [
+        (2, [
+            ["serious", "warning", "red flag", "signs", "symptoms"],
+            ["dark spots", "pigmentation"],
+        ]),
+    ],
+    "birthmarks and pigmentation": [
+        (2, [["birthmarks"], ["pigmentation", "dark spots"]]),
+    ],
+    "dark spots makeup solutions": [
+        (2, [
+            ["makeup", "conceal", "cover", "foundation", "cosmetics"],
+            ["dark spots", "pigmentation"],
+        ]),
+    ],
+    "what is pigmentation": [
+        (1, [
+            [
+                "what is pigmentation", "define pigmentation", "explain pigmentation",
+                "meaning of pigmentation", "pigmentation meaning", "info on pigmentation",
+                "what does pigmentation mean", "skin pigmentation", "what are dark spots",
+                "define dark spots", "explain dark spots", "dark spots meaning",
+                "skin spots meaning",
+            ],
+        ]),
+    ],
+    "wrinkles causes": [
+        (2, [
+            [
+                "cause", "causes", "reason", "reasons", "why do i get", "why do i have",
+                "what causes wrinkles", "origin", "genesis", "lead to", "wrinkles causes",
+                "wrinkle causes", "how do wrinkles form", "what makes wrinkles appear",
+                "aging causes wrinkles", "sun causes wrinkles", "smoking and wrinkles",
+                "pollution and wrinkles", "hydration and wrinkles",
+                "facial expressions cause wrinkles", "stress and wrinkles",
+                "gravity cause wrinkles",
+            ],
+            ["wrinkle"],
+        ]),
+    ],
+    "wrinkles symptoms": [
+        (2, [
+            [
+                "symptoms", "signs", "look like", "how to identify", "how to know", "recognize",
+                "identify", "wrinkle signs", "what do wrinkles look like",
+                "how to tell if i have wrinkles",
+            ],
+            ["wrinkle"],
+        ]),
+    ],
+    "wrinkles remedies": [
+        (2, [
+            [
+                "remedy", "remedies", "treat", "treatment", "get rid of", "home remedy",
+                "natural remedy", "cure", "fix", "solution", "remove", "fade", "manage", "lighten",
+                "wrinkle removal", "wrinkle treatment", "how to make wrinkles go away",
+                "what helps wrinkles", "wrinkle solutions",
+            ],
+            ["wrinkle"],
+        ]),
+    ],
+    "wrinkles types": [
+        (2, [
+            [
+                "types", "kinds", "different types", "classify", "categories", "variety",
+                "classification",
+            ],
+            ["wrinkle"],
+        ]),
+    ],
+
+    # Subcategories for causes (optional fine-grained scoring)
+    "wrinkles causes aging": [
+        (2, [["aging", "natural aging", "age-related"], ["wrinkle"]]),
+    ],
+    "wrinkles causes sun uv": [
+        (2, [["sun", "uv", "sun exposure", "uv rays", "sunlight", "tanning"], ["wrinkle"]]),
+    ],
+    "wrinkles causes smoking": [
+        (2, [["smoking", "cigarette", "tobacco"], ["wrinkle"]]),
+    ],
+    "wrinkles causes pollution": [
+        (2, [["pollution", "environmental pollution", "air pollution"], ["wrinkle"]]),
+    ],
+    "wrinkles causes hydration nutrition": [
+        (2, [["hydration", "dehydration", "nutrition", "diet"], ["wrinkle"]]),
+    ],
+    "wrinkles causes facial expressions": [
+        (2, [["facial expressions", "frowning", "smiling", "expression lines"], ["wrinkle"]]),
+    ],
+    "wrinkles causes stress lifestyle": [
+        (2, [["stress", "lifestyle", "unhealthy lifestyle"], ["wrinkle"]]),
+    ],
+    "wrinkles causes gravity sagging": [
+        (2, [["gravity", "skin sagging", "sagging skin"], ["wrinkle"]]),
+    ],
+
+    # Prevention and treatment
+    "wrinkles prevention sunscreen uv": [
+        (2, [["sunscreen", "sunblock", "sun protection", "spf"], ["wrinkle"]]),
+    ],
+    "wrinkles prevention moisturizers hydration": [
+        (2, [["moisturizer", "hydration", "moisturizers"], ["wrinkle"]]),
+    ],
+    "wrinkles prevention lifestyle changes": [
+        (2, [
+            ["lifestyle", "diet", "sleep", "hydration", "healthy lifestyle", "drinking water"],
+            ["wrinkle"],
+        ]),
+    ],
+    "what are wrinkles": [
+        (1, [
+            [
+                "what are wrinkles", "define wrinkles", "explain wrinkles", "meaning of wrinkles",
+                "wrinkles meaning", "info on wrinkles", "what does wrinkles mean", "skin wrinkles",
+                "what's a wrinkle", "what is a wrinkle", "describe wrinkles",
+                "basic info on wrinkles", "about skin wrinkles", "tell me about wrinkles",
+                "what exactly are wrinkles", "can you explain what wrinkles are",
+            ],
+        ]),
+    ],
+    "skin cancer causes": [
+        (2, [
+            [
+                "cause", "causes", "reason", "reasons", "why do i get", "why do i have", "origin",
+                "genesis", "lead to", "skin cancer causes", "skin cancer origin",
+                "skin cancer reason",
+            ],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer symptoms": [
+        (2, [
+            [
+                "symptoms", "signs", "look like", "how to identify", "how to know", "recognize",
+                "identify", "skin cancer symptoms", "skin cancer signs",
+            ],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer remedies": [
+        (2, [
+            [
+                "remedy", "treat", "treatment", "get rid of", "home remedy", "natural remedy",
+                "cure", "fix", "solution", "remove", "manage", "therapy", "treatment options",
+                "skin cancer removal",
+            ],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer types": [
+        (2, [
+            [
+                "types", "kinds", "different types", "classify", "categories", "variety",
+                "basal cell carcinoma", "squamous cell carcinoma", "melanoma",
+            ],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer risk factors": [
+        (2, [
+            [
+                "risk factors", "risk", "susceptibility", "predisposition", "who is at risk",
+                "increases risk", "uv exposure", "sunburn", "tanning beds", "fair skin",
+            ],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer early detection": [
+        (2, [
+            [
+                "early detection", "detect early", "self-examination", "abcde", "mole check",
+                "early signs", "spotting early",
+            ],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer treatment options": [
+        (2, [
+            [
+                "treatment options", "surgery", "radiation", "chemotherapy", "immunotherapy",
+                "mohs surgery", "cryotherapy", "photodynamic therapy", "targeted therapy",
+            ],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer prevention tips": [
+        (2, [
+            [
+                "prevention", "prevent", "sun protection", "avoid tanning beds", "reduce risk",
+                "sun safety", "how to stop",
+            ],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer screening guidelines": [
+        (2, [
+            [
+                "screening guidelines", "screening frequency", "check-up schedule",
+                "dermatologist check", "recommended screening", "how often to screen",
+            ],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer sunscreen role": [
+        (2, [
+            [
+                "sunscreen", "sunblock", "spf", "sun protection", "does sunscreen prevent",
+                "sunscreen benefits",
+            ],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer recurrence followup": [
+        (2, [
+            [
+                "recurrence", "follow-up", "relapse", "after treatment", "monitoring",
+                "post treatment care",
+            ],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer myths facts": [
+        (2, [
+            ["myths", "facts", "misconceptions", "truth", "debunking", "true or false"],
+            ["skin cancer"],
+        ]),
+    ],
+    "skin cancer tanning behaviour": [
+        (2, [
+            ["tanning", "tanning beds", "indoor tanning", "sunbathing", "artificial tanning"],
+            ["skin cancer"],
+        ]),
+    ],
+    "what is skin cancer": [
+        (1, [
+            [
+                "what is skin cancer", "define skin cancer", "explain skin cancer",
+                "meaning of skin cancer", "info about skin cancer", "skin malignancy",
+                "cutaneous cancer", "skin neoplasm",
+            ],
+        ]),
+    ],
+    "sun spots causes": [
+        (2, [
+            [
+                "cause", "causes", "reason", "reasons", "why do i get", "why do i have", "origin",
+                "genesis", "lead to", "sun spots causes", "sun spots origin", "sun spots reason",
+            ],
+            ["sun spots"],
+        ]),
+    ],
+    "sun spots symptoms": [
+        (2, [
+            [
+                "symptoms", "signs", "look like", "how to identify", "how to know", "recognize",
+                "identify", "sun spots symptoms", "sun spots signs",
+            ],
+            ["sun spots"],
+        ]),
+    ],
+    "sun spots remedies": [
+        (2, [
+            [
+                "remedy", "treat", "treatment", "get rid of", "home remedy", "natural remedy",
+                "cure", "fix", "solution", "remove", "manage", "therapy", "treatment options",
+                "sun spots removal",
+            ],
+            ["sun spots"],
+        ]),
+    ],
+    "sun spots types": [
+        (2, [
+            ["types", "kinds", "different types", "classify", "categories", "variety"],
+            ["sun spots"],
+        ]),
+    ],
+    "sun spots vs age spots": [
+        (2, [
+            [
+                "vs age spots", "difference between sun spots and age spots",
+                "are sun spots age spots", "age spots versus sun spots",
+            ],
+            ["sun spots"],
+        ]),
+    ],
+    "sun spots vs freckles": [
+        (2, [
+            [
+                "vs freckles", "difference between sun spots and freckles",
+                "are sun spots freckles", "freckles vs sun spots",
+            ],
+            ["sun spots"],
+        ]),
+    ],
+    "sun spots vs pigmentation": [
+        (2, [
+            [
+                "hyperpigmentation vs sun spots",
+                "difference between hyperpigmentation and sun spots",
+                "are sun spots hyperpigmentation",
+            ],
+            ["sun spots"],
+        ]),
+    ],
+    "dangerous sun spots": [
+        (2, [
+            ["dangerous", "cancerous", "harmful", "sign of cancer", "precancerous"],
+            ["sun spots"],
+        ]),
+    ],
+    "sun spots go away": [
+        (2, [["go away", "disappear naturally", "fade", "natural fading"], ["sun spots"]]),
+    ],
+    "sun spots causes sun exposure": [
+        (2, [["sun exposure", "sunlight", "uv rays"], ["sun spots"]]),
+    ],
+    "sun spots causes tanning": [
+        (2, [["tanning", "tanning beds", "artificial tanning"], ["sun spots"]]),
+    ],
+    "sun spots aging connection": [
+        (2, [["aging", "age spots relate", "sun spots as you age"], ["sun spots"]]),
+    ],
+    "sun spots skin type risks": [
+        (2, [["skin type", "which skin types", "fair skin", "skin complexion"], ["sun spots"]]),
+    ],
+    "sun spots prevention": [
+        (2, [
+            ["prevent", "prevention", "tips to avoid", "stop sun spots from forming"],
+            ["sun spots"],
+        ]),
+    ],
+    "sun spots prevention sunscreen": [
+        (2, [
+            ["sunscreen", "sunblock", "spf", "does sunscreen prevent", "sunscreen benefits"],
+            ["sun spots"],
+        ]),
+    ],
+    "sun protection tips": [
+        (2, [["sun protection tips", "sun safe", "ways to protect skin"], ["sun spots"]]),
+    ],
+    "sun spots prevention after tanning": [
+        (2, [
+            [
+                "prevent after tanning", "avoid sun spots after sunbathing",
+                "post-tanning sun spot prevention",
+            ],
+            ["sun spots"],
+        ]),
+    ],
+    "sun spots prevention antioxidants": [
+        (2, [["antioxidants", "do antioxidants prevent", "antioxidant benefits"], ["sun spots"]]),
+    ],
+    "sun spots skincare": [
+        (2, [
+            [
+                "skincare", "products for sun spots", "best skincare",
+                "treat sun spots with skincare",
+            ],
+            ["sun spots"],
+        ]),
+    ],
+    "sun spots makeup cover": [
+        (2, [
+            [
+                "makeup to cover", "concealing sun spots", "cover sun spots with makeup",
+                "cosmetics for sun spots",
+            ],
+            ["sun spots"],
+        ]),
+    ],
+    "sun spots and skin cancer": [
+        (2, [["skin cancer", "turn into skin cancer", "precancerous"], ["sun spots"]]),
+    ],
+    "what are sun spots": [
+        (1, [
+            [
+                "what are sun spots", "define sun spots", "explain sun spots",
+                "meaning of sun spots", "info about sun spots", "describe sun spots",
+                "sun spots info", "skin sun spots", "pigmentation spots", "age spots",
+            ],
+        ]),
+    ],
+    "dry skin causes": [
+        (2, [
+            [
+                "cause", "causes", "reason", "reasons", "why do i get", "why do i have", "origin",
+                "lead to", "dry skin causes", "dry skin reason", "why skin gets dry",
+            ],
+            ["dry skin"],
+        ]),
+    ],
+    "dry skin symptoms": [
+        (2, [
+            [
+                "symptom", "symptoms", "sign", "signs", "look like", "how to identify",
+                "how to know", "recognize", "identify", "dry skin symptoms", "dry skin signs",
+                "itching dry skin", "flaking skin", "cracking skin", "tight skin", "rough skin",
+            ],
+            ["dry skin"],
+        ]),
+    ],
+    "dry skin types": [
+        (2, [
+            [
+                "types", "kinds", "different types", "classify", "categories", "variety", "xerosis",
+                "asteatotic eczema", "dry skin conditions", "forms of dry skin",
+            ],
+            ["dry skin"],
+        ]),
+    ],
+    "dry skin moisturizers": [
+        (2, [
+            [
+                "moisturizer", "emollient", "cream for dry skin", "best moisturizer",
+                "hydrating cream", "dry skin lotion", "dry skin cream", "ointments for dry skin",
+                "moisturizing products",
+            ],
+            ["dry skin"],
+        ]),
+    ],
+    "dry skin diet": [
+        (2, [
+            [
+                "diet", "food", "nutrition", "foods for dry skin", "what to eat",
+                "avoid for dry skin", "hydrating foods", "nutrients for skin hydration",
+            ],
+            ["dry skin"],
+        ]),
+    ],
+    "avoiding dry skin tips": [
+        (2, [
+            [
+                "avoid getting dry skin", "avoiding dry skin", "how to avoid dry skin",
+                "prevent dry skin tips", "bathing habits to prevent dry skin",
+                "how can bathing habits", "bathing routine dry skin", "what role does clothing",
+                "clothing impact dry skin", "dressing for dry skin", "environmental adjustments",
+                "environment changes to prevent dry skin", "adjustments for dry skin",
+                "daily routines", "routines to prevent dry skin", "what daily routines can help",
+                "habits for dry skin prevention",
+            ],
+            ["dry skin"],
+        ]),
+    ],
+    "what is dry skin": [
+        (1, [
+            [
+                "what is dry skin", "define dry skin", "explain dry skin", "meaning of dry skin",
+                "info about dry skin", "describe dry skin", "dry skin info", "skin dryness",
+                "dryness of skin",
+            ],
+        ]),
+    ],
+    "oily skin causes": [
+        (2, [
+            [
+                "oily skin causes", "why is my skin oily all the time",
+                "what causes excess oil production", "can diet affect oily skin",
+                "does stress make oily skin worse", "causes of oily skin", "reasons for oily skin",
+                "why skin is oily", "factors oily skin", "excess oil production cause",
+            ],
+            ["oily skin"],
+        ]),
+    ],
+    "oily skin symptoms": [
+        (2, [
+            [
+                "oily skin symptoms", "how to tell if i have oily skin",
+                "what are the common signs of oily skin",
+                "why do i get oily skin mostly on my forehead and nose", "signs of oily skin",
+                "oily skin signs", "how to identify oily skin", "oily forehead", "oily nose",
+                "common signs of oily skin",
+            ],
+            ["oily skin"],
+        ]),
+    ],
+    "oily skin related problems": [
+        (2, [
+            [
+                "oily skin related problems", "why do i get acne with oily skin",
+                "does oily skin cause blackheads or whiteheads",
+                "can oily skin lead to enlarged pores", "why is my oily skin shiny all day",
+                "oily skin acne", "blackheads oily skin", "whiteheads oily skin",
+                "enlarged pores oily skin", "shiny oily skin", "skin problems oily skin",
+                "acne and oily skin",
+            ],
+            ["oily skin"],
+        ]),
+    ],
+    "oily skin diagnosis": [
+        (2, [
+            [
+                "oily skin diagnosis", "how can i check if my skin is oily or combination",
+                "can you help diagnose if my skin is oily",
+                "what skin type do i have if it’s oily and prone to breakouts",
+                "diagnose oily skin", "check oily skin", "skin type oily", "oily combination skin",
+                "identify oily skin", "skin type identification",
+            ],
+            ["oily skin"],
+        ]),
+    ],
+    "oily skin home remedies": [
+        (2, [
+            [
+                "oily skin home remedies", "what are some natural remedies to control oily skin",
+                "how to reduce oiliness using kitchen ingredients",
+                "can i use lemon or honey for oily skin",
+                "are there any homemade face masks for oily skin", "natural remedies oily skin",
+                "homemade remedies oily skin", "kitchen ingredients oily skin",
+                "lemon for oily skin", "honey for oily skin", "face masks for oily skin",
+                "control oiliness naturally",
+            ],
+            ["oily skin"],
+        ]),
+    ],
+    "oily skin routine": [
+        (2, [
+            [
+                "oily skin routine", "what’s the best daily routine for oily skin",
+                "which ingredients should i avoid if i have oily skin",
+                "how often should i wash my face if my skin is oily",
+                "can moisturizer help oily skin", "skincare routine oily skin",
+                "daily routine oily skin", "ingredients to avoid oily skin",
+                "washing face oily skin", "moisturizer for oily skin", "best routine oily skin",
+            ],
+            ["oily skin"],
+        ]),
+    ],
+    "oily skin lifestyle diet": [
+        (2, [
+            [
+                "oily skin lifestyle diet", "does drinking water help oily skin",
+                "what foods should i avoid to reduce oily skin",
+                "can exercise affect oil production on my skin", "lifestyle tips oily skin",
+                "diet tips oily skin", "water for oily skin", "foods to avoid oily skin",
+                "exercise and oily skin", "oil production lifestyle",
+            ],
+            ["oily skin"],
+        ]),
+    ],
+    "oily skin mistakes": [
+        (2, [
+            [
+                "oily skin mistakes", "what skincare mistakes worsen oily skin",
+                "can over-washing make oily skin worse",
+                "is using oily skin products bad for oily skin", "common mistakes oily skin",
+                "skincare mistakes oily skin", "over-washing oily skin",
+                "bad products for oily skin", "worsen oily skin",
+            ],
+            ["oily skin"],
+        ]),
+    ],
+    "oily skin treatments products": [
+        (2, [
+            [
+                "oily skin treatments products", "what kind of products work best for oily skin",
+                "are oil-free moisturizers good for oily skin", "can natural oils help oily skin",
+                "should i use toner for oily skin", "oily skin treatments",
+                "best products for oily skin", "oil-free moisturizers oily skin",
+                "natural oils for oily skin", "toner for oily skin", "products for oily skin",
+            ],
+            ["oily skin"],
+        ]),
+    ],
+    "oily skin seasonal factors": [
+        (2, [
+            [
+                "oily skin seasonal factors", "why does my skin get oilier in summer",
+                "can weather changes affect oily skin", "seasonal oily skin", "summer oily skin",
+                "weather oily skin", "environmental factors oily skin", "oily skin in summer",
+            ],
+            ["oily skin"],
+        ]),
+    ],
+    "what is oily skin": [
+        (1, [
+            [
+                "oily skin", "what is oily skin", "define oily skin", "oily skin meaning",
+                "explain oily skin", "tell me about oily skin", "info on oily skin",
+                "what's oily skin",
+            ],
+        ]),
+    ],
+    "sensitive skin symptoms": [
+        (2, [
+            [
+                "symptom", "sign", "recognize", "look like", "feel like", "red", "itchy",
+                "stinging", "burning",
+            ],
+            ["sensitive skin"],
+        ]),
+        (2, [["do i have sensitive skin"]]),
+    ],
+    "sensitive skin triggers": [
+        (2, [["sensitive skin"], ["trigger", "irritate", "weather", "food", "drink", "stress"]]),
+        (2, [["what irritates", "common triggers", "does stress"], ["sensitive skin"]]),
+    ],
+    "sensitive skin related issues": [
+        (2, [["sensitive skin"], ["rash", "redness", "eczema", "dermatitis", "flare"]]),
+        (2, [["why"], ["sensitive skin"], ["flare", "rash", "redness"]]),
+    ],
+    "sensitive skin diagnosis": [
+        (2, [["sensitive skin"], ["diagnose", "test", "allergy"]]),
+        (2, [["how can i test if my skin is sensitive"]]),
+    ],
+    "sensitive skin home remedies": [
+        (2, [
+            ["sensitive skin"],
+            ["home remedy", "natural remedy", "diy", "oatmeal", "aloe", "soothe"],
+        ]),
+        (2, [["can i use"], ["oatmeal", "aloe", "natural"], ["sensitive skin"]]),
+    ],
+    "sensitive skin routine": [
+        (2, [
+            ["sensitive skin"],
+            [
+                "routine", "skincare", "moisturizer", "sunscreen", "patch test", "daily",
+                "avoid ingredients",
+            ],
+        ]),
+        (2, [["how to patch test", "patch test new products"]]),
+    ],
+    "sensitive skin lifestyle environmental": [
+        (2, [["sensitive skin"], ["pollution", "diet", "lifestyle", "seasonal", "environment"]]),
+        (2, [["protect sensitive skin from pollution", "manage sensitive skin seasonal"]]),
+    ],
+    "what is sensitive skin": [
+        (2, [["what is", "define", "explain", "meaning of", "info on"], ["sensitive skin"]]),
+        (2, [["what causes sensitive skin", "is sensitive skin the same as allergic"]]),
+        (1, [["sensitive skin"]]),
+    ],
+    "activated charcoal mask": [
+        (2, [["charcoal mask", "activated charcoal mask"]]),
+        (2, [
+            [
+                "tea tree charcoal mask", "charcoal and tea tree oil mask",
+                "tea tree oil and charcoal mask",
+            ],
+        ]),
+        (2, [
+            [
+                "how to use charcoal mask", "how do i use charcoal mask", "applying charcoal mask",
+                "how often to use charcoal mask", "charcoal mask directions", "charcoal mask usage",
+            ],
+        ]),
+        (2, [
+            [
+                "benefits of charcoal mask", "charcoal mask benefits",
+                "is charcoal mask good for acne", "charcoal mask effects", "charcoal mask skin",
+            ],
+        ]),
+        (2, [
+            [
+                "charcoal mask for acne", "charcoal face mask for acne", "charcoal acne mask",
+                "charcoal acne remedy", "charcoal pack for acne", "charcoal mask for pimples",
+            ],
+        ]),
+        (2, [
+            [
+                "diy charcoal mask", "homemade charcoal mask", "charcoal mask home remedy",
+                "natural charcoal mask",
+            ],
+        ]),
+        (2, [
+            [
+                "charcoal mask for blackheads", "purifying charcoal mask",
+                "deep cleansing charcoal mask",
+            ],
+        ]),
+        (2, [["charcoal mask ingredients"]]),
+        (1, [["charcoal mask"]]),
+    ],
+    "rice flour brightening paste": [
+        (2, [["rice flour paste", "rice flour brightening paste"]]),
+        (2, [
+            [
+                "rice flour lemon honey paste", "lemon and honey rice flour paste",
+                "rice flour and honey paste", "rice flour and lemon face pack",
+            ],
+        ]),
+        (2, [["how to make rice flour paste", "how to apply rice flour mask"]]),
+        (2, [
+            [
+                "diy rice flour mask", "natural rice flour face mask", "homemade rice flour mask",
+                "natural brightening paste", "brightening face pack at home",
+            ],
+        ]),
+        (2, [
+            [
+                "benefits of rice flour paste", "rice flour mask for glowing skin",
+                "rice flour skin lightening", "glow rice flour mask",
+            ],
+        ]),
+        (2, [["rice flour mask for acne", "rice flour mask for scars"]]),
+        (2, [
+            [
+                "rice flour face pack", "rice flour pack for skin", "rice flour paste for skin",
+                "skin brightening rice flour remedy", "rice flour paste remedy",
+                "rice paste for skin care",
+            ],
+        ]),
+        (2, [["exfoliating rice flour paste", "rice flour face scrub"]]),
+        (1, [["rice flour"]]),
+    ],
+    "alum rose water toner": [
+        (2, [["alum toner", "rose water toner", "alum and rose water toner"]]),
+        (2, [
+            [
+                "diy alum toner", "how to make alum toner", "homemade toner for acne",
+                "toner with rose water and alum", "diy toner with alum and rose water",
+            ],
+        ]),
+        (2, [["how to use alum toner"]]),
+        (2, [["benefits of alum toner", "rose water toner benefits"]]),
+        (2, [
+            [
+                "alum for acne", "rose water for acne", "natural toner for acne", "acne toner diy",
+                "acne rose water toner", "alum toner for oily skin", "acne skin toner rose water",
+            ],
+        ]),
+        (2, [
+            [
+                "rose water for skin", "alum face toner", "rose water skin remedy",
+                "alum toner skin remedy",
+            ],
+        ]),
+        (2, [["what is alum toner", "alum toner recipe", "alum toner effects"]]),
+        (2, [["soothing alum toner", "alum toner for sensitive skin"]]),
+        (1, [["alum rose water", "alum toner", "rose water toner"]]),
+    ],
+    "baking soda with water paste": [
+        (2, [
+            [
+                "baking soda with water paste", "baking soda paste", "baking soda mask",
+                "baking soda face pack",
+            ],
+        ]),
+        (2, [
+            [
+                "how to make baking soda paste", "how to use baking soda for blackheads",
+                "diy baking soda mask", "homemade baking soda paste",
+            ],
+        ]),
+        (2, [
+            [
+                "baking soda for blackheads", "blackhead remedy baking soda",
+                "baking soda scrub for blackheads", "baking soda treatment for blackheads",
+                "baking soda pore cleanser",
+            ],
+        ]),
+        (2, [["natural remedy baking soda", "baking soda exfoliant", "baking soda for oily skin"]]),
+        (1, [["baking soda"], ["paste"]]),
+    ],
+    "baking soda paste benefits": [
+        (2, [["baking soda paste benefits", "benefits of baking soda paste"]]),
+        (2, [
+            [
+                "how does baking soda help blackheads", "baking soda for blackheads",
+                "why use baking soda for skin", "baking soda clears pores",
+            ],
+        ]),
+        (2, [["baking soda mask uses", "advantages of baking soda face mask"]]),
+        (2, [
+            [
+                "baking soda anti-inflammatory benefits", "baking soda acne benefits",
+                "baking soda skin brightening",
+            ],
+        ]),
+        (1, [["baking soda"], ["benefits"]]),
+    ],
+    "baking soda paste side effects": [
+        (2, [["baking soda paste side effects", "side effects of baking soda paste"]]),
+        (2, [
+            [
+                "is baking soda paste safe for skin", "can baking soda damage skin",
+                "harms of using baking soda", "is baking soda safe",
+            ],
+        ]),
+        (2, [
+            [
+                "baking soda skin irritation", "baking soda skin burning",
+                "baking soda reaction on skin", "dryness from baking soda",
+            ],
+        ]),
+        (2, [["baking soda pH imbalance", "overuse of baking soda risks"]]),
+        (1, [["baking soda"], ["side effects"]]),
+    ],
+    "tomato rub / pulp mask": [
+        (2, [
+            ["tomato rub", "tomato pulp mask", "tomato mask", "tomato facial", "tomato face pack"],
+        ]),
+        (2, [["how to apply tomato mask", "tomato skincare remedy"]]),
+        (2, [
+            [
+                "tomato for blackheads", "blackhead removal with tomato",
+                "tomato juice for blackheads",
+            ],
+        ]),
+        (2, [
+            [
+                "natural tomato mask", "diy tomato face pack", "tomato and lemon mask",
+                "tomato and honey mask",
+            ],
+        ]),
+        (2, [["tomato mask for oily skin"]]),
+        (1, [["tomato"], ["mask", "rub", "pulp"]]),
+    ],
+    "tomato rub benefits": [
+        (2, [
+            [
+                "tomato rub benefits", "tomato pulp mask benefits",
+                "benefits of tomato mask for blackheads",
+            ],
+        ]),
+        (2, [
+            [
+                "how does tomato help blackheads", "tomato clears skin", "why use tomato on face",
+                "tomato for oily skin",
+            ],
+        ]),
+        (2, [
+            [
+                "tomato vitamin c benefits", "tomato mask brightening effects",
+                "tomato anti-inflammatory", "tomato skin soothing", "tomato antioxidant benefits",
+            ],
+        ]),
+        (1, [["tomato"], ["benefits"]]),
+    ],
+    "tomato rub side effects": [
+        (2, [
+            [
+                "tomato rub side effects", "tomato pulp mask side effects",
+                "side effects of tomato mask",
+            ],
+        ]),
+        (2, [
+            [
+                "is tomato good for sensitive skin", "can tomato cause skin irritation",
+                "negative effects of tomato on face", "is tomato safe for facial skin",
+            ],
+        ]),
+        (2, [
+            [
+                "tomato allergy symptoms", "tomato redness reaction", "tomato photosensitivity",
+                "tomato mask stinging",
+            ],
+        ]),
+        (1, [["tomato"], ["side effects"]]),
+    ],
+    "facial steaming": [
+        (2, [["facial steaming", "steam face", "steam mask"]]),
+        (2, [["how to do facial steaming", "steam with herbs"]]),
+        (2, [
+            [
+                "steaming for blackheads", "face steam for blackheads", "steam for clear skin",
+                "blackhead steam treatment", "open pores steaming",
+                "natural blackhead removal steam",
+            ],
+        ]),
+        (2, [["steam for oily skin", "steam for deep cleansing"]]),
+        (1, [["facial steaming", "steam face"]]),
+    ],
+    "facial steaming benefits": [
+        (2, [["facial steaming benefits", "benefits of steam for blackheads"]]),
+        (2, [
+            [
+                "how does facial steaming help blackheads", "steam face for blackheads",
+                "why steam face for acne", "open pores with steam",
+            ],
+        ]),
+        (2, [
+            [
+                "facial steaming for oily skin", "steam skin detox", "steam to soften skin",
+                "steam for better absorption", "steam for improved circulation",
+            ],
+        ]),
+        (1, [["facial steaming"], ["benefits"]]),
+    ],
+    "facial steaming side effects": [
+        (2, [["facial steaming side effects", "side effects of steam on face"]]),
+        (2, [
+            [
+                "can steam harm skin", "is facial steaming safe", "steam skin damage",
+                "facial steaming burns",
+            ],
+        ]),
+        (2, [
+            [
+                "too much steam on face", "steaming face every day", "steam dryness",
+                "steam irritation", "steam aggravating rosacea",
+            ],
+        ]),
+        (1, [["facial steaming"], ["side effects"]]),
+    ],
+    "honey, crushed grains & multani mitti mask": [
+        (2, [
+            [
+                "honey crushed grains multani mitti mask", "honey mask", "multani mitti mask",
+                "crushed grains mask",
+            ],
+        ]),
+        (2, [
+            [
+                "how to make multani mitti mask", "homemade multani mitti face pack",
+                "blackhead mask recipe",
+            ],
+        ]),
+        (2, [
+            ["multani mitti for blackheads", "natural blackhead mask", "honey face pack for acne"],
+        ]),
+        (2, [["honey and multani mitti mask", "grains and multani mitti for skin"]]),
+        (2, [["multani mitti scrub mask", "multani mitti exfoliation"]]),
+        (1, [["honey"], ["multani mitti"], ["mask"]]),
+    ],
+    "honey multani mitti mask benefits": [
+        (2, [
+            [
+                "honey multani mitti mask benefits", "benefits of multani mitti for blackheads",
+                "crushed grains multani mitti mask benefits",
+            ],
+        ]),
+        (2, [["how does honey and multani mitti help", "why use honey in face pack"]]),
+        (2, [["multani mitti for oily skin", "multani mitti oil absorption"]]),
+        (2, [["honey antibacterial effects", "honey skin moisturizing"]]),
+        (2, [
+            [
+                "advantages of multani mitti mask", "benefits of grain-based face masks",
+                "exfoliating benefits of grains",
+            ],
+        ]),
+        (1, [["honey multani mitti"], ["benefits"]]),
+    ],
+    "honey multani mitti mask side effects": [
+        (2, [["honey multani mitti mask side effects", "multani mitti mask side effects"]]),
+        (2, [
+            [
+                "can multani mitti cause dryness", "is this mask safe for all skin types",
+                "side effects of honey face mask",
+            ],
+        ]),
+        (2, [
+            [
+                "multani mitti irritation", "honey mask allergy",
+                "is multani mitti safe for sensitive skin", "mask causing redness",
+                "dry skin after multani mitti", "allergic reaction to honey mask",
+            ],
+        ]),
+        (1, [["honey multani mitti"], ["side effects"]]),
+    ],
+    "chilled cucumber slices": [
+        (2, [
+            [
+                "chilled cucumber slices", "cucumber slices", "cold cucumber for eyes",
+                "cucumber on eyes for dark circles",
+            ],
+        ]),
+        (2, [
+            [
+                "how to use cucumber slices for dark circles", "put cucumber on eyes",
+                "diy cucumber eye treatment",
+            ],
+        ]),
+        (2, [
+            [
+                "cucumber for dark circles", "cucumber eye remedy",
+                "cucumber remedy for under eye bags",
+            ],
+        ]),
+        (2, [
+            [
+                "natural remedy with cucumber", "cooling cucumber slices",
+                "hydrating cucumber under eyes", "anti-inflammatory cucumber",
+                "refreshing eye treatment",
+            ],
+        ]),
+        (1, [["cucumber slices", "cucumber for eyes"]]),
+    ],
+    "benefits chilled cucumber slices": [
+        (2, [["benefits of chilled cucumber slices", "chilled cucumber slices benefits"]]),
+        (2, [["why use cucumber slices for eyes", "what does cucumber do for dark circles"]]),
+        (2, [
+            [
+                "cooling effect of cucumber", "cucumber properties for eyes",
+                "cucumber healing dark circles",
+            ],
+        ]),
+        (2, [
+            [
+                "reduces puffiness cucumber", "cucumber antioxidants for skin",
+                "moisturizing cucumber benefits", "soothing effects of cucumber",
+            ],
+        ]),
+        (1, [["cucumber benefits"]]),
+    ],
+    "side effects chilled cucumber slices": [
+        (2, [["side effects of chilled cucumber slices", "chilled cucumber slices side effects"]]),
+        (2, [
+            [
+                "can cucumber irritate eyes", "is cucumber safe for eyes",
+                "cucumber allergy on skin", "negative effects of cucumber on eyes",
+            ],
+        ]),
+        (2, [
+            [
+                "eye redness from cucumber", "cucumber sensitivity",
+                "possible irritation from cucumber slices",
+            ],
+        ]),
+        (1, [["cucumber side effects"]]),
+    ],
+    "cold tea bags (green or black)": [
+        (2, [["cold tea bags", "cold green tea bags", "cold black tea bags"]]),
+        (2, [
+            [
+                "tea bags for dark circles", "green tea bags for eyes",
+                "black tea bags for dark circles", "tea compress for eyes",
+                "tea bag under eye remedy", "cold tea under eye treatment",
+            ],
+        ]),
+        (2, [["diy tea bag under eye remedy"]]),
+        (2, [["antioxidant tea bags", "tea bags reduce puffiness"]]),
+        (1, [["tea bags"], ["cold", "eyes", "dark circles"]]),
+    ],
+    "benefits of cold tea bags": [
+        (2, [["benefits of cold tea bags", "cold tea bags benefits"]]),
+        (2, [
+            [
+                "tea bags help dark circles", "green tea bags under eyes benefits",
+                "black tea bag eye remedy benefits",
+            ],
+        ]),
+        (2, [
+            [
+                "tea bags reduce puffiness", "tea bags tighten skin", "caffeine benefits for eyes",
+                "tea antioxidants for skin",
+            ],
+        ]),
+        (1, [["tea bags"], ["benefits"]]),
+    ],
+    "side effects cold tea bags": [
+        (2, [["side effects of cold tea bags", "cold tea bags side effects"]]),
+        (2, [["tea bag eye irritation", "can tea bags harm eyes", "is tea bag safe for skin"]]),
+        (2, [
+            [
+                "tea allergy reaction", "side effects of tea bag compress",
+                "eye redness from tea bags", "possible tea sensitivity",
+            ],
+        ]),
+        (1, [["tea bags"], ["side effects"]]),
+    ],
+    "aloe vera gel": [
+        (2, [["aloe vera gel", "aloe vera"]]),
+        (2, [
+            [
+                "how to apply aloe vera gel", "using aloe vera on undereyes",
+                "aloe for under eye care",
+            ],
+        ]),
+        (2, [
+            ["aloe vera for dark circles", "aloe gel for dark circles", "diy aloe vera eye remedy"],
+        ]),
+        (2, [["aloe moisturizing gel", "soothing aloe vera", "healing aloe for skin"]]),
+        (1, [["aloe vera"], ["gel"]]),
+    ],
+    "benefits of aloe vera gel": [
+        (2, [["benefits of aloe vera gel", "aloe vera gel benefits"]]),
+        (2, [
+            [
+                "why use aloe vera under eyes", "healing properties of aloe vera",
+                "aloe gel skin benefits",
+            ],
+        ]),
+        (2, [
+            [
+                "dark circles aloe remedy benefits", "anti-inflammatory aloe vera",
+                "aloe antioxidant benefits", "aloe skin repair",
+            ],
+        ]),
+        (1, [["aloe vera"], ["benefits"]]),
+    ],
+    "side effects aloe vera gel": [
+        (2, [["side effects of aloe vera gel", "aloe vera gel side effects"]]),
+        (2, [["aloe skin irritation", "is aloe safe for eyes", "can aloe vera cause redness"]]),
+        (2, [
+            [
+                "aloe vera allergy symptoms", "negative aloe vera effects",
+                "possible aloe sensitivity", "eye irritation from aloe",
+            ],
+        ]),
+        (1, [["aloe vera"], ["side effects"]]),
+    ],
+    "almond oil and vitamin e": [
+        (2, [["almond oil and vitamin e", "almond oil", "vitamin e oil"]]),
+        (2, [
+            [
+                "almond oil for dark circles", "vitamin e for dark circles",
+                "almond oil and vitamin e for eyes",
+            ],
+        ]),
+        (2, [
+            [
+                "how to use almond oil and vitamin e", "dark circles remedy almond oil",
+                "vitamin e and almond oil eye treatment",
+            ],
+        ]),
+        (2, [["nourishing oils for skin", "moisturizing almond oil", "antioxidant vitamin e"]]),
+        (1, [["almond oil"], ["vitamin e"]]),
+    ],
+    "benefits of almond oil and vitamin e": [
+        (2, [["benefits of almond oil and vitamin e", "almond oil and vitamin e benefits"]]),
+        (2, [
+            ["almond oil for under eyes", "how does almond oil help", "vitamin e for skin health"],
+        ]),
+        (2, [
+            [
+                "nourishing benefits of vitamin e", "under eye benefits almond oil",
+                "skin repair oils", "vitamin e antioxidant effects",
+            ],
+        ]),
+        (1, [["almond oil"], ["vitamin e"], ["benefits"]]),
+    ],
+    "side effects almond oil and vitamin e": [
+        (2, [
+            ["side effects of almond oil and vitamin e", "almond oil and vitamin e side effects"],
+        ]),
+        (2, [
+            [
+                "can almond oil cause irritation", "vitamin e oil allergy",
+                "is almond oil safe for sensitive skin",
+            ],
+        ]),
+        (2, [
+            [
+                "almond oil eye reaction", "side effects of vitamin e near eyes",
+                "possible almond oil sensitivity", "eye redness from oils",
+            ],
+        ]),
+        (1, [["almond oil"], ["vitamin e"], ["side effects"]]),
+    ],
+    "chilled spoons or cold compress": [
+        (2, [
+            [
+                "chilled spoons", "cold compress", "ice compress for eye bags",
+                "cold compress for puffy eyes", "cold spoons for puffy eyes",
+            ],
+        ]),
+        (2, [
+            [
+                "spoons for eye bags", "how to use cold compress for eye bags",
+                "how to use chilled spoons under eyes", "cold therapy for eye puffiness",
+            ],
+        ]),
+        (2, [
+            [
+                "under eye swelling cold remedy", "cooling treatment for eye bags",
+                "eye bags compress", "metal spoons for puffy eyes", "diy cold spoon remedy",
+                "freeze spoons for eyes", "chill compress eyes", "cold pack for under eye bags",
+            ],
+        ]),
+        (2, [["reduces eye puffiness", "soothes tired eyes", "anti-inflammatory cold treatment"]]),
+        (1, [["chilled spoons", "cold compress"]]),
+    ],
+    "chilled spoons benefits": [
+        (2, [
+            [
+                "benefits of chilled spoons for eyebags",
+                "how does cold compress help with eyebags",
+                "advantages of using chilled spoons on eyebags",
+                "why use cold compress for eyebags", "cold compress eyebags benefits",
+            ],
+        ]),
+        (2, [
+            [
+                "chilled spoons for puffiness", "reduce swelling with cold spoon",
+                "cold therapy eye bag remedy", "improve eye bags with cold compress",
+            ],
+        ]),
+        (2, [
+            [
+                "effectiveness of cold compress for eyes", "relieves under eye fluid retention",
+                "refreshing eye care", "reduces redness and puffiness",
+            ],
+        ]),
+        (1, [["chilled spoons"], ["benefits"]]),
+    ],
+    "chilled spoons side effects": [
+        (2, [
+            [
+                "side effects of chilled spoons for eyebags",
+                "any risks using cold compress for eyebags",
+                "negative effects of chilled spoons on eyebags",
+                "problems with cold compress for eyebags", "cold compress eyebags side effects",
+            ],
+        ]),
+        (2, [
+            [
+                "eye irritation from cold compress", "cold spoon damage under eyes",
+                "discomfort from chilled spoons",
+            ],
+        ]),
+        (2, [
+            [
+                "overuse of cold compress eyes", "safety of cold compress under eyes",
+                "possible cold-induced skin sensitivity", "frostbite risk with extreme cold",
+                "temporary redness from cold therapy",
+            ],
+        ]),
+        (1, [["chilled spoons"], ["side effects"]]),
+    ],
+    "cucumber slices": [
+        (2, [
+            ["cucumber slices", "how to use cucumber slices for eye bags", "cucumber for eye bags"],
+        ]),
+        (2, [
+            [
+                "puffy eye remedy cucumber", "cold cucumber slices for eyes",
+                "cucumber under eyes for puffiness",
+            ],
+        ]),
+        (2, [
+            [
+                "natural remedy cucumber for eye bags", "diy cucumber eye remedy",
+                "cucumber treatment for eye swelling",
+            ],
+        ]),
+        (2, [
+            [
+                "cucumber discs for eyes", "hydrating cucumber eye pads",
+                "anti-inflammatory cucumber slices", "cooling effect cucumber eyes",
+            ],
+        ]),
+        (1, [["cucumber slices"], ["eye bags", "puffy eyes"]]),
+    ],
+    "cucumber slices benefits": [
+        (2, [
+            [
+                "benefits of cucumber slices for eyebags",
+                "how do cucumber slices help with eyebags", "why use cucumber slices for eyebags",
+                "advantages of cucumber slices on eyebags", "cucumber slices eyebags benefits",
+            ],
+        ]),
+        (2, [
+            [
+                "cucumber soothes puffy eyes", "natural cooling from cucumber",
+                "reduce swelling with cucumber", "cucumber calms under eye area",
+            ],
+        ]),
+        (2, [
+            [
+                "skin benefits of cucumber under eyes", "rejuvenates tired eyes",
+                "antioxidant properties cucumber", "refreshes under eye skin",
+            ],
+        ]),
+        (1, [["cucumber slices"], ["benefits"], ["eye bags", "eyes"]]),
+    ],
+    "cucumber slices side effects": [
+        (2, [
+            [
+                "side effects of cucumber slices for eyebags",
+                "any risks using cucumber slices for eyebags",
+                "negative effects of cucumber slices on eyebags",
+                "problems with cucumber slices for eyebags", "cucumber slices eyebags side effects",
+            ],
+        ]),
+        (2, [
+            [
+                "cucumber allergy under eyes", "skin reaction from cucumber",
+                "cucumber causes irritation",
+            ],
+        ]),
+        (2, [
+            [
+                "eye sensitivity to cucumber", "cucumber slices eye area issues",
+                "possible redness from cucumber", "skin dryness from cucumber use",
+                "eye irritation due to prolonged contact",
+            ],
+        ]),
+        (1, [["cucumber slices"], ["side effects"], ["eye bags", "eyes"]]),
+    ],
+    "turmeric and lemon juice paste": [
+        (2, [
+            [
+                "turmeric and lemon juice paste", "turmeric lemon paste",
+                "lemon turmeric face paste", "turmeric lemon brightening paste",
+                "homemade turmeric lemon mask",
+            ],
+        ]),
+        (2, [["how to make turmeric lemon juice paste", "turmeric lemon diy mask"]]),
+        (2, [["turmeric and lemon for freckles", "freckle remedy turmeric lemon"]]),
+        (2, [
+            [
+                "skin lightening with turmeric and lemon", "turmeric lemon mask for pigmentation",
+                "turmeric lemon skin remedy", "turmeric lemon spot treatment",
+            ],
+        ]),
+        (1, [["turmeric"], ["lemon"], ["paste"]]),
+    ],
+    "turmeric and lemon juice paste benefits": [
+        (2, [["benefits of turmeric and lemon juice paste", "turmeric lemon paste benefits"]]),
+        (2, [
+            [
+                "why use turmeric and lemon juice on skin", "advantages of turmeric lemon paste",
+                "turmeric and lemon juice effects",
+            ],
+        ]),
+        (2, [
+            [
+                "what are the benefits of turmeric and lemon paste",
+                "is turmeric lemon paste good for skin",
+            ],
+        ]),
+        (2, [
+            [
+                "brightening skin with turmeric and lemon", "freckle fading turmeric lemon",
+                "natural glow turmeric lemon paste", "anti-pigmentation turmeric lemon benefits",
+                "skin tone evening turmeric lemon",
+            ],
+        ]),
+        (1, [["turmeric lemon"], ["benefits"]]),
+    ],
+    "turmeric and lemon juice paste side effects": [
+        (2, [
+            ["side effects of turmeric and lemon juice paste", "turmeric lemon paste side effects"],
+        ]),
+        (2, [
+            [
+                "any risks with turmeric lemon juice on skin", "is turmeric lemon paste safe",
+                "can turmeric lemon paste harm skin",
+            ],
+        ]),
+        (2, [
+            [
+                "turmeric lemon juice allergic reactions",
+                "what are the side effects of turmeric and lemon paste",
+            ],
+        ]),
+        (2, [
+            [
+                "lemon irritation with turmeric", "turmeric lemon burning sensation",
+                "turmeric lemon skin sensitivity", "photosensitivity turmeric lemon",
+                "skin redness from turmeric lemon paste",
+            ],
+        ]),
+        (1, [["turmeric lemon"], ["side effects"]]),
+    ],
+    "honey and water": [
+        (2, [["honey and water", "honey water"]]),
+        (2, [
+            [
+                "how to use honey and water for freckles", "honey and water for freckles",
+                "freckle remedy honey water",
+            ],
+        ]),
+        (2, [
+            [
+                "honey water for skin", "diy honey water remedy",
+                "natural honey water for pigmentation", "honey diluted for face",
+            ],
+        ]),
+        (2, [
+            [
+                "skin remedy honey with water", "apply honey water mix",
+                "honey water brightening solution", "honey water moisturizing mix",
+            ],
+        ]),
+        (1, [["honey"], ["water"]]),
+    ],
+    "honey and water benefits": [
+        (2, [
+            [
+                "benefits of honey and water", "why use honey and water for skin",
+                "advantages of honey water mix",
+            ],
+        ]),
+        (2, [
+            [
+                "honey and water effects on skin",
+                "what are the benefits of honey and water for skin", "is honey water good for skin",
+            ],
+        ]),
+        (2, [
+            [
+                "skin softening honey water", "natural hydration honey water",
+                "clear skin with honey water", "moisturizing with honey water",
+            ],
+        ]),
+        (2, [["antibacterial honey water benefits", "glowing skin with honey water"]]),
+        (1, [["honey water"], ["benefits"]]),
+    ],
+    "honey and water side effects": [
+        (2, [["side effects of honey and water", "is honey and water safe for skin"]]),
+        (2, [["honey water allergic reactions", "any risks with honey and water on skin"]]),
+        (2, [["what are the side effects of honey and water paste", "can honey water harm skin"]]),
+        (2, [
+            [
+                "stickiness issues honey water", "honey residue on skin problems",
+                "honey water skin irritation", "freckle treatment risks honey water",
+            ],
+        ]),
+        (2, [["pore clogging risk honey water", "skin breakouts from honey water"]]),
+        (1, [["honey water"], ["side effects"]]),
+    ],
+    "papaya juice": [
+        (2, [["papaya juice", "papaya for skin brightening"]]),
+        (2, [
+            [
+                "how to apply papaya juice", "papaya juice face application",
+                "raw papaya juice on skin",
+            ],
+        ]),
+        (2, [
+            [
+                "papaya juice for freckles", "freckle remedy papaya",
+                "how to use papaya on freckles", "homemade papaya freckle treatment",
+            ],
+        ]),
+        (2, [["natural papaya skin remedy", "papaya skin lightening remedy"]]),
+        (2, [["papaya enzyme exfoliation", "papaya juice natural bleaching"]]),
+        (1, [["papaya juice"]]),
+    ],
+    "papaya juice benefits": [
+        (2, [
+            [
+                "benefits of papaya juice", "why use papaya juice on skin",
+                "advantages of papaya juice for skin",
+            ],
+        ]),
+        (2, [
+            [
+                "papaya juice effects", "what are the benefits of papaya juice for skin",
+                "is papaya juice good for skin",
+            ],
+        ]),
+        (2, [
+            [
+                "papaya enzymes skin benefits", "freckle lightening with papaya",
+                "glowing skin with papaya",
+            ],
+        ]),
+        (2, [
+            [
+                "exfoliating properties papaya juice", "skin renewal papaya juice",
+                "papaya juice anti-aging benefits",
+            ],
+        ]),
+        (1, [["papaya juice"], ["benefits"]]),
+    ],
+    "papaya juice side effects": [
+        (2, [["side effects of papaya juice", "is papaya juice safe for skin"]]),
+        (2, [["papaya juice allergic reactions", "any risks with papaya juice on skin"]]),
+        (2, [["what are the side effects of papaya juice on skin", "can papaya juice harm skin"]]),
+        (2, [
+            [
+                "papaya juice irritation", "rash from papaya juice",
+                "papaya juice skin sensitivity", "freckle remedy papaya risks",
+            ],
+        ]),
+        (2, [["photosensitivity papaya juice", "skin redness from papaya"]]),
+        (1, [["papaya juice"], ["side effects"]]),
+    ],
+    "sandalwood and rice flour remedy": [
+        (2, [
+            [
+                "sandalwood and rice flour remedy", "sandalwood rice flour remedy",
+                "sandalwood and rice flour face mask",
+            ],
+        ]),
+        (2, [["how to make sandalwood rice flour remedy", "diy sandalwood rice flour paste"]]),
+        (2, [
+            [
+                "sandalwood and rice flour for pigmentation",
+                "pigmentation remedy sandalwood rice flour", "rice flour for pigmentation",
+            ],
+        ]),
+        (2, [["sandalwood for skin lightening", "natural pigmentation remedy with rice flour"]]),
+        (2, [
+            [
+                "sandalwood pigmentation treatment", "sandalwood rice flour spot remover",
+                "sandalwood rice flour brightening mask",
+            ],
+        ]),
+        (1, [["sandalwood"], ["rice flour"]]),
+    ],
+    "sandalwood and rice flour remedy benefits": [
+        (2, [
+            [
+                "sandalwood and rice flour remedy benefits",
+                "benefits of sandalwood and rice flour remedy",
+            ],
+        ]),
+        (2, [
+            [
+                "what are the benefits of sandalwood and rice flour remedy",
+                "why use sandalwood and rice flour for skin",
+                "advantages of sandalwood and rice flour",
+            ],
+        ]),
+        (2, [
+            [
+                "brightening skin with sandalwood and rice flour",
+                "natural glow from sandalwood and rice flour",
+            ],
+        ]),
+        (2, [
+            [
+                "sandalwood rice flour face pack benefits", "even skin tone remedy rice flour",
+                "remedy for dark spots sandalwood rice flour",
+            ],
+        ]),
+        (2, [
+            [
+                "anti-pigmentation sandalwood benefits",
+                "skin tone evening with rice flour and sandalwood",
+            ],
+        ]),
+        (1, [["sandalwood rice flour"], ["benefits"]]),
+    ],
+    "sandalwood and rice flour remedy side effects": [
+        (2, [
+            [
+                "sandalwood and rice flour remedy side effects",
+                "side effects of sandalwood and rice flour remedy",
+            ],
+        ]),
+        (2, [
+            [
+                "any side effects of sandalwood and rice flour remedy",
+                "is sandalwood and rice flour remedy safe",
+            ],
+        ]),
+        (2, [
+            [
+                "can sandalwood and rice flour remedy cause allergies",
+                "issues with sandalwood on skin", "rice flour skin irritation",
+            ],
+        ]),
+        (2, [
+            [
+                "redness from sandalwood mask", "pigmentation remedy safety",
+                "diy mask sandalwood rice flour risks", "skin sensitivity sandalwood rice flour",
+            ],
+        ]),
+        (1, [["sandalwood rice flour"], ["side effects"]]),
+    ],
+    "nutmeg and milk remedy": [
+        (2, [["nutmeg and milk remedy", "jaifil and milk remedy", "nutmeg milk remedy"]]),
+        (2, [
+            [
+                "how to make nutmeg milk remedy", "nutmeg milk face pack",
+                "natural nutmeg milk remedy",
+            ],
+        ]),
+        (2, [["nutmeg and milk for pigmentation", "pigmentation remedy nutmeg milk"]]),
+        (2, [["milk for skin pigmentation", "jaifil for skin", "nutmeg pigmentation paste"]]),
+        (2, [["nutmeg milk brightening mask", "nutmeg milk spot remover"]]),
+        (1, [["nutmeg"], ["milk"]]),
+    ],
+    "nutmeg and milk remedy benefits": [
+        (2, [
+            [
+                "nutmeg and milk remedy benefits", "benefits of nutmeg and milk remedy",
+                "what are the benefits of nutmeg and milk remedy",
+                "jaifil and milk remedy benefits",
+            ],
+        ]),
+        (2, [
+            [
+                "why use nutmeg and milk for skin", "nutmeg skin glow benefits",
+                "brightening with nutmeg milk",
+            ],
+        ]),
+        (2, [["natural nutmeg remedy for pigmentation", "reduce spots with nutmeg and milk"]]),
+        (2, [
+            [
+                "skin lightening jaifil milk benefits", "pigmentation fading nutmeg milk",
+                "milk and nutmeg skin tone improvement",
+            ],
+        ]),
+        (1, [["nutmeg milk"], ["benefits"]]),
+    ],
+    "nutmeg and milk remedy side effects": [
+        (2, [["nutmeg and milk remedy side effects", "side effects of nutmeg and milk remedy"]]),
+        (2, [
+            [
+                "any side effects of nutmeg and milk remedy", "is nutmeg and milk remedy safe",
+                "can nutmeg and milk remedy cause allergies", "jaifil and milk remedy side effects",
+            ],
+        ]),
+        (2, [
+            [
+                "nutmeg milk skin irritation", "freckle remedy nutmeg risk",
+                "acne from nutmeg milk remedy",
+            ],
+        ]),
+        (2, [
+            [
+                "nutmeg face mask reaction", "skin redness from nutmeg milk",
+                "milk nutmeg allergic response",
+            ],
+        ]),
+        (1, [["nutmeg milk"], ["side effects"]]),
+    ],
+    "turmeric and milk paste": [
+        (2, [["turmeric and milk paste", "turmeric milk paste"]]),
+        (2, [["how to make turmeric milk paste", "diy turmeric milk mask"]]),
+        (2, [["turmeric and milk for pigmentation", "pigmentation remedy turmeric milk"]]),
+        (2, [
+            [
+                "milk and turmeric for skin", "turmeric paste for dark spots",
+                "turmeric milk for blemishes",
+            ],
+        ]),
+        (2, [["turmeric milk remedy for hyperpigmentation", "turmeric milk skin lightening"]]),
+        (2, [["turmeric milk anti-blemish paste", "turmeric milk glow treatment"]]),
+        (1, [["turmeric"], ["milk"], ["paste"]]),
+    ],
+    "turmeric and milk paste benefits": [
+        (2, [["turmeric and milk paste benefits", "benefits of turmeric and milk paste"]]),
+        (2, [
+            [
+                "what are the benefits of turmeric and milk paste",
+                "why use turmeric and milk for skin",
+            ],
+        ]),
+        (2, [
+            [
+                "turmeric milk glow benefits", "turmeric milk to reduce pigmentation",
+                "natural lightening with turmeric and milk",
+            ],
+        ]),
+        (2, [["milk turmeric paste for glowing skin", "turmeric and milk acne spot remedy"]]),
+        (2, [
+            [
+                "turmeric milk anti-inflammatory properties",
+                "pigmentation reduction turmeric milk", "milk turmeric brightening effects",
+            ],
+        ]),
+        (1, [["turmeric milk"], ["benefits"]]),
+    ],
+    "turmeric and milk paste side effects": [
+        (2, [["turmeric and milk paste side effects", "side effects of turmeric and milk paste"]]),
+        (2, [
+            [
+                "any side effects of turmeric and milk paste", "is turmeric and milk paste safe",
+                "can turmeric and milk paste cause allergies",
+            ],
+        ]),
+        (2, [
+            [
+                "turmeric skin staining", "milk and turmeric skin reaction",
+                "turmeric paste burns or tingling",
+            ],
+        ]),
+        (2, [
+            [
+                "turmeric face mask sensitivity", "turmeric milk rash or redness",
+                "skin irritation turmeric milk", "milk turmeric allergic reactions",
+            ],
+        ]),
+        (1, [["turmeric milk"], ["side effects"]]),
+    ],
+    "cooling cucumber and yogurt body mask": [
+        (2, [["cooling cucumber yogurt mask", "cucumber and yogurt mask", "cucumber yogurt mask"]]),
+        (2, [
+            [
+                "cooling cucumber mask", "yogurt cucumber mask", "how to make cucumber yogurt mask",
+                "diy cucumber yogurt face mask",
+            ],
+        ]),
+        (2, [
+            [
+                "cucumber and yogurt for sunspots", "sunspot mask cucumber yogurt",
+                "natural sunspot remedy cucumber yogurt",
+            ],
+        ]),
+        (2, [["skin cooling remedy", "hydrating cucumber yogurt treatment"]]),
+        (1, [["cucumber"], ["yogurt"], ["mask"]]),
+    ],
+    "cooling cucumber and yogurt body mask benefits": [
+        (2, [
+            [
+                "cooling cucumber and yogurt body mask benefits",
+                "benefits of cucumber and yogurt mask",
+            ],
+        ]),
+        (2, [["how cucumber and yogurt mask helps skin", "cooling effects of cucumber yogurt"]]),
+        (2, [
+            [
+                "cucumber yogurt benefits for sunspots", "hydration from cucumber yogurt mask",
+                "natural skin cooling mask",
+            ],
+        ]),
+        (2, [
+            [
+                "cucumber yogurt for sun-damaged skin",
+                "anti-inflammatory cucumber yogurt benefits", "brightening cucumber yogurt effects",
+            ],
+        ]),
+        (1, [["cucumber yogurt mask"], ["benefits"]]),
+    ],
+    "cooling cucumber and yogurt body mask side effects": [
+        (2, [
+            [
+                "cooling cucumber and yogurt body mask side effects",
+                "any side effects of cucumber and yogurt mask",
+            ],
+        ]),
+        (2, [
+            [
+                "can cucumber and yogurt mask cause irritation",
+                "cucumber and yogurt mask harmful effects",
+            ],
+        ]),
+        (2, [["yogurt skin allergy", "cucumber reaction on sensitive skin"]]),
+        (2, [["risks of using cucumber yogurt mask", "possible redness from cucumber yogurt"]]),
+        (1, [["cucumber yogurt mask"], ["side effects"]]),
+    ],
+    "potato slices": [
+        (2, [["potato slices", "potato slice remedy", "slice of potato"]]),
+        (2, [["potato for skin", "potato skin remedy", "raw potato slices for skin"]]),
+        (2, [
+            [
+                "how to use potato slices for sunspots", "potato for sunspots",
+                "sunspot remedy potato", "potato application for pigmentation",
+            ],
+        ]),
+        (2, [["natural bleach potato slices", "potato juice for skin brightening"]]),
+        (1, [["potato"], ["skin"]]),
+    ],
+    "potato slices benefits": [
+        (2, [["potato slices benefits", "benefits of potato slices on skin"]]),
+        (2, [["how potato slices help skin", "potato juice skin brightening"]]),
+        (2, [["potato for reducing sunspots", "potato as a natural bleach"]]),
+        (2, [["skin lightening potato benefits", "potato antioxidant effects on skin"]]),
+        (1, [["potato"], ["benefits"]]),
+    ],
+    "potato slices side effects": [
+        (2, [["potato slices side effects", "any side effects of potato slices"]]),
+        (2, [["can potato slices irritate skin", "potato slices harmful effects"]]),
+        (2, [
+            [
+                "potato allergy on skin", "raw potato skin sensitivity",
+                "possible skin dryness from potato slices",
+            ],
+        ]),
+        (1, [["potato"], ["side effects"]]),
+    ],
+    "turmeric and sandalwood paste": [
+        (2, [
+            [
+                "turmeric sandalwood paste", "turmeric and sandalwood mask",
+                "sandalwood turmeric paste", "sandalwood turmeric mask",
+            ],
+        ]),
+        (2, [
+            [
+                "how to make turmeric sandalwood paste",
+                "natural brightening turmeric sandalwood mask",
+            ],
+        ]),
+        (2, [
+            [
+                "turmeric and sandalwood for sunspots", "sunspot remedy turmeric sandalwood",
+                "sandalwood for dark spots", "turmeric for skin discoloration",
+                "anti-pigmentation turmeric sandalwood",
+            ],
+        ]),
+        (1, [["turmeric"], ["sandalwood"], ["paste"]]),
+    ],
+    "turmeric and sandalwood paste benefits": [
+        (2, [
+            ["turmeric and sandalwood paste benefits", "benefits of turmeric and sandalwood paste"],
+        ]),
+        (2, [
+            [
+                "how turmeric and sandalwood paste helps skin",
+                "turmeric and sandalwood for glowing skin",
+            ],
+        ]),
+        (2, [
+            [
+                "anti-inflammatory benefits of turmeric", "sandalwood for calming skin",
+                "turmeric and sandalwood skin healing properties",
+            ],
+        ]),
+        (2, [["skin tone evening turmeric sandalwood", "pigmentation fading turmeric sandalwood"]]),
+        (1, [["turmeric sandalwood"], ["benefits"]]),
+    ],
+    "turmeric and sandalwood paste side effects": [
+        (2, [
+            [
+                "turmeric and sandalwood paste side effects",
+                "any side effects of turmeric and sandalwood paste",
+            ],
+        ]),
+        (2, [
+            [
+                "turmeric and sandalwood paste harmful effects",
+                "can turmeric and sandalwood paste cause irritation",
+            ],
+        ]),
+        (2, [["turmeric skin allergy", "sandalwood reaction on sensitive skin"]]),
+        (2, [["risks of using turmeric sandalwood paste", "skin redness turmeric sandalwood"]]),
+        (1, [["turmeric sandalwood"], ["side effects"]]),
+    ],
+    "aloe vera gel for wrinkles": [
+        (2, [
+            ["aloe vera gel", "aloe vera", "aloe gel", "aloe vera skin gel", "aloe vera leaf gel"],
+        ]),
+        (2, [
+            [
+                "how to apply aloe vera gel for wrinkles", "aloe vera for wrinkles",
+                "wrinkle remedy aloe vera",
+            ],
+        ]),
+        (2, [["natural wrinkle treatment aloe vera", "anti-aging aloe vera gel"]]),
+        (2, [["aloe vera moisturizing for wrinkles", "aloe vera skin rejuvenation"]]),
+        (1, [["aloe vera"], ["wrinkles"]]),
+    ],
+    "aloe vera gel benefits (wrinkles)": [
+        (2, [
+            [
+                "aloe vera gel benefits", "benefits of aloe vera gel",
+                "what are the benefits of aloe vera gel",
+            ],
+        ]),
+        (2, [["how does aloe vera gel help wrinkles", "aloe vera collagen boost"]]),
+        (2, [
+            [
+                "hydration benefits of aloe vera", "anti-aging aloe vera properties",
+                "skin soothing aloe vera benefits",
+            ],
+        ]),
+        (1, [["aloe vera"], ["benefits"], ["wrinkles"]]),
+    ],
+    "aloe vera gel side effects (wrinkles)": [
+        (2, [
+            [
+                "aloe vera gel side effects", "side effects of aloe vera gel",
+                "any side effects of aloe vera gel",
+            ],
+        ]),
+        (2, [["is aloe vera gel safe", "can aloe vera gel cause allergies"]]),
+        (2, [
+            [
+                "aloe vera skin irritation", "allergic reaction aloe vera",
+                "aloe vera gel sensitivity",
+            ],
+        ]),
+        (1, [["aloe vera"], ["side effects"], ["wrinkles"]]),
+    ],
+    "coconut oil massage": [
+        (2, [
+            [
+                "coconut oil massage", "coconut massage", "massage with coconut oil",
+                "coconut oil body massage", "massage coconut oil",
+            ],
+        ]),
+        (2, [
+            [
+                "how to do coconut oil massage", "coconut oil for wrinkles",
+                "wrinkle remedy coconut oil",
+            ],
+        ]),
+        (2, [
+            [
+                "anti-aging coconut oil", "deep skin moisturizing coconut oil",
+                "coconut oil elasticity boost",
+            ],
+        ]),
+        (1, [["coconut oil"], ["massage"]]),
+    ],
+    "coconut oil massage benefits": [
+        (2, [
+            [
+                "coconut oil massage benefits", "benefits of coconut oil massage",
+                "what are the benefits of coconut oil massage",
+            ],
+        ]),
+        (2, [["how does coconut oil massage help wrinkles", "coconut oil for skin elasticity"]]),
+        (2, [
+            [
+                "deep moisturizing coconut oil", "coconut oil antioxidant benefits",
+                "coconut oil skin nourishment",
+            ],
+        ]),
+        (1, [["coconut oil massage"], ["benefits"]]),
+    ],
+    "coconut oil massage side effects": [
+        (2, [
+            [
+                "coconut oil massage side effects", "side effects of coconut oil massage",
+                "any side effects of coconut oil massage",
+            ],
+        ]),
+        (2, [["is coconut oil massage safe", "can coconut oil massage cause allergies"]]),
+        (2, [
+            [
+                "coconut oil pore clogging", "skin breakouts from coconut oil",
+                "coconut oil acne risk",
+            ],
+        ]),
+        (1, [["coconut oil massage"], ["side effects"]]),
+    ],
+    "egg white mask": [
+        (2, [
+            [
+                "egg white mask", "egg white face mask", "egg white facial mask", "egg mask",
+                "egg white pack",
+            ],
+        ]),
+        (2, [
+            ["how to apply egg white mask", "egg white for wrinkles", "wrinkle remedy egg white"],
+        ]),
+        (2, [["egg white tightening mask", "egg white skin firming"]]),
+        (1, [["egg white mask"]]),
+    ],
+    "egg white mask benefits": [
+        (2, [
+            [
+                "egg white mask benefits", "benefits of egg white mask",
+                "what are the benefits of egg white mask",
+            ],
+        ]),
+        (2, [["how does egg white mask help wrinkles", "egg white for firming skin"]]),
+        (2, [
+            [
+                "natural skin tightening remedy", "egg white pore tightening",
+                "egg white skin texture improvement",
+            ],
+        ]),
+        (1, [["egg white mask"], ["benefits"]]),
+    ],
+    "egg white mask side effects": [
+        (2, [
+            [
+                "egg white mask side effects", "side effects of egg white mask",
+                "any side effects of egg white mask",
+            ],
+        ]),
+        (2, [["is egg white mask safe", "can egg white mask cause allergies"]]),
+        (2, [
+            [
+                "egg white skin sensitivity", "egg white allergic reaction",
+                "egg white irritation risks",
+            ],
+        ]),
+        (1, [["egg white mask"], ["side effects"]]),
+    ],
+
+    # GENERAL QUESTIONS
+    "diet and nutrition for skin": [
+        (2, [["diet for skin health", "nutrition for skin", "what diet is good for skin"]]),
+        (2, [["best diet for healthy skin", "skin health diet", "eating for skin health"]]),
+        (2, [
+            [
+                "how does diet affect skin", "skin nutrition", "what nutrition is good for skin",
+                "how does nutrition impact skin",
+            ],
+        ]),
+        (2, [
+            [
+                "foods for glowing skin", "vitamins for skin", "healthy diet skin benefits",
+                "nutrients good for skin", "skin friendly diet",
+            ],
+        ]),
+        (1, [["diet"], ["skin"]]),
+    ],
+    "stress impact on skin": [
+        (2, [["stress and skin", "how does stress affect skin", "skin problems from stress"]]),
+        (2, [
+            [
+                "stress impact on skin health", "can stress cause skin issues",
+                "effect of stress on skin",
+            ],
+        ]),
+        (2, [["stress acne", "stress skin flare ups", "stress causing skin inflammation"]]),
+        (2, [["stress and breakouts", "managing stress for better skin"]]),
+        (1, [["stress"], ["skin"]]),
+    ],
+    "sleep impact on skin": [
+        (2, [["sleep and skin", "how does sleep affect skin", "sleep impact on skin health"]]),
+        (2, [["beauty sleep", "lack of sleep and skin", "good sleep for skin"]]),
+        (2, [["sleep deprivation skin damage", "sleep and skin regeneration"]]),
+        (2, [["importance of sleep for skin", "nighttime skin repair"]]),
+        (1, [["sleep"], ["skin"]]),
+    ],
+    "using non-comedogenic products": [
+        (2, [
+            [
+                "skincare products", "what skincare products to use", "best skincare products",
+                "product recommendations for skin",
+            ],
+        ]),
+        (2, [
+            [
+                "non-comedogenic products", "what are non-comedogenic products",
+                "using non-comedogenic skincare",
+            ],
+        ]),
+        (2, [
+            [
+                "makeup for acne", "best makeup for acne prone skin", "acne friendly makeup",
+                "non-comedogenic makeup", "can makeup cause acne",
+            ],
+        ]),
+        (2, [["oil free skincare", "non pore clogging products", "sensitive skin makeup"]]),
+        (1, [["non-comedogenic", "skincare"], ["non-comedogenic", "products"]]),
+    ],
+    "protecting skin from sun": [
+        (2, [
+            ["sunscreen for acne", "best sunscreen for acne prone skin", "sun protection for acne"],
+        ]),
+        (2, [
+            [
+                "is sunscreen good for acne", "importance of sunscreen for skin",
+                "how to protect skin from sun",
+            ],
+        ]),
+        (2, [["sun protection", "broad spectrum sunscreen", "spf for sensitive skin"]]),
+        (2, [["daily sunscreen use", "sun damage prevention"]]),
+        (1, [["sun"], ["skin"]]),
+    ],
+    "washing face tips": [
+        (2, [
+            [
+                "washing face", "how to wash face", "face washing tips", "proper way to wash face",
+                "best way to wash face for clear skin",
+            ],
+        ]),
+        (2, [
+            [
+                "face cleansing routine", "face wash frequency", "gentle face washing",
+                "avoid over washing face",
+            ],
+        ]),
+        (2, [["cleanse skin properly", "morning and night face washing"]]),
+        (1, [["wash face", "face cleansing"]]),
+    ],
+    "avoid picking or popping pimples": [
+        (2, [
+            [
+                "picking pimples", "should i pick pimples", "popping pimples",
+                "is it bad to pick pimples",
+            ],
+        ]),
+        (2, [
+            [
+                "don't pick pimples", "harm of picking pimples", "pimple picking scars",
+                "pimple popping risks",
+            ],
+        ]),
+        (2, [
+            ["how to avoid picking pimples", "pimple healing tips", "reduce pimple inflammation"],
+        ]),
+        (1, [["picking pimples", "popping pimples"]]),
+    ],
+    "eating well for skin": [
+        (2, [
+            [
+                "eating well for skin", "food for healthy skin", "good food for skin",
+                "healthy eating for skin",
+            ],
+        ]),
+        (2, [["nutrition for healthy skin", "diet for healthy complexion", "skin boosting foods"]]),
+        (2, [
+            [
+                "antioxidants for skin", "hydrating foods for skin",
+                "vitamins and minerals for skin", "balanced diet for skin health",
+            ],
+        ]),
+        (1, [["eating"], ["skin"]]),
+    ],
+    "aloe vera": [
+        (2, [
+            [
+                "is aloe vera good for acne?", "what are the benefits of aloe vera for skin?",
+                "how do you use aloe vera on your face?",
+            ],
+        ]),
+        (2, [
+            [
+                "can aloe vera cause allergies?", "is aloe vera effective for wrinkles?",
+                "does aloe vera help with skin hydration?",
+            ],
+        ]),
+        (2, [
+            [
+                "how often should i apply aloe vera gel?", "is aloe vera safe for sensitive skin?",
+                "is aloe vera good for pigmentation?",
+            ],
+        ]),
+        (2, [
+            [
+                "can aloe vera soothe irritated skin?", "does aloe vera reduce redness?",
+                "can aloe vera cause skin irritation?",
+            ],
+        ]),
+        (2, [["is aloe vera gel good for sunburn?", "can aloe vera help with dry skin?"]]),
+        (1, [["aloe vera"]]),
+    ],
+    "lemon juice": [
+        (2, [
+            [
+                "is lemon juice good for skin whitening?", "can lemon juice help with acne scars?",
+                "how do you apply lemon juice on the skin?",
+            ],
+        ]),
+        (2, [
+            [
+                "is lemon juice safe for sensitive skin?",
+                "does lemon juice cause skin irritation?", "can lemon juice make skin dry?",
+            ],
+        ]),
+        (2, [
+            [
+                "how often should lemon juice be used on skin?",
+                "can lemon juice cause photosensitivity?", "is lemon juice good for pigmentation?",
+            ],
+        ]),
+        (2, [
+            [
+                "can lemon juice lighten dark spots?", "does lemon juice help reduce redness?",
+                "is lemon juice effective for oily skin?",
+            ],
+        ]),
+        (2, [["is lemon juice safe to use daily?", "can lemon juice cause allergic reactions?"]]),
+        (1, [["lemon juice"]]),
+    ],
+    "honey": [
+        (2, [
+            [
+                "is honey good for acne?", "what are the skin benefits of honey?",
+                "how do you use honey for glowing skin?",
+            ],
+        ]),
+        (2, [
+            [
+                "can honey help with dry skin?",
+                "is raw honey better than processed honey for skin?",
+                "does honey have antibacterial properties for skin?",
+            ],
+        ]),
+        (2, [
+            [
+                "can honey cause allergic reactions?", "how often should honey be applied to skin?",
+                "is honey good for pigmentation?",
+            ],
+        ]),
+        (2, [
+            [
+                "can honey reduce inflammation on skin?", "does honey moisturize skin effectively?",
+                "is honey safe for sensitive skin?",
+            ],
+        ]),
+        (2, [["can honey soothe irritated skin?", "does honey help with wound healing?"]]),
+        (1, [["honey"], ["skin"]]),
+    ],
+    "turmeric": [
+        (2, [
+            [
+                "is turmeric good for reducing pigmentation?", "how does turmeric help with acne?",
+                "can turmeric be used daily on skin?",
+            ],
+        ]),
+        (2, [
+            [
+                "does turmeric cause staining on skin?",
+                "what are the anti-inflammatory benefits of turmeric?",
+                "can turmeric lighten dark spots?",
+            ],
+        ]),
+        (2, [
+            [
+                "is turmeric safe for sensitive skin?", "how to make a turmeric face mask?",
+                "can turmeric cause allergic reactions?",
+            ],
+        ]),
+        (2, [
+            [
+                "is turmeric effective for wrinkles?", "does turmeric help reduce redness?",
+                "is turmeric good for oily skin?",
+            ],
+        ]),
+        (2, [["can turmeric soothe irritated skin?"]]),
+        (1, [["turmeric"], ["skin"]]),
+    ],
+    "oatmeal": [
+        (2, [
+            [
+                "is oatmeal good for sensitive skin?", "how does oatmeal soothe irritated skin?",
+                "can oatmeal help with rosacea?",
+            ],
+        ]),
+        (2, [
+            [
+                "how to prepare an oatmeal face mask?", "does oatmeal exfoliate the skin?",
+                "is oatmeal safe for daily use on skin?",
+            ],
+        ]),
+        (2, [
+            [
+                "can oatmeal reduce redness on the face?", "does oatmeal moisturize the skin?",
+                "is oatmeal effective for dry skin?",
+            ],
+        ]),
+        (2, [
+            [
+                "can oatmeal calm inflammation?", "does oatmeal help with acne?",
+                "is oatmeal good for pigmentation?", "can oatmeal cause allergic reactions?",
+            ],
+        ]),
+        (1, [["oatmeal"], ["skin"]]),
+    ],
+    "yogurt": [
+        (2, [
+            [
+                "is yogurt good for skin hydration?", "how does yogurt help with acne?",
+                "can yogurt lighten dark spots?",
+            ],
+        ]),
+        (2, [
+            [
+                "how to apply yogurt on the face?", "is yogurt safe for all skin types?",
+                "does yogurt exfoliate dead skin cells?",
+            ],
+        ]),
+        (2, [
+            [
+                "can yogurt cause allergic reactions?", "how often should yogurt be used on skin?",
+                "is yogurt good for pigmentation?",
+            ],
+        ]),
+        (2, [
+            [
+                "does yogurt soothe irritated skin?", "is yogurt effective for dry skin?",
+                "can yogurt help reduce redness?",
+            ],
+        ]),
+        (2, [["is yogurt safe for sensitive skin?"]]),
+        (1, [["yogurt"], ["skin"]]),
+    ],
+    "cucumber": [
+        (2, [
+            [
+                "is cucumber good for reducing puffiness?", "how does cucumber help with sunburn?",
+                "can cucumber lighten dark circles?",
+            ],
+        ]),
+        (2, [
+            [
+                "how to use cucumber slices on face?", "does cucumber hydrate the skin?",
+                "is cucumber safe for sensitive skin?",
+            ],
+        ]),
+        (2, [
+            [
+                "can cucumber reduce redness on skin?",
+                "how often can cucumber be applied on skin?",
+                "is cucumber effective for pigmentation?",
+            ],
+        ]),
+        (2, [
+            [
+                "can cucumber soothe irritated skin?", "does cucumber help with oily skin?",
+                "is cucumber good for dry skin?", "can cucumber cause allergic reactions?",
+            ],
+        ]),
+        (1, [["cucumber"], ["skin"]]),
+    ],
+    "potato": [
+        (2, [
+            [
+                "is potato good for lightening dark spots?", "how does potato juice help skin?",
+                "can potato reduce pigmentation?",
+            ],
+        ]),
+        (2, [
+            [
+                "how to apply potato slices on face?", "does potato have exfoliating properties?",
+                "is potato safe for sensitive skin?",
+            ],
+        ]),
+        (2, [["can potato cause skin irritation?", "how often should potato be used for skin?"]]),
+        (2, [
+            [
+                "is potato effective for acne scars?", "can potato soothe irritated skin?",
+                "does potato brighten skin tone?",
+            ],
+        ]),
+        (2, [["is potato good for dry skin?", "can potato lighten freckles?"]]),
+        (1, [["potato"], ["skin"]]),
+    ],
+    "sandalwood": [
+        (2, [
+            [
+                "is sandalwood good for skin lightening?",
+                "how does sandalwood help with pigmentation?",
+                "can sandalwood soothe irritated skin?",
+            ],
+        ]),
+        (2, [
+            [
+                "how to make a sandalwood face mask?", "does sandalwood reduce acne scars?",
+                "is sandalwood safe for sensitive skin?",
+            ],
+        ]),
+        (2, [["can sandalwood cause allergies?", "how often should sandalwood be applied?"]]),
+        (2, [
+            [
+                "is sandalwood effective for oily skin?",
+                "does sandalwood have anti-inflammatory properties?",
+            ],
+        ]),
+        (2, [["can sandalwood help with wrinkles?", "is sandalwood good for dry skin?"]]),
+        (1, [["sandalwood"], ["skin"]]),
+    ],
+    "rose water": [
+        (2, [
+            [
+                "is rose water good for skin hydration?", "how does rose water help with acne?",
+                "can rose water reduce redness?",
+            ],
+        ]),
+        (2, [
+            [
+                "how to use rose water as a toner?", "is rose water safe for sensitive skin?",
+                "does rose water have anti-inflammatory properties?",
+            ],
+        ]),
+        (2, [["can rose water help with oily skin?", "how often should rose water be applied?"]]),
+        (2, [
+            [
+                "is rose water effective for pigmentation?",
+                "can rose water soothe irritated skin?", "does rose water tighten pores?",
+            ],
+        ]),
+        (2, [["is rose water good for dry skin?"]]),
+        (1, [["rose water"], ["skin"]]),
+    ],
+    "baking soda": [
+        (2, [
+            [
+                "is baking soda good for exfoliation?", "can baking soda help with acne?",
+                "does baking soda cause skin irritation?",
+            ],
+        ]),
+        (2, [
+            [
+                "how to use baking soda safely on skin?",
+                "is baking soda suitable for sensitive skin?",
+            ],
+        ]),
+        (2, [
+            ["can baking soda lighten dark spots?", "how often can baking soda be used on skin?"],
+        ]),
+        (2, [
+            [
+                "are there risks of using baking soda on skin?",
+                "is baking soda effective for oily skin?", "can baking soda cause dryness?",
+            ],
+        ]),
+        (2, [["does baking soda disrupt skin ph?", "is baking soda good for blackheads?"]]),
+        (1, [["baking soda"], ["skin"]]),
+    ],
+    "lavender oil": [
+        (2, [
+            [
+                "is lavender oil good for rosacea?", "how does lavender oil help with acne?",
+                "can lavender oil soothe irritated skin?",
+            ],
+        ]),
+        (2, [
+            [
+                "how to use lavender oil on skin safely?",
+                "is lavender oil safe for sensitive skin?",
+                "can lavender oil cause allergic reactions?",
+            ],
+        ]),
+        (2, [
+            [
+                "does lavender oil have antibacterial properties?",
+                "how often should lavender oil be applied?",
+            ],
+        ]),
+        (2, [
+            [
+                "is lavender oil good for scars?", "can lavender oil reduce redness?",
+                "is lavender oil effective for wrinkles?",
+            ],
+        ]),
+        (2, [["can lavender oil help with oily skin?"]]),
+        (1, [["lavender oil"], ["skin"]]),
+    ],
+    "activated charcoal": [
+        (2, [
+            [
+                "is activated charcoal good for deep cleansing?",
+                "can activated charcoal help with acne?",
+            ],
+        ]),
+        (2, [
+            [
+                "how does activated charcoal detoxify skin?",
+                "is activated charcoal safe for sensitive skin?",
+            ],
+        ]),
+        (2, [
+            [
+                "how often should activated charcoal masks be used?",
+                "does activated charcoal dry out the skin?",
+                "can activated charcoal cause irritation?",
+            ],
+        ]),
+        (2, [
+            [
+                "how to apply activated charcoal on face?",
+                "is activated charcoal effective for blackheads?",
+                "can activated charcoal reduce oiliness?",
+            ],
+        ]),
+        (2, [
+            [
+                "does activated charcoal exfoliate skin?",
+                "is activated charcoal good for pigmentation?",
+            ],
+        ]),
+        (1, [["activated charcoal"], ["skin"]]),
+    ],
+    "tea tree oil": [
+        (2, [["is tea tree oil effective for acne?", "how to dilute tea tree oil for skin use?"]]),
+        (2, [
+            [
+                "can tea tree oil cause skin irritation?",
+                "does tea tree oil have antibacterial properties?",
+            ],
+        ]),
+        (2, [
+            ["is tea tree oil safe for sensitive skin?", "how often can tea tree oil be applied?"],
+        ]),
+        (2, [
+            [
+                "can tea tree oil reduce redness?", "is tea tree oil good for oily skin?",
+                "is tea tree oil effective for blemishes?",
+            ],
+        ]),
+        (2, [["can tea tree oil help with scars?", "does tea tree oil soothe inflamed skin?"]]),
+        (1, [["tea tree oil"], ["skin"]]),
+    ],
+    "rice flour": [
+        (2, [
+            [
+                "is rice flour good for exfoliating skin?",
+                "how does rice flour help with pigmentation?",
+            ],
+        ]),
+        (2, [["can rice flour lighten skin tone?", "how to use rice flour in face masks?"]]),
+        (2, [
+            [
+                "is rice flour safe for sensitive skin?", "does rice flour absorb excess oil?",
+                "can rice flour cause dryness?",
+            ],
+        ]),
+        (2, [
+            [
+                "how often should rice flour be used on skin?", "is rice flour effective for acne?",
+                "can rice flour reduce redness?",
+            ],
+        ]),
+        (2, [["does rice flour exfoliate gently?"]]),
+        (1, [["rice flour"], ["skin"]]),
+    ],
+    "alum": [
+        (2, [["is alum good for acne treatment?", "how does alum help with skin tightening?"]]),
+        (2, [["can alum cause skin irritation?", "is alum safe for sensitive skin?"]]),
+        (2, [
+            [
+                "how to apply alum on skin?", "does alum reduce oiliness?",
+                "can alum lighten dark spots?",
+            ],
+        ]),
+        (2, [
+            [
+                "how often should alum be used on skin?", "is alum effective for pores?",
+                "can alum soothe irritated skin?",
+            ],
+        ]),
+        (1, [["alum"], ["skin"]]),
+    ],
+    "multani mitti": [
+        (2, [["is multani mitti good for oily skin?", "how does multani mitti help with acne?"]]),
+        (2, [
+            ["can multani mitti reduce pigmentation?", "how to prepare multani mitti face pack?"],
+        ]),
+        (2, [
+            [
+                "is multani mitti safe for sensitive skin?",
+                "does multani mitti absorb excess oil?", "can multani mitti cause dryness?",
+            ],
+        ]),
+        (2, [
+            [
+                "how often should multani mitti be used?",
+                "is multani mitti effective for exfoliation?",
+                "can multani mitti soothe irritated skin?",
+            ],
+        ]),
+        (1, [["multani mitti"], ["skin"]]),
+    ],
+    "almonds": [
+        (2, [
+            ["are almonds good for skin health?", "how does almond oil help with skin hydration?"],
+        ]),
+        (2, [["can almonds reduce wrinkles?", "is almond oil safe for sensitive skin?"]]),
+        (2, [["how to use almonds in skincare?", "do almonds help with acne scars?"]]),
+        (2, [["can almond oil cause allergies?", "how often should almond oil be applied?"]]),
+        (2, [["is almond oil good for pigmentation?", "can almonds improve skin elasticity?"]]),
+        (1, [["almonds"], ["skin"]]),
+    ],
+    "milk": [
+        (2, [["is milk good for skin moisturizing?", "how does milk help with exfoliation?"]]),
+        (2, [["can milk lighten dark spots?", "is milk safe for sensitive skin?"]]),
+        (2, [["how to apply milk on skin?", "does milk cause acne?"]]),
+        (2, [["can milk soothe irritated skin?", "how often should milk be used on skin?"]]),
+        (2, [["is milk effective for dry skin?", "can milk help with pigmentation?"]]),
+        (1, [["milk"], ["skin"]]),
+    ],
+
+    # WEBSITE INFO
+    "skin diagnosis info": [
+        (2, [
+            [
+                "how does skin diagnosis work", "what is skin diagnosis",
+                "how does the ai predict skin issues",
+            ],
+        ]),
+        (2, [
+            [
+                "how can i diagnose my skin", "what is skin analysis",
+                "how accurate is skin diagnosis",
+            ],
+        ]),
+        (2, [["can i upload my photo for skin diagnosis", "how do i check my skin condition"]]),
+        (1, [["skin diagnosis", "skin analysis"]]),
+    ],
+    "developer info": [
+        (2, [
+            [
+                "who develop this website", "who made this website", "who created this website",
+                "who is the developer",
+            ],
+        ]),
+        (2, [
+            [
+                "developer of this website", "site developer", "about the developer",
+                "who built this site",
+            ],
+        ]),
+        (2, [
+            ["website creator", "who coded this website", "developer info", "info about developer"],
+        ]),
+        (2, [
+            [
+                "website developed by", "creator of website", "website designer",
+                "who designed this website",
+            ],
+        ]),
+        (2, [
+            [
+                "who is behind this website", "contact developer", "website development team",
+                "who is the founder of this website",
+            ],
+        ]),
+        (2, [
+            [
+                "developer information", "who is the creator", "website maintainer", "site owner",
+                "owner", "founder",
+            ],
+        ]),
+        (1, [["developer", "creator", "owner"]]),
+    ],
+    "gallery info": [
+        (2, [
+            [
+                "what skin issues are covered", "show me the skin problems",
+                "what conditions can this site detect",
+            ],
+        ]),
+        (2, [
+            [
+                "what skin conditions are included in gallery", "can i learn more about acne",
+                "does this site include rosacea",
+            ],
+        ]),
+        (2, [["skin problem examples", "show skin conditions photos"]]),
+        (1, [["gallery", "skin issues"]]),
+    ],
+    "article info": [
+        (2, [["do you have skin care articles", "where can i read articles", "home remedy blogs"]]),
+        (2, [["skin tips and articles", "skincare advice articles", "latest skincare blog"]]),
+        (2, [["best skincare articles", "skin health articles"]]),
+        (1, [["articles", "blog"]]),
+    ],
+    "contact info": [
+        (2, [["how can i contact you", "how to email you", "contact support"]]),
+        (2, [["customer support email", "how to reach out", "contact information"]]),
+        (1, [["contact", "email"]]),
+    ],
+    "review info": [
+        (2, [["where can i leave a review", "can i share feedback", "submit a review"]]),
+        (2, [["leave feedback", "rate this website", "write a testimonial"]]),
+        (1, [["review", "feedback"]]),
+    ],
+    "faq info": [
+        (2, [["frequently asked questions", "where is the faq section", "common questions"]]),
+        (2, [["help section", "faq page", "questions and answers", "most asked questions"]]),
+        (1, [["faq", "questions"]]),
+    ],
+    "login required info": [
+        (2, [
+            [
+                "do i need to login", "can i use this without signing in",
+                "do i need to sign up to diagnose my skin",
+            ],
+        ]),
+        (2, [
+            [
+                "can i use diagnosis without signing in", "is account required",
+                "do i need an account",
+            ],
+        ]),
+        (1, [["login", "account"]]),
+    ],
+    "signup help": [
+        (2, [
+            ["how to sign up", "how do i create an account", "register account", "signup process"],
+        ]),
+        (1, [["sign up", "create account"]]),
+    ],
+    "login help": [
+        (2, [["how to login", "sign in help", "forgot password", "login issues"]]),
+        (1, [["login", "sign in"]]),
+    ],
+    "general help": [
+        (2, [["can you help me", "help me", "i need help", "what can i ask you"]]),
+        (2, [["how can you assist me", "support help", "help"]]),
+        (1, [["help"]]),
+    ],
+    "website usage help": [
+        (2, [["how do i get started", "guide me through the site", "how to use this website"]]),
+        (2, [["website walkthrough", "site tutorial", "getting started guide"]]),
+        (1, [["how to use", "website usage"]]),
+    ],
+    "common concerns": [
+        (2, [
+            [
+                "common concerns", "frequent problems", "typical skin issues",
+                "most common skin problems",
+            ],
+        ]),
+        (1, [["common concerns", "skin problems"]]),
+    ],
+    "skincare basics": [
+        (2, [["how to take care of my skin", "skin care routine", "daily skincare routine"]]),
+        (2, [["how to maintain healthy skin", "skin care for beginners", "basic skincare tips"]]),
+        (2, [["morning skincare routine", "night skincare routine", "simple skincare steps"]]),
+        (1, [["skincare routine", "skincare tips"]]),
+    ],
+    "personalized skincare": [
+        (2, [["best skincare routine", "what skincare should i use", "recommend skincare for me"]]),
+        (2, [
+            ["what products should i use", "custom skincare advice", "personalized skin care tips"],
+        ]),
+        (2, [["skin care for my skin type", "which skincare suits me"]]),
+        (1, [["personalized skincare", "custom skincare"]]),
+    ],
+    "skincare products difference": [
+        (2, [["difference between moisturizer and serum", "moisturizer vs serum"]]),
+        (2, [["toner vs astringent", "difference between sunscreen and sunblock"]]),
+        (2, [
+            [
+                "what is serum", "what does toner do", "when to use moisturizer",
+                "what is astringent",
+            ],
+        ]),
+        (1, [["difference between"], ["skincare"]]),
+    ],
+    "greeting": [
+        (2, [["hi", "hello", "hey", "hola", "salam", "asalam u alaikum"]]),
+        (2, [["hey glowgenie", "hey glow.genie", "hey genie", "hi genie"]]),
+        (1, [["hi", "hello"]]),
+    ],
+    "good morning": [
+        (2, [["good morning", "morning", "morning greetings"]]),
+        (1, [["morning"]]),
+    ],
+    "good afternoon": [
+        (2, [["good afternoon", "afternoon", "afternoon greetings"]]),
+        (1, [["afternoon"]]),
+    ],
+    "good evening": [
+        (2, [["good evening", "night", "good night", "evening greetings"]]),
+        (1, [["evening", "night"]]),
+    ],
+    "how are you": [
+        (2, [["how are you", "what's up", "how is it going", "how do you do"]]),
+        (1, [["how are you"]]),
+    ],
+    "thanks": [
+        (2, [["thanks", "thank you", "thanks for helping", "appreciate it"]]),
+        (2, [["thank you so much", "thanks a lot"]]),
+        (1, [["thanks", "thank you"]]),
+    ],
+    "how it works": [
+        (2, [["how does this work", "how to use this site", "what can you do"]]),
+        (2, [
+            [
+                "how can you help me", "what is this website for", "explain this website",
+                "how does the diagnosis work",
+            ],
+        ]),
+        (1, [["how it works", "how to use"]]),
+    ],
+}
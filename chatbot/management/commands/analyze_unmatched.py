@@ -0,0 +1,241 @@
+import heapq
+import json
+import os
+import re
+from collections import Counter
+from datetime import datetime, time, timedelta, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from chatbot.utils import normalize
+
+
+def iter_unmatched_records(path, offset=0):
+    """
+    Yields ``(record, end_offset)`` for each complete line of the unmatched
+    queries log from byte ``offset`` on, reading the file lazily. Plain-text
+    lines from the old log format become records with only an ``input``. A
+    trailing line without a newline is still being written and is left for
+    the next run.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                return
+            offset += len(raw)
+            line = raw.decode("utf-8", errors="replace").rstrip("\n")
+            if not line:
+                continue
+            if line.startswith("{"):
+                try:
+                    yield json.loads(line), offset
+                    continue
+                except ValueError:
+                    pass
+            yield {"input": line}, offset
+
+
+def parse_when(value):
+    """
+    Accepts an ISO date or datetime, or a relative age such as ``36h`` or
+    ``7d``. Naive values are taken as UTC.
+    """
+    match = re.fullmatch(r"(\d+)([hd])", value)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        return datetime.now(timezone.utc) - timedelta(**{"hours" if unit == "h" else "days": amount})
+    try:
+        when = datetime.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f"Invalid time '{value}', expected ISO date/datetime or e.g. 36h, 7d")
+    if len(value) == 10:  # bare date
+        when = datetime.combine(when.date(), time.min)
+    return when if when.tzinfo else when.replace(tzinfo=timezone.utc)
+
+
+def cluster_key(text):
+    return " ".join(normalize(text).split())
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitter summary over at most ``capacity`` keys. A new
+    key arriving when the summary is full replaces the key with the smallest
+    count and inherits that count (plus one) as its ``error``. Each stored
+    count is an upper bound that overestimates by at most its error, and
+    errors never exceed ``total / capacity``, so every key seen more often
+    than that is guaranteed to be kept. Below ``capacity`` distinct keys all
+    counts are exact.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.total = 0
+        self.counts = {}
+        self.errors = {}
+        self._heap = []  # (count, key); entries whose count is out of date are skipped
+
+    def add(self, key):
+        """
+        Counts one occurrence of ``key``. Returns the key evicted to make
+        room for it, if any.
+        """
+        self.total += 1
+        evicted = None
+        if key in self.counts:
+            self.counts[key] += 1
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = 1
+            self.errors[key] = 0
+        else:
+            while True:
+                count, evicted = heapq.heappop(self._heap)
+                if self.counts.get(evicted) == count:
+                    break
+            del self.counts[evicted]
+            del self.errors[evicted]
+            self.counts[key] = count + 1
+            self.errors[key] = count
+        heapq.heappush(self._heap, (self.counts[key], key))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, k) for k, count in self.counts.items()]
+            heapq.heapify(self._heap)
+        return evicted
+
+
+class Command(BaseCommand):
+    help = "Analyze unmatched queries log and show top queries"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default=settings.CHATBOT_UNMATCHED_LOG_PATH)
+        parser.add_argument("--top", type=int, default=20)
+        parser.add_argument("--since", type=parse_when, help="Only count queries logged at or after this time")
+        parser.add_argument("--until", type=parse_when, help="Only count queries logged before this time")
+        parser.add_argument(
+            "--cluster", choices=["none", "normalized", "semantic"], default="none",
+            help="Group near-duplicates by normalized text, or additionally merge groups whose "
+                 "spaCy vectors have cosine similarity ≥ --similarity",
+        )
+        parser.add_argument("--similarity", type=float, default=0.9)
+        parser.add_argument(
+            "--semantic-limit", type=int, default=1000,
+            help="Only the most frequent groups are merged by embedding similarity",
+        )
+        parser.add_argument(
+            "--max-distinct", type=int, default=100000,
+            help="Distinct queries tracked in memory. Past that, counts are shown as ranges no wider "
+                 "than lines counted / --max-distinct, and any query asked more often is always kept",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="JSON file holding the byte offset reached by the previous run; only newer lines "
+                 "are read and the offset is advanced afterwards",
+        )
+
+    def handle(self, *args, **options):
+        log_file_path = options["path"]
+        if not os.path.exists(log_file_path):
+            self.stdout.write(f"Log file '{log_file_path}' not found.")
+            return
+
+        sources = self.pending_sources(log_file_path, options["checkpoint"])
+        since, until = options["since"], options["until"]
+        keyed = options["cluster"] != "none"
+        max_distinct = options["max_distinct"]
+
+        summary = SpaceSaving(max_distinct)
+        examples = {}  # cluster key -> first raw query seen for it
+        processed = 0
+        for path, position in sources:
+            for record, position in iter_unmatched_records(path, position):
+                processed += 1
+                if since or until:
+                    stamp = record.get("timestamp")
+                    if not stamp:
+                        continue
+                    when = datetime.fromisoformat(stamp)
+                    if (since and when < since) or (until and when >= until):
+                        continue
+                query = record.get("input", "")
+                key = cluster_key(query) if keyed else query
+                evicted = summary.add(key)
+                if evicted is not None:
+                    del examples[evicted]
+                examples.setdefault(key, query)
+            if options["checkpoint"] and path == log_file_path:
+                self.save_checkpoint(options["checkpoint"], log_file_path, position)
+
+        counter = Counter(summary.counts)
+        errors = summary.errors
+        if options["cluster"] == "semantic":
+            counter, errors = self.merge_similar(
+                counter, errors, options["similarity"], options["semantic_limit"]
+            )
+
+        most_common = counter.most_common(options["top"])
+
+        self.stdout.write(f"Top {options['top']} unmatched queries ({processed} lines read):\n")
+        for i, (key, count) in enumerate(most_common, start=1):
+            error = errors.get(key, 0)
+            asked = f"{count - error}-{count}" if error else count
+            self.stdout.write(f"{i}. {examples.get(key, key)} (asked {asked} times)")
+
+    def pending_sources(self, path, checkpoint_path):
+        """
+        Returns ``[(path, offset), ...]`` to read. Without a checkpoint that is
+        the whole log. With one, reading resumes at the saved offset; if the
+        log was rotated since, the rest of the rotated file (``path.1``) is read
+        first and the new log from the start.
+        """
+        if not checkpoint_path or not os.path.exists(checkpoint_path):
+            return [(path, 0)]
+        with open(checkpoint_path) as f:
+            checkpoint = json.load(f)
+
+        current = os.stat(path)
+        if checkpoint.get("inode") == current.st_ino and checkpoint.get("offset", 0) <= current.st_size:
+            return [(path, checkpoint["offset"])]
+
+        rotated = f"{path}.1"
+        if os.path.exists(rotated) and os.stat(rotated).st_ino == checkpoint.get("inode"):
+            return [(rotated, checkpoint["offset"]), (path, 0)]
+        return [(path, 0)]
+
+    def save_checkpoint(self, checkpoint_path, path, offset):
+        tmp_path = f"{checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"path": os.path.abspath(path), "inode": os.stat(path).st_ino, "offset": offset}, f)
+        os.replace(tmp_path, checkpoint_path)
+
+    def merge_similar(self, counter, errors, threshold, limit):
+        """
+        Greedily folds each of the ``limit`` most frequent groups into the most
+        similar group ranked above it, when their normalized texts have a
+        cosine similarity of at least ``threshold``. Returns the merged counts
+        and count errors.
+        """
+        from chatbot.nlp import embed_texts
+
+        ranked = counter.most_common(limit)
+        if not ranked:
+            return counter, errors
+        vectors = embed_texts([key for key, _ in ranked])
+
+        merged = Counter(dict(counter.most_common()[limit:]))
+        merged_errors = {key: errors.get(key, 0) for key in merged}
+        leaders = []
+        for i, ((key, count), vector) in enumerate(zip(ranked, vectors)):
+            if leaders and vector.any():
+                scores = vectors[leaders] @ vector
+                best = int(scores.argmax())
+                if scores[best] >= threshold:
+                    leader = ranked[leaders[best]][0]
+                    merged[leader] += count
+                    merged_errors[leader] += errors.get(key, 0)
+                    continue
+            leaders.append(i)
+            merged[key] += count
+            merged_errors[key] = errors.get(key, 0)
+        return merged, merged_errors
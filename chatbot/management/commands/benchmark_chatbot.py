@@ -0,0 +1,166 @@
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from chatbot.chatbot_data import NORMALIZED_INPUTS, SCORING_RULES, TAGS
+from chatbot.matching import RuleScorer
+from chatbot.models import Question
+
+
+def naive_score_tag(text, rules=SCORING_RULES):
+    """
+    Reference scorer: evaluates every SCORING_RULES entry with plain
+    substring scans, to check the compiled matcher against the table. The
+    table itself is checked against the original lambdas in chatbot/tests.py.
+    """
+    scores = {
+        tag: sum(
+            points
+            for points, clauses in tag_rules
+            if all(any(phrase in text for phrase in clause) for clause in clauses)
+        )
+        for tag, tag_rules in rules.items()
+    }
+    best_tag = max(scores, key=scores.get)
+    return best_tag if scores[best_tag] > 0 else None
+
+
+def naive_detect_topic(user_input):
+    """
+    Reference topic detection: one substring scan per TAGS keyword.
+    """
+    text = user_input.lower()
+    for topic, keywords in TAGS.items():
+        if any(kw in text for kw in keywords):
+            return topic
+    return None
+
+
+def linear_lookup(user_input_norm, questions, normalize):
+    """
+    Reference for chatbot steps 1-2: the per-request scans over every cached
+    question that the lookup indexes replace.
+    """
+    question = next((q for q in questions if normalize(q.text) == user_input_norm), None)
+    if not question:
+        target = NORMALIZED_INPUTS.get(user_input_norm)
+        if target:
+            question = next((q for q in questions if normalize(q.text) == normalize(target)), None)
+    return question
+
+
+# Run in a fresh interpreter per mode so load time and peak RSS are what a
+# newly forked worker would see.
+STARTUP_PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+from chatbot.nlp import load_nlp
+nlp = load_nlp(sys.argv[1], vectors_only=sys.argv[2] == "1")
+nlp("warm up the vectors table").similarity(nlp("skin care"))
+print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def build_corpus():
+    """
+    Every phrase the chatbot data knows about: normalized inputs, their
+    targets and all topic keywords.
+    """
+    corpus = list(NORMALIZED_INPUTS) + list(NORMALIZED_INPUTS.values())
+    for keywords in TAGS.values():
+        corpus.extend(keywords)
+    return [text.lower() for text in corpus]
+
+
+def time_per_call(func, corpus, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in corpus:
+            func(text)
+    return (time.perf_counter() - start) / (iterations * len(corpus))
+
+
+class Command(BaseCommand):
+    help = "Benchmark the chatbot's text matching helpers and check them against reference implementations"
+
+    targets = ("score_tag", "lookup", "detect_topic", "startup")
+
+    def add_arguments(self, parser):
+        parser.add_argument("target", choices=self.targets)
+        parser.add_argument("--iterations", type=int, default=3)
+        parser.add_argument("--model", help="spaCy model for the startup target (default: CHATBOT_SPACY_MODEL)")
+
+    def handle(self, *args, **options):
+        if options["target"] == "startup":
+            return self.bench_startup(options["model"] or settings.CHATBOT_SPACY_MODEL, options["iterations"])
+        getattr(self, f"bench_{options['target']}")(build_corpus(), options["iterations"])
+
+    def report(self, label, seconds):
+        self.stdout.write(f"{label:<12} {seconds * 1e6:10.1f} us/call")
+
+    def bench_score_tag(self, corpus, iterations):
+        scorer = RuleScorer(SCORING_RULES)
+
+        mismatches = [text for text in corpus if naive_score_tag(text) != scorer.best_tag(text)]
+        if mismatches:
+            raise CommandError(f"{len(mismatches)} queries disagree, e.g. {mismatches[:5]}")
+        self.stdout.write(f"score_tag: {len(corpus)} queries, compiled matcher agrees with reference")
+
+        self.report("reference", time_per_call(naive_score_tag, corpus, iterations))
+        self.report("compiled", time_per_call(scorer.best_tag, corpus, iterations))
+
+    def bench_lookup(self, corpus, iterations):
+        from chatbot import views
+
+        # One unsaved Question per distinct NORMALIZED_INPUTS target stands in
+        # for the database, so the benchmark covers the whole table offline.
+        questions = [Question(text=text) for text in dict.fromkeys(NORMALIZED_INPUTS.values())]
+        by_text, by_input, _ = views.build_question_indexes(questions)
+        queries = [views.normalize(text) for text in NORMALIZED_INPUTS]
+
+        def indexed(user_input_norm):
+            return by_text.get(user_input_norm) or by_input.get(user_input_norm)
+
+        def linear(user_input_norm):
+            return linear_lookup(user_input_norm, questions, views.normalize)
+
+        mismatches = [text for text in queries if indexed(text) is not linear(text)]
+        if mismatches:
+            raise CommandError(f"{len(mismatches)} inputs disagree, e.g. {mismatches[:5]}")
+        self.stdout.write(
+            f"lookup: {len(queries)} NORMALIZED_INPUTS keys over {len(questions)} questions, index agrees with scan"
+        )
+
+        self.report("linear scan", time_per_call(linear, queries, iterations))
+        self.report("index", time_per_call(indexed, queries, iterations))
+
+    def bench_detect_topic(self, corpus, iterations):
+        from chatbot import views
+
+        queries = list(NORMALIZED_INPUTS)
+        mismatches = [text for text in queries if naive_detect_topic(text) != views.detect_topic(text)]
+        if mismatches:
+            raise CommandError(f"{len(mismatches)} inputs disagree, e.g. {mismatches[:5]}")
+        self.stdout.write(f"detect_topic: {len(queries)} NORMALIZED_INPUTS keys, automaton agrees with reference")
+
+        self.report("reference", time_per_call(naive_detect_topic, queries, iterations))
+        self.report("automaton", time_per_call(views.detect_topic, queries, iterations))
+
+    def bench_startup(self, model, iterations):
+        self.stdout.write(f"startup: loading {model!r}, best of {iterations} runs per mode")
+        for label, vectors_only in (("full", "0"), ("vectors only", "1")):
+            runs = []
+            for _ in range(iterations):
+                result = subprocess.run(
+                    [sys.executable, "-c", STARTUP_PROBE, model, vectors_only],
+                    capture_output=True, text=True, cwd=settings.BASE_DIR,
+                )
+                if result.returncode:
+                    raise CommandError(result.stderr.strip().splitlines()[-1])
+                seconds, max_rss_kb = result.stdout.split()
+                runs.append((float(seconds), int(max_rss_kb)))
+            seconds, max_rss_kb = min(runs)
+            self.stdout.write(f"{label:<12} {seconds:8.2f} s load  {max_rss_kb / 1024:8.1f} MB peak RSS")
@@ -0,0 +1,124 @@
+from collections import deque
+
+
+class AhoCorasick:
+    """
+    Multi-pattern substring matcher. All patterns are compiled into a single
+    automaton so one pass over the text reports every pattern it contains,
+    instead of one ``pattern in text`` scan per pattern.
+
+    Each pattern carries a payload (any hashable); ``find`` returns the set of
+    payloads whose pattern occurs anywhere in the text.
+    """
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [set()]
+
+        for pattern, payload in patterns:
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(set())
+                state = nxt
+            self._out[state].add(payload)
+
+        # Breadth-first pass to wire failure links and fold each state's
+        # suffix matches into its own output set.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+        self._out = [frozenset(out) for out in self._out]
+
+    def find(self, text):
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set(out[0])
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found |= out[state]
+        return found
+
+
+class RuleScorer:
+    """
+    Compiled form of a ``{tag: [(points, clauses), ...]}`` rule table (see
+    ``chatbot_data.SCORING_RULES``).
+
+    A rule fires when each of its clauses has at least one phrase present in
+    the query. Every distinct clause becomes an Aho-Corasick payload, so a
+    single scan tells us which clauses hold and only the rules touching those
+    clauses are visited.
+    """
+
+    def __init__(self, rules):
+        self.tags = list(rules)
+        clause_ids = {}
+        self._rules = []  # (tag index, points, number of distinct clauses)
+        self._clause_rules = []  # clause id -> rule indexes
+
+        for tag_index, tag in enumerate(self.tags):
+            for points, clauses in rules[tag]:
+                rule_index = len(self._rules)
+                ids = set()
+                for clause in clauses:
+                    key = frozenset(clause)
+                    if key not in clause_ids:
+                        clause_ids[key] = len(clause_ids)
+                        self._clause_rules.append([])
+                    ids.add(clause_ids[key])
+                for clause_id in ids:
+                    self._clause_rules[clause_id].append(rule_index)
+                self._rules.append((tag_index, points, len(ids)))
+
+        self._matcher = AhoCorasick(
+            (phrase, clause_id)
+            for clause, clause_id in clause_ids.items()
+            for phrase in clause
+        )
+
+    def _totals(self, text):
+        satisfied = {}
+        for clause_id in self._matcher.find(text):
+            for rule_index in self._clause_rules[clause_id]:
+                satisfied[rule_index] = satisfied.get(rule_index, 0) + 1
+
+        totals = {}
+        for rule_index, count in satisfied.items():
+            tag_index, points, needed = self._rules[rule_index]
+            if count == needed:
+                totals[tag_index] = totals.get(tag_index, 0) + points
+        return totals
+
+    def scores(self, text):
+        """
+        Returns ``{tag: score}`` for every tag whose rules matched the text.
+        """
+        return {self.tags[i]: score for i, score in self._totals(text).items()}
+
+    def best_tag(self, text):
+        """
+        Returns the highest scoring tag, or None when nothing scored. Ties go
+        to the tag listed first, the same as ``max`` over the rule dict.
+        """
+        best = max(self._totals(text).items(), key=lambda item: (item[1], -item[0]), default=None)
+        if best is None or best[1] <= 0:
+            return None
+        return self.tags[best[0]]
@@ -21,4 +21,19 @@ class Question(models.Model):
     keywords = models.TextField(blank=True, null=True)  # Optional comma-separated keywords/tags for filtering/search
 
     def __str__(self):
-        return self.text
\ No newline at end of file
+        return self.text
+
+class QuestionCacheChange(models.Model):
+    """
+    Log of Question/Answer saves and deletes. The highest id acts as the
+    version stamp chatbot workers compare against to refresh only the changed
+    rows of their in-memory question cache; recent rows are re-scanned by
+    created_at because concurrent saves can commit out of id order. Rows
+    older than CHATBOT_CACHE_CHANGE_RETENTION are pruned on write.
+    """
+    model = models.CharField(max_length=20)  # "question" or "answer"
+    object_id = models.BigIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"{self.model} {self.object_id}"
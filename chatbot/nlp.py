@@ -0,0 +1,102 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Pipes of the en_core_web_* models that never feed Doc.vector or
+# Doc.similarity; those only read the tokenizer and the vectors table.
+NON_VECTOR_PIPES = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
+_nlp = None
+_lock = threading.Lock()
+
+
+def load_nlp(name, vectors_only=False):
+    """
+    Loads a spaCy pipeline. With ``vectors_only`` the pipes listed in
+    NON_VECTOR_PIPES are excluded, so their weights are never read from disk.
+    """
+    import spacy  # importing spaCy alone costs about a second
+
+    if vectors_only:
+        return spacy.load(name, exclude=NON_VECTOR_PIPES)
+    return spacy.load(name)
+
+
+def get_nlp():
+    """
+    Returns the process-wide spaCy pipeline, loading it on first use.
+    """
+    global _nlp
+    if _nlp is None:
+        with _lock:
+            if _nlp is None:
+                _nlp = load_nlp(settings.CHATBOT_SPACY_MODEL, settings.CHATBOT_SPACY_VECTORS_ONLY)
+    return _nlp
+
+
+def embed_texts(texts, batch_size=256):
+    """
+    Returns the spaCy vectors of ``texts`` as a float32 matrix with unit-length
+    rows, embedding them in batches with every pipe disabled. Blank texts and
+    texts with no known words get a zero row, which scores 0.0 against any
+    query.
+    """
+    nlp = get_nlp()
+    matrix = np.zeros((len(texts), nlp.vocab.vectors_length), dtype=np.float32)
+    with nlp.select_pipes(disable=nlp.pipe_names):
+        for row, doc in enumerate(nlp.pipe(texts, batch_size=batch_size)):
+            if doc.has_vector and doc.text.strip():
+                matrix[row] = doc.vector
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def embedding_cache_key(texts):
+    nlp = get_nlp()
+    digest = hashlib.sha256()
+    digest.update(f"{nlp.lang}_{nlp.meta.get('name')}-{nlp.meta.get('version')} {nlp.vocab.vectors.shape}".encode())
+    for text in texts:
+        digest.update(b"\0" + text.encode())
+    return digest.hexdigest()[:32]
+
+
+def embed_questions(texts):
+    """
+    Like embed_texts, but persists the matrix as a .npy file in
+    CHATBOT_EMBEDDING_CACHE_DIR, keyed by a hash of the model and the texts.
+    When the content is unchanged the file is memory-mapped read-only instead
+    of running spaCy, so every worker shares the same pages.
+    """
+    cache_dir = settings.CHATBOT_EMBEDDING_CACHE_DIR
+    if not cache_dir:
+        return embed_texts(texts)
+
+    filename = f"question_vectors_{embedding_cache_key(texts)}.npy"
+    path = os.path.join(cache_dir, filename)
+    try:
+        return np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        pass
+
+    matrix = embed_texts(texts)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, matrix)
+        os.replace(tmp_path, path)
+        # Older content hashes will never be asked for again.
+        for name in os.listdir(cache_dir):
+            if name.startswith("question_vectors_") and name != filename:
+                os.remove(os.path.join(cache_dir, name))
+    except OSError as e:
+        logger.warning(f"Could not write question embedding cache {path}: {e}")
+    return matrix
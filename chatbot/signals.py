@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Answer, Question, QuestionCacheChange
+
+
+def record_change(model, object_id):
+    """
+    Appends a change for workers to replay and prunes rows older than
+    CHATBOT_CACHE_CHANGE_RETENTION; workers idle for longer reload in full.
+    """
+    QuestionCacheChange.objects.create(model=model, object_id=object_id)
+    cutoff = timezone.now() - timedelta(seconds=settings.CHATBOT_CACHE_CHANGE_RETENTION)
+    QuestionCacheChange.objects.filter(created_at__lt=cutoff).delete()
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def record_question_change(sender, instance, **kwargs):
+    record_change("question", instance.pk)
+
+
+@receiver(post_save, sender=Answer)
+@receiver(post_delete, sender=Answer)
+def record_answer_change(sender, instance, **kwargs):
+    record_change("answer", instance.pk)
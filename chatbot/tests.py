@@ -1,3 +1,242 @@
-from django.test import TestCase
+import json
+import os
+import time
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+import spacy
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.utils import timezone
+from spacy.language import Language
+
+from . import views
+from .management.commands.analyze_unmatched import SpaceSaving
+from .models import Answer, Question, QuestionCacheChange
+from .signals import record_change
+from .chatbot_data import TAGS
+from .nlp import embed_texts
+from .views import build_question_indexes, detect_topic, get_best_match_spacy, score_tag
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), 'test_data')
+
+
+class ScoreTagTests(TestCase):
+    """
+    score_tag used to build ~750 lambdas per call; the rules now live in
+    chatbot_data.SCORING_RULES. score_tag_cases.json maps queries to the tag
+    the original lambda implementation returned for them. The queries are
+    built from every trigger phrase in those lambdas (alone, with the rule's
+    first phrase, and all of a rule's phrases together), so a rule copied
+    wrong into the table changes at least one answer.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        with open(os.path.join(TEST_DATA_DIR, 'score_tag_cases.json'), encoding='utf-8') as f:
+            cls.cases = json.load(f)
+
+    def test_matches_original_scoring(self):
+        mismatches = [
+            (query, expected, score_tag(query))
+            for query, expected in self.cases.items()
+            if score_tag(query) != expected
+        ]
+        self.assertEqual(mismatches[:20], [], f"{len(mismatches)} of {len(self.cases)} queries changed tag")
+
+    def test_no_rule_matches(self):
+        self.assertIsNone(score_tag(''))
+        self.assertIsNone(score_tag('what is the weather today'))
+
+    def test_case_insensitive(self):
+        self.assertEqual(score_tag('ROSACEA VS ACNE?'), 'rosacea vs acne')
+
+
+@Language.component("chatbot_tests_must_not_run")
+def must_not_run(doc):
+    raise AssertionError("query embedding ran a pipeline component")
+
+
+class BestSpacyMatchTests(SimpleTestCase):
+    """
+    Matching against a blank pipeline with a three-word vector table. Its only
+    component fails if it runs, since queries are embedded with every pipe
+    disabled, like the questions.
+    """
+
+    def setUp(self):
+        nlp = spacy.blank("en")
+        for word, vector in (("acne", [1, 0, 0]), ("rosacea", [0, 1, 0]), ("skin", [1, 1, 0])):
+            nlp.vocab.set_vector(word, np.array(vector, dtype=np.float32))
+        nlp.add_pipe("chatbot_tests_must_not_run")
+        patcher = mock.patch("chatbot.nlp.get_nlp", return_value=nlp)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.questions = [Question(pk=i, text=text) for i, text in enumerate(["acne", "rosacea", "skin", "acne"])]
+        self.matrix = embed_texts([q.text for q in self.questions])
+
+    def test_best_match(self):
+        question, score = views.best_spacy_match("rosacea", self.questions, self.matrix)
+        self.assertIs(question, self.questions[1])
+        self.assertAlmostEqual(score, 1.0, places=5)
+
+        # (1, 0.5, 0) is closest to "skin": cosine 0.95 against 0.89 for "acne".
+        question, score = views.best_spacy_match("acne skin", self.questions, self.matrix)
+        self.assertIs(question, self.questions[2])
+        self.assertAlmostEqual(score, 1.5 / (np.sqrt(1.25) * np.sqrt(2)), places=5)
+
+    def test_first_of_equal_scores_wins(self):
+        question, _ = views.best_spacy_match("acne", self.questions, self.matrix)
+        self.assertIs(question, self.questions[0])
+
+    def test_no_vector(self):
+        for query in ("", "   ", "weather"):
+            with self.subTest(query=query):
+                self.assertEqual(views.best_spacy_match(query, self.questions, self.matrix), (None, None))
+        self.assertEqual(views.best_spacy_match("acne", [], self.matrix[:0]), (None, None))
+
+    def test_threshold(self):
+        question = self.questions[0]
+        for score, expected in ((0.7, question), (0.95, question), (0.6999, None), (None, None)):
+            with self.subTest(score=score):
+                with mock.patch.object(views, "best_spacy_match", return_value=(question if score else None, score)):
+                    self.assertIs(get_best_match_spacy("acne", self.questions, self.matrix), expected)
+        with mock.patch.object(views, "best_spacy_match", return_value=(question, 0.0)):
+            self.assertIsNone(get_best_match_spacy("acne", self.questions, self.matrix, threshold=0.0))
+
+
+class QuestionIndexTests(SimpleTestCase):
+    def test_first_question_wins_on_collisions(self):
+        questions = [
+            Question(pk=1, text="What is rosacea?"),
+            Question(pk=2, text="what is rosacea"),
+            Question(pk=3, text="Rosacea causes"),
+            Question(pk=4, text="rosacea causes!"),
+        ]
+        by_text, by_input, by_topic = build_question_indexes(questions)
+        self.assertEqual({key: q.pk for key, q in by_text.items()}, {"what is rosacea": 1, "rosacea causes": 3})
+        # NORMALIZED_INPUTS maps "define rosacea" to "what is rosacea".
+        self.assertEqual(by_input["define rosacea"].pk, 1)
+        self.assertEqual({topic: q.pk for topic, q in by_topic.items()}, {"what is rosacea": 1, "rosacea causes": 3})
+
+    def test_inputs_without_question_are_skipped(self):
+        by_text, by_input, by_topic = build_question_indexes([Question(pk=1, text="Rosacea causes")])
+        self.assertNotIn("define rosacea", by_input)
+        self.assertEqual(list(by_topic), ["rosacea causes"])
+
+
+class DetectTopicTests(SimpleTestCase):
+    """
+    detect_topic must agree with the keyword scan it replaced: the first
+    topic in TAGS with a keyword in the input wins.
+    """
+
+    @staticmethod
+    def linear_scan(user_input):
+        text = user_input.lower()
+        for topic, keywords in TAGS.items():
+            if any(keyword in text for keyword in keywords):
+                return topic
+        return None
+
+    def test_lowest_topic_index_wins(self):
+        self.assertEqual(detect_topic("What causes rosacea vs acne?"), "rosacea vs acne")
+        self.assertEqual(detect_topic("Rosacea vs acne: what causes rosacea?"), "rosacea vs acne")
+
+    def test_matches_linear_scan(self):
+        topics = list(TAGS.items())
+        queries = []
+        for i, (_, keywords) in enumerate(topics):
+            _, later_keywords = topics[(i * 7 + 3) % len(topics)]
+            queries.append(keywords[0].upper())
+            queries.append(f"tell me about {later_keywords[-1]} and {keywords[-1]} please")
+            queries.append(f"{keywords[0]} {later_keywords[0]}")
+        mismatches = [(q, self.linear_scan(q), detect_topic(q)) for q in queries if detect_topic(q) != self.linear_scan(q)]
+        self.assertEqual(mismatches, [])
+
+    def test_no_topic(self):
+        self.assertIsNone(detect_topic(""))
+        self.assertIsNone(detect_topic("what is the weather today"))
+
+
+class QuestionCacheChangeTests(TestCase):
+    def pending_ids(self):
+        return [change_id for change_id, _, _ in views.pending_cache_changes()[0]]
+
+    def test_late_commit_below_stamp_is_replayed(self):
+        QuestionCacheChange.objects.create(id=1, model="question", object_id=1)
+        QuestionCacheChange.objects.create(id=3, model="question", object_id=3)
+        with mock.patch.object(views, "cache_change_id", 0), mock.patch.object(views, "recent_change_ids", set()):
+            self.assertEqual(self.pending_ids(), [1, 3])
+            views.cache_change_id, views.recent_change_ids = 3, views.pending_cache_changes()[1]
+            self.assertEqual(self.pending_ids(), [])
+
+            # A concurrent save that took id 2 commits after id 3 was applied.
+            QuestionCacheChange.objects.create(id=2, model="answer", object_id=2)
+            self.assertEqual(self.pending_ids(), [2])
+
+    def test_old_rows_below_stamp_are_not_rescanned(self):
+        QuestionCacheChange.objects.create(id=1, model="question", object_id=1)
+        QuestionCacheChange.objects.filter(id=1).update(created_at=timezone.now() - timedelta(hours=1))
+        with mock.patch.object(views, "cache_change_id", 1), mock.patch.object(views, "recent_change_ids", set()):
+            self.assertEqual(self.pending_ids(), [])
+
+    def test_record_change_prunes_old_rows(self):
+        QuestionCacheChange.objects.create(model="question", object_id=1)
+        QuestionCacheChange.objects.update(created_at=timezone.now() - timedelta(days=2))
+        with self.settings(CHATBOT_CACHE_CHANGE_RETENTION=86400):
+            record_change("answer", 5)
+        self.assertEqual(list(QuestionCacheChange.objects.values_list("model", "object_id")), [("answer", 5)])
+
+
+class ResponseCacheTests(TestCase):
+    def test_stale_cached_answer_falls_through(self):
+        answer = Answer.objects.create(content=[{"type": "paragraph", "text": "Acne is..."}])
+        question = Question.objects.create(text="What is acne?", answer=answer)
+        views.response_cache.clear()
+        # An entry cached against the previous question cache, whose answer
+        # has since been deleted.
+        views.response_cache.set("what is acne", answer.pk + 1)
+        request = RequestFactory().post("/chatbot/", json.dumps({"message": "What is acne?"}),
+                                        content_type="application/json")
+        with mock.patch.multiple(views, cache_loaded=True, last_change_check=time.monotonic(),
+                                 question_index={"what is acne": question}, answers_by_id={}):
+            response = views.chatbot(request)
+        self.assertEqual(json.loads(response.content)["response"], answer.content)
+        self.assertEqual(views.response_cache.get("what is acne"), answer.pk)
+
+
+class SpaceSavingTests(TestCase):
+    def test_bounds_and_heavy_hitters(self):
+        # "help" and "owner" are frequent; the other 200 queries appear once,
+        # interleaved so the summary keeps evicting.
+        stream = []
+        for i in range(200):
+            stream.append(f"query {i}")
+            if i % 4 == 0:
+                stream.append("help")
+            if i % 10 == 0:
+                stream.append("owner")
+        truth = {key: stream.count(key) for key in set(stream)}
+
+        summary = SpaceSaving(10)
+        for key in stream:
+            summary.add(key)
+
+        self.assertEqual(len(summary.counts), 10)
+        for key, count in summary.counts.items():
+            error = summary.errors[key]
+            self.assertLessEqual(error, len(stream) / 10)
+            self.assertLessEqual(count - error, truth[key])
+            self.assertGreaterEqual(count, truth[key])
+        for key, true_count in truth.items():
+            if true_count > len(stream) / 10:
+                self.assertIn(key, summary.counts)
+
+    def test_exact_below_capacity(self):
+        summary = SpaceSaving(10)
+        for key in ["a", "b", "a", "c", "a", "b"]:
+            self.assertIsNone(summary.add(key))
+        self.assertEqual(summary.counts, {"a": 3, "b": 2, "c": 1})
+        self.assertEqual(set(summary.errors.values()), {0})
@@ -0,0 +1,129 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking, single worker assumed
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class UnmatchedQueryLog:
+    """
+    Buffered JSONL writer for chatbot messages that found no answer.
+
+    ``log`` only puts a record on an in-memory queue; a daemon thread drains
+    the queue in batches and appends each batch with a single write to the
+    file opened in append mode, so records from concurrent gunicorn workers
+    never interleave mid-line. A lock file serializes the size-based rotation
+    (``path`` -> ``path.1`` -> ... -> ``path.<backup_count>``) across workers.
+    """
+
+    def __init__(self, path, max_bytes=10 * 1024 * 1024, backup_count=5,
+                 batch_size=100, flush_interval=1.0, queue_size=10000):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def log(self, user_input, topic=None, score=None):
+        self._ensure_writer()
+        record = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "input": user_input,
+            "topic": topic,
+            "score": None if score is None else round(float(score), 4),
+        }
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            # Never block a request on logging; drop and count instead.
+            self.dropped += 1
+
+    def flush(self, timeout=5.0):
+        """
+        Stops the writer thread after it has written everything queued.
+        """
+        if self._thread and self._thread.is_alive() and self._pid == os.getpid():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _ensure_writer(self):
+        # Threads do not survive fork, so a writer started in the gunicorn
+        # master (preload_app) is restarted in each worker.
+        if self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._queue = queue.Queue(maxsize=self._queue.maxsize)
+            self._thread = threading.Thread(target=self._run, name="unmatched-query-log", daemon=True)
+            self._pid = os.getpid()
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            batch = [record]
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    record = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if record is None:
+                    stop = True
+                    break
+                batch.append(record)
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.warning(f"Failed to log {len(batch)} unmatched queries: {e}")
+            if stop:
+                return
+
+    def _write(self, batch):
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch).encode("utf-8")
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(self.path + ".lock", "a") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if self.max_bytes and os.path.exists(self.path) \
+                        and os.path.getsize(self.path) + len(data) > self.max_bytes:
+                    self._rotate()
+                with open(self.path, "ab", buffering=0) as f:
+                    f.write(data)
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _rotate(self):
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
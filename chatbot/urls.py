@@ -4,6 +4,7 @@ from . import views
 
 urlpatterns = [
     path('chatbot/', views.chatbot, name='chatbot'),
+    path('chatbot/stats/', views.chatbot_stats, name='chatbot_stats'),
     # path('chatbot/greeting/', views.initial_greeting, name='initial_greeting'), # Add this line
     # path("chatbot/suggestions/", views.search_suggestions, name="chatbot-suggestions"),
 ]
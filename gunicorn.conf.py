@@ -0,0 +1,19 @@
+# Gunicorn reads this file automatically from the working directory.
+import os
+
+# Import the Django app in the master before forking workers. With
+# CHATBOT_PRELOAD_SPACY=True this loads the spaCy model once and every
+# worker shares it copy-on-write instead of loading its own copy.
+preload_app = os.environ.get('CHATBOT_PRELOAD_SPACY', 'False') == 'True'
+
+# Threaded workers: a prediction waiting on the model holds one thread, not a
+# whole process, so the per-process admission limits in predictor/admission.py
+# (PREDICTION_MAX_CONCURRENT running, PREDICTION_ADMISSION_QUEUE_SIZE waiting)
+# engage and the remaining threads keep serving other pages. The default
+# leaves four threads per worker beyond what predictions can hold.
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', (
+    int(os.environ.get('PREDICTION_MAX_CONCURRENT', 4))
+    + int(os.environ.get('PREDICTION_ADMISSION_QUEUE_SIZE', 8))
+    + 4
+)))
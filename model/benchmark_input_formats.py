@@ -0,0 +1,91 @@
+# Compares the request formats input_fn accepts for one image
+#
+#   python model/benchmark_input_formats.py path/to/images/*.jpg --max-side 1333
+#
+# Each image is downscaled the way the web app does (predictor/preprocessing.py)
+# and serialized as a JPEG, a raw uint8 .npy array and a deflated .npz array.
+# For every format it reports the payload size, the client-side encode time
+# and the time the handler's own input_fn takes to turn the body into the
+# model's float tensor, i.e. what the model server spends before predict_fn.
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+from PIL import Image, ImageOps
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'code'))
+
+import inference  # noqa: E402
+
+FORMATS = ('jpeg', 'npy', 'npz')
+CONTENT_TYPES = {'jpeg': 'image/jpeg', 'npy': 'application/x-npy', 'npz': 'application/x-npz'}
+
+
+def decode(image_bytes, max_side):
+    image = ImageOps.exif_transpose(Image.open(io.BytesIO(image_bytes))).convert('RGB')
+    if max_side:
+        image.thumbnail((max_side, max_side), Image.LANCZOS)
+    return image
+
+
+def encode(image, fmt, quality):
+    output = io.BytesIO()
+    if fmt == 'jpeg':
+        image.save(output, format='JPEG', quality=quality, optimize=True)
+    elif fmt == 'npy':
+        np.save(output, np.asarray(image, dtype=np.uint8), allow_pickle=False)
+    else:
+        np.savez_compressed(output, image=np.asarray(image, dtype=np.uint8))
+    return output.getvalue()
+
+
+def best_of(func, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Payload size and decode cost per input format')
+    parser.add_argument('images', nargs='+')
+    parser.add_argument('--max-side', type=int, default=1333)
+    parser.add_argument('--quality', type=int, default=90)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    sizes = {fmt: [] for fmt in FORMATS}
+    encode_times = {fmt: [] for fmt in FORMATS}
+    decode_times = {fmt: [] for fmt in FORMATS}
+    for path in args.images:
+        with open(path, 'rb') as f:
+            image = decode(f.read(), args.max_side)
+        reference = None
+        for fmt in FORMATS:
+            body, seconds = best_of(lambda: encode(image, fmt, args.quality), args.repeats)
+            sizes[fmt].append(len(body))
+            encode_times[fmt].append(seconds)
+            tensor, seconds = best_of(lambda: inference.input_fn(body, CONTENT_TYPES[fmt]), args.repeats)
+            decode_times[fmt].append(seconds)
+            if reference is None:
+                reference = tensor
+            elif tensor.shape != reference.shape:
+                sys.exit(f"{path}: {fmt} tensor {tuple(tensor.shape)} != jpeg {tuple(reference.shape)}")
+
+    print(f"{len(args.images)} images, max side {args.max_side}px, JPEG quality {args.quality}, best of {args.repeats} runs")
+    for fmt in FORMATS:
+        print(
+            f"{fmt:>4}: payload {statistics.mean(sizes[fmt]) / 1024:8.1f} KB  "
+            f"encode {statistics.mean(encode_times[fmt]) * 1e3:7.2f} ms  "
+            f"input_fn {statistics.mean(decode_times[fmt]) * 1e3:7.2f} ms"
+        )
+
+
+if __name__ == '__main__':
+    main()
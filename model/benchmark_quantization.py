@@ -0,0 +1,100 @@
+# Compares dynamic int8 quantization against the fp32 model
+#
+#   python model/benchmark_quantization.py --model-dir model --weights model_V2_full_cpu_compatible.pth \
+#       path/to/images/*.jpg --threads 2
+#
+# Runs every image through both models with the handler's own input_fn,
+# predict_fn and format_predictions, then reports per-image latency and how
+# far the int8 detections drift from the fp32 ones: the share of fp32
+# detections the int8 model also finds (same label, IoU >= --iou), the
+# int8 detections with no fp32 counterpart and the mean confidence change.
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'code'))
+
+import torch  # noqa: E402
+from torchvision.ops import box_iou  # noqa: E402
+
+import inference  # noqa: E402
+
+
+def run(model, tensors, repeats):
+    predictions, latencies = [], []
+    for tensor in tensors:
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            prediction = inference.predict_fn(tensor, model)
+            timings.append(time.perf_counter() - start)
+        latencies.append(min(timings))
+        predictions.append(inference.format_predictions(prediction))
+    return predictions, latencies
+
+
+def match(reference, candidate, iou_threshold):
+    """
+    Greedily pairs each reference detection with the unused candidate of the
+    same label that overlaps it most. Returns the matched confidence pairs.
+    """
+    pairs, used = [], set()
+    for ref in reference:
+        best, best_iou = None, iou_threshold
+        for i, cand in enumerate(candidate):
+            if i in used or cand['label_id'] != ref['label_id']:
+                continue
+            iou = box_iou(torch.tensor([ref['box']]), torch.tensor([cand['box']])).item()
+            if iou >= best_iou:
+                best, best_iou = i, iou
+        if best is not None:
+            used.add(best)
+            pairs.append((ref['confidence'], candidate[best]['confidence']))
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='fp32 vs int8 accuracy and latency')
+    parser.add_argument('images', nargs='+')
+    parser.add_argument('--model-dir', default='model')
+    parser.add_argument('--weights', default=inference.MODEL_WEIGHTS, help='Weights file in --model-dir')
+    parser.add_argument('--threads', type=int, default=0, help='Intra-op threads (0: Torch default)')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--iou', type=float, default=0.5)
+    args = parser.parse_args()
+
+    inference.configure_threads(args.threads)
+    tensors = []
+    for path in args.images:
+        with open(path, 'rb') as f:
+            tensors.append(inference.input_fn(f.read(), 'image/jpeg'))
+
+    fp32_model = inference.model_fn(args.model_dir, quantize='', weights=args.weights)
+    int8_model = inference.model_fn(args.model_dir, quantize='int8', weights=args.weights)
+    fp32, fp32_latency = run(fp32_model, tensors, args.repeats)
+    int8, int8_latency = run(int8_model, tensors, args.repeats)
+
+    found = extra = total = 0
+    score_deltas = []
+    for reference, candidate in zip(fp32, int8):
+        pairs = match(reference, candidate, args.iou)
+        total += len(reference)
+        found += len(pairs)
+        extra += len(candidate) - len(pairs)
+        score_deltas.extend(abs(a - b) for a, b in pairs)
+
+    print(f"{len(tensors)} images, {torch.get_num_threads()} threads, best of {args.repeats} runs")
+    for label, latencies in (('fp32', fp32_latency), ('int8', int8_latency)):
+        print(f"{label}: p50 {statistics.median(latencies) * 1e3:8.1f} ms  mean {statistics.mean(latencies) * 1e3:8.1f} ms")
+    speedup = statistics.mean(fp32_latency) / statistics.mean(int8_latency)
+    print(f"speedup: {speedup:.2f}x")
+    print(f"fp32 detections recovered by int8: {found}/{total} ({found / total:.1%})" if total else "no fp32 detections")
+    print(f"int8-only detections: {extra}")
+    if score_deltas:
+        print(f"mean |confidence delta| on matched detections: {statistics.mean(score_deltas):.4f}")
+
+
+if __name__ == '__main__':
+    main()
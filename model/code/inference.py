@@ -2,75 +2,318 @@
 import os
 import io
 import json
+import hashlib
+import logging
+import math
+import pickle
+import re
+import tarfile
+import time
+import numpy as np
 import torch
 from PIL import Image
+from torchvision.ops import batched_nms
 from torchvision.transforms import functional as F
 
-# You MUST include a copy of your model definition here
-# For example, in a file named model_definition.py
-from model_definition import get_model as get_your_model
+logger = logging.getLogger(__name__)
 
-def model_fn(model_dir):
+# Weights file inside the model directory: a state dict for the architecture
+# in model_definition.py, or a whole pickled model.
+MODEL_WEIGHTS = os.environ.get('MODEL_WEIGHTS', 'model.pth')
+
+# Images per forward pass when a request carries several (application/x-tar)
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 8))
+
+# Post-processing defaults; a request can override them with Accept
+# parameters, e.g. "application/json; threshold=0.5; max_detections=10"
+SCORE_THRESHOLD = float(os.environ.get('SCORE_THRESHOLD', 0.3))
+MAX_DETECTIONS = int(os.environ.get('MAX_DETECTIONS', 100))
+TOP_K_PER_CLASS = int(os.environ.get('TOP_K_PER_CLASS', 0))  # 0 keeps all
+NMS_IOU = float(os.environ.get('NMS_IOU', 0))  # 0 skips the extra class-aware NMS
+
+# CPU tuning. QUANTIZE=int8 dynamically quantizes the Linear layers (the box
+# head and predictor of the detector); the thread counts default to Torch's
+# own choice, which oversubscribes the CPU when several workers share it.
+QUANTIZE = os.environ.get('QUANTIZE', '')
+TORCH_NUM_THREADS = int(os.environ.get('TORCH_NUM_THREADS', 0))
+TORCH_NUM_INTEROP_THREADS = int(os.environ.get('TORCH_NUM_INTEROP_THREADS', 0))
+
+def configure_threads(num_threads=TORCH_NUM_THREADS, num_interop_threads=TORCH_NUM_INTEROP_THREADS):
+    if num_threads:
+        torch.set_num_threads(num_threads)
+    if num_interop_threads:
+        try:
+            torch.set_num_interop_threads(num_interop_threads)
+        except RuntimeError:
+            # Only allowed once, before any inter-op parallel work started
+            pass
+
+# Cold start. TORCHSCRIPT_CACHE_DIR keeps a scripted copy of the loaded model
+# (keyed by the weights file, quantization and Torch version) that later
+# containers load instead of rebuilding the model; the warm-up passes run a
+# synthetic image through the model before model_fn returns, i.e. before the
+# container answers /ping, so the first real request skips lazy initialisation.
+TORCHSCRIPT_CACHE_DIR = os.environ.get('TORCHSCRIPT_CACHE_DIR', '')
+WARMUP_ITERATIONS = int(os.environ.get('WARMUP_ITERATIONS', 1))
+WARMUP_IMAGE_SIZE = int(os.environ.get('WARMUP_IMAGE_SIZE', 800))
+
+# torch >= 2.1 can map a checkpoint instead of reading it all into memory
+TORCH_SUPPORTS_MMAP = tuple(int(part) for part in re.match(r'(\d+)\.(\d+)', torch.__version__).groups()) >= (2, 1)
+
+def load_weights(model_path, device):
+    """
+    Loads the checkpoint memory-mapped where supported, with the weights-only
+    unpickler. Legacy (non-zip) files cannot be mapped and are read normally;
+    whole pickled models are rejected by the weights-only unpickler and are
+    loaded with the full one, since the file is our own artifact.
+    """
+    mmap, weights_only = TORCH_SUPPORTS_MMAP, True
+    while True:
+        try:
+            kwargs = {'mmap': True} if mmap else {}
+            return torch.load(model_path, map_location=device, weights_only=weights_only, **kwargs)
+        except pickle.UnpicklingError:
+            if not weights_only:
+                raise
+            weights_only = False
+        except RuntimeError:
+            if not mmap:
+                raise
+            mmap = False
+
+def torchscript_cache_path(model_path, quantize, device):
+    if not TORCHSCRIPT_CACHE_DIR:
+        return None
+    stat = os.stat(model_path)
+    key = f"{stat.st_size}:{stat.st_mtime_ns}:{quantize}:{device.type}:{torch.__version__}"
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return os.path.join(TORCHSCRIPT_CACHE_DIR, f"model-{digest}.pt")
+
+def save_torchscript(model, script_path):
+    try:
+        scripted = torch.jit.script(model)
+        os.makedirs(os.path.dirname(script_path), exist_ok=True)
+        tmp_path = f"{script_path}.{os.getpid()}.tmp"
+        torch.jit.save(scripted, tmp_path)
+        os.replace(tmp_path, script_path)
+    except Exception as e:
+        logger.warning(f"Could not cache a TorchScript model at {script_path}: {e}")
+
+def warm_up(model, device, iterations=WARMUP_ITERATIONS, size=WARMUP_IMAGE_SIZE):
+    image = torch.rand(3, size, size)
+    for _ in range(iterations):
+        predict_fn(image, model)
+
+def model_fn(model_dir, quantize=None, weights=None):
     """
-    Loads the PyTorch model from the model directory.
+    Loads the PyTorch model from ``weights`` (default: the MODEL_WEIGHTS
+    environment variable) in the model directory, quantized to int8 on CPU
+    when ``quantize`` (default: the QUANTIZE environment variable) says so.
     """
+    started = time.perf_counter()
+    configure_threads()
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-    
-    # Instantiate your model class
-    # The number of classes should be based on your model's training
-    num_classes = 11  # 10 skin conditions + 1 for background
-    model = get_your_model(num_classes)
-
-    # Load the state dict (weights only)
-    model_path = os.path.join(model_dir, 'model.pth')
-    model.load_state_dict(torch.load(model_path, map_location=device))
-    
-    model.to(device).eval()
+    quantize = QUANTIZE if quantize is None else quantize
+    if quantize and not (quantize == 'int8' and device.type == 'cpu'):
+        raise ValueError(f"Unsupported quantization '{quantize}' on {device.type}")
+
+    model_path = os.path.join(model_dir, weights or MODEL_WEIGHTS)
+    script_path = torchscript_cache_path(model_path, quantize, device)
+    if script_path and os.path.exists(script_path):
+        model = torch.jit.load(script_path, map_location=device)
+    else:
+        checkpoint = load_weights(model_path, device)
+        if isinstance(checkpoint, torch.nn.Module):
+            model = checkpoint
+        else:
+            # You MUST include a copy of your model definition here
+            # For example, in a file named model_definition.py
+            from model_definition import get_model as get_your_model
+
+            # Instantiate your model class
+            # The number of classes should be based on your model's training
+            num_classes = 11  # 10 skin conditions + 1 for background
+            model = get_your_model(num_classes)
+
+            # Load the state dict (weights only)
+            model.load_state_dict(checkpoint)
+        model.to(device).eval()
+
+        if quantize == 'int8':
+            model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        if script_path:
+            save_torchscript(model, script_path)
+    model.eval()
+    loaded = time.perf_counter()
+
+    warm_up(model, device)
+    logger.info(
+        f"Model ready in {time.perf_counter() - started:.2f} s "
+        f"(load {loaded - started:.2f} s, {WARMUP_ITERATIONS} warm-up passes)"
+    )
     return model
 
+def image_to_tensor(image_bytes):
+    # Convert the incoming image bytes to a PyTorch tensor
+    input_image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+    return F.to_tensor(input_image)
+
+def array_to_tensor(array):
+    """
+    Wraps a decoded image array with torch.from_numpy, which shares its
+    memory. float32 arrays must already be CxHxW in [0, 1] (what to_tensor
+    produces) and are used as they are; uint8 HxWxC RGB arrays, a quarter
+    of the size on the wire, are permuted as a view and scaled to float once.
+    """
+    if array.dtype == np.float32 and array.ndim == 3 and array.shape[0] == 3:
+        return torch.from_numpy(array)
+    if array.dtype == np.uint8 and array.ndim == 3 and array.shape[2] == 3:
+        return torch.from_numpy(array).permute(2, 0, 1).float().div_(255)
+    raise ValueError(f"Unsupported array: {array.dtype} {array.shape}, expected float32 3xHxW or uint8 HxWx3")
+
+def load_arrays(request_body, request_content_type):
+    if request_content_type == 'application/x-npy':
+        return np.load(io.BytesIO(request_body), allow_pickle=False)
+    with np.load(io.BytesIO(request_body), allow_pickle=False) as archive:
+        return [archive[name] for name in archive.files]
+
 def input_fn(request_body, request_content_type):
     """
-    Deserializes the incoming image bytes.
+    Deserializes the incoming image bytes. An image/jpeg body is one image;
+    an application/x-tar body holds several image files, returned as a list
+    of tensors in archive order.
+
+    Callers that already decoded the image can skip the JPEG decode:
+    application/x-npy carries one image array, or a batch stacked along a
+    leading axis, and application/x-npz (optionally compressed) one array per
+    image; see array_to_tensor for the accepted layouts.
     """
     if request_content_type == 'image/jpeg':
-        # Convert the incoming image bytes to a PyTorch tensor
-        input_image = Image.open(io.BytesIO(request_body)).convert("RGB")
-        image_tensor = F.to_tensor(input_image)
-        return image_tensor
+        return image_to_tensor(request_body)
+
+    if request_content_type in ('application/x-npy', 'application/x-npz'):
+        arrays = load_arrays(request_body, request_content_type)
+        if isinstance(arrays, list):
+            return [array_to_tensor(array) for array in arrays]
+        if arrays.ndim == 4:
+            return [array_to_tensor(array) for array in arrays]
+        return array_to_tensor(arrays)
+
+    if request_content_type == 'application/x-tar':
+        with tarfile.open(fileobj=io.BytesIO(request_body)) as archive:
+            return [
+                image_to_tensor(archive.extractfile(member).read())
+                for member in archive.getmembers() if member.isfile()
+            ]
     
     raise ValueError(f"Unsupported content type: {request_content_type}")
 
+def run_model(model, images):
+    output = model(images)
+    # Scripted detection models return (losses, detections)
+    if isinstance(output, tuple):
+        output = output[1]
+    return output
+
 def predict_fn(input_object, model):
     """
-    Performs the prediction on the preprocessed input.
+    Performs the prediction on the preprocessed input. A list of images runs
+    through the model in batches of up to MAX_BATCH_SIZE, one forward pass
+    each, and gives back a list of predictions in the same order.
     """
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-    with torch.no_grad():
+    if isinstance(input_object, list):
+        outputs = []
+        with torch.inference_mode():
+            for start in range(0, len(input_object), MAX_BATCH_SIZE):
+                batch = [image.to(device) for image in input_object[start:start + MAX_BATCH_SIZE]]
+                outputs.extend(run_model(model, batch))
+        return outputs
+
+    with torch.inference_mode():
         # The model expects a list of tensors
-        output = model([input_object.to(device)])
+        output = run_model(model, [input_object.to(device)])
         
     # output[0] contains the dictionary of predictions
     return output[0]
 
+def parse_accept(accept_type):
+    """
+    Splits "application/json; threshold=0.5; max_detections=10" into the
+    media type and the post-processing options, falling back to the
+    environment defaults. A missing or wildcard Accept means JSON; option
+    values that are not finite, non-negative numbers are ignored.
+    """
+    media_type, _, params = (accept_type or 'application/json').partition(';')
+    media_type = media_type.strip()
+    if media_type in ('', '*/*', 'application/*'):
+        media_type = 'application/json'
+    options = {
+        'threshold': SCORE_THRESHOLD,
+        'max_detections': MAX_DETECTIONS,
+        'top_k': TOP_K_PER_CLASS,
+        'nms_iou': NMS_IOU,
+    }
+    for param in params.split(';'):
+        name, _, value = param.strip().partition('=')
+        if name not in options:
+            continue
+        try:
+            parsed = type(options[name])(value.strip())
+        except ValueError:
+            parsed = None
+        if parsed is None or not math.isfinite(parsed) or parsed < 0:
+            logger.warning(f"Ignoring invalid Accept parameter {name}={value!r}")
+            continue
+        options[name] = parsed
+    return media_type, options
+
+def format_predictions(prediction, threshold=SCORE_THRESHOLD, max_detections=MAX_DETECTIONS,
+                       top_k=TOP_K_PER_CLASS, nms_iou=NMS_IOU):
+    """
+    Filters, ranks and rounds the detections on tensors and converts only the
+    survivors to Python lists.
+    """
+    boxes = prediction['boxes'].detach().cpu()
+    scores = prediction['scores'].detach().cpu()
+    labels = prediction['labels'].detach().cpu()
+
+    # Filter detections by a confidence threshold
+    keep = scores > threshold
+    boxes, scores, labels = boxes[keep], scores[keep], labels[keep]
+
+    if nms_iou:
+        order = batched_nms(boxes, scores, labels, nms_iou)  # sorted by score
+    else:
+        order = scores.argsort(descending=True)
+    boxes, scores, labels = boxes[order], scores[order], labels[order]
+
+    if top_k:
+        # Rank of each detection within its class, given the score order
+        same_class = (labels.unsqueeze(0) == labels.unsqueeze(1)).int()
+        rank = torch.tril(same_class, diagonal=-1).sum(dim=1)
+        keep = rank < top_k
+        boxes, scores, labels = boxes[keep], scores[keep], labels[keep]
+
+    boxes, scores, labels = boxes[:max_detections], scores[:max_detections], labels[:max_detections]
+    boxes = torch.round(boxes.double(), decimals=2).tolist()
+    scores = torch.round(scores.double(), decimals=4).tolist()
+    labels = labels.tolist()
+
+    return [
+        {"box": box, "label_id": label, "confidence": score}
+        for box, label, score in zip(boxes, labels, scores)
+    ]
+
 def output_fn(prediction, accept_type):
     """
-    Serializes the prediction result to JSON.
-    """
-    if accept_type == 'application/json':
-        boxes = prediction['boxes'].cpu().numpy().tolist()
-        scores = prediction['scores'].cpu().numpy().tolist()
-        labels = prediction['labels'].cpu().numpy().tolist()
-
-        results = []
-        for i in range(len(boxes)):
-            # Filter detections by a confidence threshold
-            if scores[i] > 0.3:
-                results.append({
-                    "box": [round(b, 2) for b in boxes[i]],
-                    "label_id": int(labels[i]),
-                    "confidence": round(scores[i], 4)
-                })
-        
-        return json.dumps({"predictions": results})
+    Serializes the prediction result to JSON: {"predictions": [...]} for a
+    single image, {"results": [{"predictions": [...]}, ...]} for a batch.
+    """
+    media_type, options = parse_accept(accept_type)
+    if media_type == 'application/json':
+        if isinstance(prediction, list):
+            return json.dumps({"results": [{"predictions": format_predictions(p, **options)} for p in prediction]})
+        return json.dumps({"predictions": format_predictions(prediction, **options)})
     
     raise ValueError(f"Unsupported accept type: {accept_type}")
\ No newline at end of file
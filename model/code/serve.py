@@ -0,0 +1,159 @@
+# Local inference server with dynamic micro-batching around inference.py
+#
+#   python model/code/serve.py --model-dir model --weights model_V2_full_cpu_compatible.pth \
+#       --max-batch-size 8 --max-wait-ms 5
+#
+# Speaks the SageMaker container protocol (GET /ping, POST /invocations), so
+# Django's 'http' prediction backend can point straight at it. It also answers
+# the runtime API path (POST /endpoints/<name>/invocations), so the 'sagemaker'
+# backend can use it as a local endpoint via SAGEMAKER_RUNTIME_URL.
+import argparse
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from inference import MODEL_WEIGHTS, input_fn, model_fn, output_fn, predict_fn
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Groups single-image requests into one forward pass. ``submit`` queues an
+    input tensor and returns a Future; a worker thread takes the first queued
+    image, keeps collecting until it has ``max_batch_size`` images or
+    ``max_wait_ms`` have passed, runs them through ``predict_fn`` together and
+    resolves each caller's Future with its own prediction.
+    """
+
+    def __init__(self, model, max_batch_size=8, max_wait_ms=5.0):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.images = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, image_tensor):
+        future = Future()
+        self._queue.put((image_tensor, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            tensors = [tensor for tensor, _ in batch]
+            try:
+                predictions = predict_fn(tensors, self.model)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.images += len(batch)
+            for (_, future), prediction in zip(batch, predictions):
+                future.set_result(prediction)
+
+
+class InferenceServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Clients connect in bursts; the default backlog of 5 drops SYNs and
+    # adds second-long retransmit delays under load.
+    request_queue_size = 128
+
+
+class InvocationHandler(BaseHTTPRequestHandler):
+    batcher = None
+    protocol_version = 'HTTP/1.1'  # keep-alive for the Django client
+
+    def do_GET(self):
+        if self.path == '/ping':
+            return self.respond(200, b'{}')
+        if self.path == '/stats':
+            batcher = self.batcher
+            average = batcher.images / batcher.batches if batcher.batches else 0.0
+            stats = {'batches': batcher.batches, 'images': batcher.images, 'average_batch': round(average, 2)}
+            return self.respond(200, json.dumps(stats).encode())
+        self.respond(404, b'{"error": "not found"}')
+
+    def do_POST(self):
+        # Read the body even for requests that are rejected, so it is not
+        # parsed as the next request on a keep-alive connection.
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if not (self.path == '/invocations' or
+                (self.path.startswith('/endpoints/') and self.path.endswith('/invocations'))):
+            return self.respond(404, b'{"error": "not found"}')
+        try:
+            data = input_fn(body, self.headers.get('Content-Type', 'image/jpeg'))
+        except (ValueError, OSError) as e:
+            return self.respond(400, json.dumps({'error': str(e)}).encode())
+        try:
+            if isinstance(data, list):
+                futures = [self.batcher.submit(tensor) for tensor in data]
+                prediction = [future.result() for future in futures]
+            else:
+                prediction = self.batcher.submit(data).result()
+        except Exception as e:
+            logger.exception("Inference failed")
+            return self.respond(500, json.dumps({'error': type(e).__name__}).encode())
+        try:
+            output = output_fn(prediction, self.headers.get('Accept'))
+        except ValueError as e:
+            return self.respond(400, json.dumps({'error': str(e)}).encode())
+        self.respond(200, output.encode())
+
+    def respond(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-batching inference server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--model-dir', default=os.environ.get('SM_MODEL_DIR', '/opt/ml/model'))
+    parser.add_argument('--weights', default=MODEL_WEIGHTS, help='Weights file in --model-dir')
+    parser.add_argument('--max-batch-size', type=int, default=int(os.environ.get('MAX_BATCH_SIZE', 8)))
+    parser.add_argument('--max-wait-ms', type=float, default=float(os.environ.get('MAX_BATCH_WAIT_MS', 5)))
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    # model_definition.py ships in the model directory, as in the SageMaker archive
+    if args.model_dir not in sys.path:
+        sys.path.insert(0, args.model_dir)
+    model = model_fn(args.model_dir, weights=args.weights)
+    InvocationHandler.batcher = MicroBatcher(model, args.max_batch_size, args.max_wait_ms)
+    server = InferenceServer((args.host, args.port), InvocationHandler)
+    logger.info(
+        f"Serving on {args.host}:{args.port}, batches of up to {args.max_batch_size} "
+        f"images, waiting at most {args.max_wait_ms} ms"
+    )
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# Load generator for the local inference server (model/code/serve.py)
+#
+#   python model/load_test.py path/to/face.jpg --url http://127.0.0.1:8080/invocations
+#
+# Sends the image from 1, 2, 4, ... concurrent clients and prints throughput
+# and latency percentiles for each level, i.e. the latency/throughput curve.
+# Run it against servers started with different --max-batch-size and
+# --max-wait-ms values (--max-batch-size 1 disables batching) to compare.
+import argparse
+import json
+import statistics
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def invoke(url, body):
+    request = urllib.request.Request(url, data=body, headers={'Content-Type': 'image/jpeg'})
+    start = time.perf_counter()
+    with urllib.request.urlopen(request) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+def run_level(url, body, concurrency, requests_per_client):
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        latencies = list(pool.map(lambda _: invoke(url, body), range(concurrency * requests_per_client)))
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'concurrency': concurrency,
+        'throughput': len(latencies) / elapsed,
+        'p50_ms': statistics.median(latencies) * 1e3,
+        'p95_ms': percentile(latencies, 0.95) * 1e3,
+        'p99_ms': percentile(latencies, 0.99) * 1e3,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Latency/throughput curve for the inference server')
+    parser.add_argument('image')
+    parser.add_argument('--url', default='http://127.0.0.1:8080/invocations')
+    parser.add_argument('--max-concurrency', type=int, default=32)
+    parser.add_argument('--requests-per-client', type=int, default=10)
+    args = parser.parse_args()
+
+    with open(args.image, 'rb') as f:
+        body = f.read()
+    invoke(args.url, body)  # warm up
+
+    print(f"{'clients':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    concurrency = 1
+    while concurrency <= args.max_concurrency:
+        row = run_level(args.url, body, concurrency, args.requests_per_client)
+        print(f"{row['concurrency']:>8} {row['throughput']:>8.1f} {row['p50_ms']:>8.1f} "
+              f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f}")
+        concurrency *= 2
+
+    stats_url = args.url.rsplit('/', 1)[0] + '/stats'
+    try:
+        with urllib.request.urlopen(stats_url) as response:
+            print(f"server: {json.loads(response.read())}")
+    except OSError:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+import logging
+import os
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no shared slots, per-process limits only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, reason, retry_after):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Bounds how many prediction requests run at once so they cannot take every
+    gunicorn worker away from the rest of the site.
+
+    Within a process at most ``max_concurrent`` requests run, a further
+    ``queue_size`` wait up to ``max_wait`` seconds for a slot and everything
+    beyond that is rejected straight away. One user can hold at most
+    ``per_user_limit`` running or waiting requests, so a single client
+    uploading in a loop cannot fill the queue.
+
+    With ``shared_slots`` set, an admitted request must also lock one of that
+    many slot files in ``slot_dir``, which caps prediction requests across
+    all worker processes on the host. The locks are released by the kernel
+    if a worker dies, so a crash never leaks a slot.
+    """
+
+    def __init__(self, max_concurrent=4, queue_size=8, max_wait=2.0, per_user_limit=2,
+                 shared_slots=0, slot_dir=None, retry_after=2):
+        self.max_concurrent = max_concurrent
+        self.queue_size = queue_size
+        self.max_wait = max_wait
+        self.per_user_limit = per_user_limit
+        self.shared_slots = shared_slots if fcntl else 0
+        self.slot_dir = slot_dir
+        self.retry_after = retry_after
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = Counter()
+        self._by_user = Counter()
+        self._cond = threading.Condition()
+        if self.shared_slots:
+            os.makedirs(slot_dir, exist_ok=True)
+
+    @contextmanager
+    def admit(self, user_key):
+        deadline = time.monotonic() + self.max_wait
+        self._acquire_local(user_key, deadline)
+        try:
+            slot = self._acquire_shared(deadline) if self.shared_slots else None
+            try:
+                yield
+            finally:
+                if slot:
+                    fcntl.flock(slot, fcntl.LOCK_UN)
+                    slot.close()
+        finally:
+            self._release_local(user_key)
+
+    def _reject(self, reason):
+        self.rejected[reason] += 1
+        raise AdmissionRejected(reason, self.retry_after)
+
+    def _acquire_local(self, user_key, deadline):
+        with self._cond:
+            if self._by_user[user_key] >= self.per_user_limit:
+                self._reject("user_limit")
+            if self.active >= self.max_concurrent and self.waiting >= self.queue_size:
+                self._reject("queue_full")
+
+            self._by_user[user_key] += 1
+            self.waiting += 1
+            try:
+                while self.active >= self.max_concurrent:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._drop_user(user_key)
+                        self._reject("timeout")
+                    self._cond.wait(remaining)
+            finally:
+                self.waiting -= 1
+            self.active += 1
+            self.admitted += 1
+
+    def _release_local(self, user_key):
+        with self._cond:
+            self.active -= 1
+            self._drop_user(user_key)
+            self._cond.notify()
+
+    def _drop_user(self, user_key):
+        self._by_user[user_key] -= 1
+        if not self._by_user[user_key]:
+            del self._by_user[user_key]
+
+    def _acquire_shared(self, deadline):
+        start = random.randrange(self.shared_slots)
+        while True:
+            for i in range(self.shared_slots):
+                slot = open(os.path.join(self.slot_dir, f"slot-{(start + i) % self.shared_slots}.lock"), "a")
+                try:
+                    fcntl.flock(slot, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return slot
+                except BlockingIOError:
+                    slot.close()
+            if time.monotonic() >= deadline:
+                with self._cond:
+                    self._reject("shared_limit")
+            time.sleep(0.01)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "active": self.active,
+                "waiting": self.waiting,
+                "admitted": self.admitted,
+                "rejected": dict(self.rejected),
+                "max_concurrent": self.max_concurrent,
+                "shared_slots": self.shared_slots,
+            }
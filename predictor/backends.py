@@ -0,0 +1,230 @@
+import importlib.util
+import json
+import logging
+import os
+import sys
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from .preprocessing import InvalidImage
+
+logger = logging.getLogger(__name__)
+
+LFS_POINTER_PREFIX = b'version https://git-lfs.github.com/spec/'
+
+
+class InferenceBackend:
+    """
+    Runs the skin detection model on one request body. ``invoke`` takes the
+    serialized input and its content type (as accepted by
+    ``model/code/inference.py``'s ``input_fn``) and returns the decoded JSON
+    result, ``{"predictions": [...]}``.
+    """
+
+    name = None
+
+    def invoke(self, body, content_type='image/jpeg'):
+        raise NotImplementedError
+
+    def is_client_error(self, error):
+        """
+        Whether ``error``, raised by ``invoke``, is the model rejecting this
+        request's input rather than the backend failing. Only errors known to
+        be caused by the upload count; anything unrecognised is treated as a
+        backend fault.
+        """
+        return False
+
+    def is_outage(self, error):
+        """
+        Whether ``error`` counts towards opening the circuit breaker: every
+        error except a client error, so a misconfigured, throttled or
+        unreachable backend trips it but a bad upload does not.
+        """
+        return not self.is_client_error(error)
+
+
+def make_sagemaker_client(region_name, endpoint_url=None, max_pool_connections=10,
+                          connect_timeout=2.0, read_timeout=10.0, max_attempts=3):
+    """
+    Builds a ``sagemaker-runtime`` client with an explicit connection pool
+    size, short timeouts and adaptive retries (client-side rate limiting plus
+    exponential backoff), so a degraded endpoint cannot hold a worker for
+    botocore's default 60 seconds per attempt. ``endpoint_url`` points the
+    client at a local fake endpoint.
+    """
+    import boto3
+    from botocore.config import Config
+
+    config = Config(
+        max_pool_connections=max_pool_connections,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        retries={'total_max_attempts': max_attempts, 'mode': 'adaptive'},
+        tcp_keepalive=True,
+    )
+    return boto3.client('sagemaker-runtime', region_name=region_name, endpoint_url=endpoint_url, config=config)
+
+
+class SageMakerBackend(InferenceBackend):
+    """
+    Calls the deployed SageMaker endpoint through ``sagemaker-runtime``.
+    """
+
+    name = 'sagemaker'
+
+    def __init__(self, endpoint_name, client):
+        self.endpoint_name = endpoint_name
+        self.client = client
+
+    def invoke(self, body, content_type='image/jpeg'):
+        response = self.client.invoke_endpoint(
+            EndpointName=self.endpoint_name,
+            ContentType=content_type,
+            Accept='application/json',
+            Body=body
+        )
+        return json.loads(response['Body'].read().decode('utf-8'))
+
+    def is_client_error(self, error):
+        from botocore.exceptions import ClientError
+
+        # A ModelError wraps the model server's own response (status 424) and
+        # carries the container's status in OriginalStatusCode. Other 4xx
+        # errors (validation, throttling, credentials) are deployment faults.
+        if isinstance(error, ClientError) and error.response.get('Error', {}).get('Code') == 'ModelError':
+            status = error.response.get('OriginalStatusCode')
+            return status is not None and 400 <= status < 500
+        return False
+
+
+class HttpBackend(InferenceBackend):
+    """
+    POSTs to a SageMaker-compatible model server (``/invocations``) such as
+    the inference container running next to the web app, keeping connections
+    alive between requests.
+    """
+
+    name = 'http'
+
+    def __init__(self, url, timeout):
+        import requests
+
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def invoke(self, body, content_type='image/jpeg'):
+        response = self.session.post(
+            self.url,
+            data=body,
+            headers={'Content-Type': content_type, 'Accept': 'application/json'},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def is_client_error(self, error):
+        import requests
+
+        # serve.py answers 400 for bodies input_fn cannot decode; 404, 415 and
+        # the like mean the URL or content type is misconfigured.
+        return (
+            isinstance(error, requests.HTTPError) and error.response is not None
+            and error.response.status_code in (400, 413, 422)
+        )
+
+
+class LocalBackend(InferenceBackend):
+    """
+    Runs the model in this process with the same ``model_fn``/``input_fn``/
+    ``predict_fn``/``output_fn`` handlers the SageMaker container uses. The
+    handler module and the weights are loaded on first use.
+    """
+
+    name = 'local'
+
+    def __init__(self, code_dir, model_dir, weights):
+        self.code_dir = code_dir
+        self.model_dir = model_dir
+        self.weights = weights
+        self._handlers = None
+        self._model = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._handlers = self._import_handlers()
+                    self._model = self._handlers.model_fn(self.model_dir, weights=self.weights)
+                    logger.info(f"Loaded local inference model from {os.path.join(self.model_dir, self.weights)}")
+        return self._handlers, self._model
+
+    def invoke(self, body, content_type='image/jpeg'):
+        handlers, model = self.load()
+        try:
+            data = handlers.input_fn(body, content_type)
+        except ValueError as e:
+            raise InvalidImage(f"Model cannot decode input: {e}") from e
+        prediction = handlers.predict_fn(data, model)
+        return json.loads(handlers.output_fn(prediction, 'application/json'))
+
+    def is_client_error(self, error):
+        return isinstance(error, InvalidImage)
+
+    def _import_handlers(self):
+        # inference.py imports model_definition as a top-level module, which
+        # lives either next to it or in the model directory.
+        for path in (self.code_dir, self.model_dir):
+            if path not in sys.path:
+                sys.path.insert(0, path)
+        spec = importlib.util.spec_from_file_location(
+            'predictor_local_inference', os.path.join(self.code_dir, 'inference.py')
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+
+def check_weights_file(path):
+    """
+    Fails at startup, rather than on every request, when the local backend's
+    weights are missing or are still a Git LFS pointer.
+    """
+    if not os.path.isfile(path):
+        raise ImproperlyConfigured(
+            f"PREDICTION_BACKEND 'local' needs model weights at {path}; "
+            "set PREDICTION_LOCAL_MODEL_DIR and PREDICTION_LOCAL_WEIGHTS"
+        )
+    with open(path, 'rb') as f:
+        if f.read(len(LFS_POINTER_PREFIX)) == LFS_POINTER_PREFIX:
+            raise ImproperlyConfigured(f"{path} is a Git LFS pointer; run `git lfs pull` to fetch the weights")
+
+
+def get_backend(name=None):
+    """
+    Builds the inference backend named by ``settings.PREDICTION_BACKEND``.
+    """
+    name = name or settings.PREDICTION_BACKEND
+    if name == 'sagemaker':
+        client = make_sagemaker_client(
+            settings.AWS_REGION,
+            endpoint_url=settings.SAGEMAKER_RUNTIME_URL or None,
+            max_pool_connections=settings.SAGEMAKER_MAX_POOL_CONNECTIONS,
+            connect_timeout=settings.SAGEMAKER_CONNECT_TIMEOUT,
+            read_timeout=settings.SAGEMAKER_READ_TIMEOUT,
+            max_attempts=settings.SAGEMAKER_MAX_ATTEMPTS,
+        )
+        return SageMakerBackend(settings.SAGEMAKER_ENDPOINT_NAME, client)
+    if name == 'http':
+        return HttpBackend(settings.PREDICTION_HTTP_URL, settings.PREDICTION_HTTP_TIMEOUT)
+    if name == 'local':
+        weights_path = os.path.join(settings.PREDICTION_LOCAL_MODEL_DIR, settings.PREDICTION_LOCAL_WEIGHTS)
+        check_weights_file(weights_path)
+        return LocalBackend(
+            settings.PREDICTION_LOCAL_CODE_DIR, settings.PREDICTION_LOCAL_MODEL_DIR, settings.PREDICTION_LOCAL_WEIGHTS
+        )
+    raise ImproperlyConfigured(f"Unknown PREDICTION_BACKEND '{name}', expected sagemaker, http or local")
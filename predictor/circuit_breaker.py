@@ -0,0 +1,98 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling the backend while the circuit is open.
+    ``retry_after`` is the number of seconds until the next trial call.
+    """
+
+    def __init__(self, retry_after):
+        super().__init__(f"Circuit open, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a backend is unhealthy. After ``failure_threshold``
+    consecutive failures the circuit opens and calls raise CircuitOpenError
+    without touching the backend. Once ``reset_timeout`` seconds have passed,
+    one trial call is let through (half-open): success closes the circuit,
+    failure opens it for another ``reset_timeout``.
+
+    ``is_failure`` decides which exceptions count as backend failures; the
+    others (e.g. a 4xx for one bad upload) are re-raised but count as a
+    healthy response, so clients cannot open the circuit for everyone.
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30.0, is_failure=None):
+        self.name = name
+        self.is_failure = is_failure or (lambda error: True)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.rejected = 0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def call(self, func, *args, **kwargs):
+        self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if self.is_failure(e):
+                self._record_failure()
+            else:
+                self._record_success()
+            raise
+        self._record_success()
+        return result
+
+    def _before_call(self):
+        with self._lock:
+            if self.opened_at is None:
+                return
+            retry_after = self.opened_at + self.reset_timeout - time.monotonic()
+            if retry_after <= 0 and not self._trial_running:
+                self._trial_running = True
+                return
+            self.rejected += 1
+            raise CircuitOpenError(max(retry_after, 1.0))
+
+    def _record_success(self):
+        with self._lock:
+            if self.opened_at is not None:
+                logger.info(f"{self.name} circuit closed")
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def _record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                if self.opened_at is None or self._trial_running:
+                    logger.warning(f"{self.name} circuit opened after {self.failures} consecutive failures")
+                self.opened_at = time.monotonic()
+            self._trial_running = False
+
+    def stats(self):
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "rejected": self.rejected,
+            }
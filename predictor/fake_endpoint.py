@@ -0,0 +1,104 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FAKE_PREDICTIONS = {'predictions': [{'label_id': 4, 'confidence': 0.9, 'box': [10, 20, 110, 140]}]}
+
+
+class FakeEndpoint:
+    """
+    A stand-in for the model server that needs neither torch nor weights, for
+    exercising timeouts, retries and the circuit breaker. It answers both the
+    container protocol (POST /invocations, for the 'http' backend) and the
+    runtime API path (POST /endpoints/<name>/invocations, for the 'sagemaker'
+    backend via SAGEMAKER_RUNTIME_URL).
+
+    ``status`` is the status the model server answers with and ``delay`` how
+    long it sleeps first. On the runtime path a non-200 status is wrapped the
+    way SageMaker wraps container errors: a 424 ModelError carrying the
+    container's status in OriginalStatusCode. Setting ``error_code`` instead
+    answers as SageMaker itself would reject the call, e.g. ``ValidationError``
+    for a missing endpoint or ``ThrottlingException``, with ``status``.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, status=200, delay=0.0, error_code=None):
+        self.status = status
+        self.delay = delay
+        self.error_code = error_code
+        self.calls = 0
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-endpoint', daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def respond(self, path):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.status == 200:
+            return 200, {}, FAKE_PREDICTIONS
+        if path.startswith('/endpoints/') and self.error_code:
+            return self.status, {'x-amzn-ErrorType': self.error_code}, {'message': f'fake {self.error_code}'}
+        if path.startswith('/endpoints/'):
+            return 424, {'x-amzn-ErrorType': 'ModelError:http://internal.amazon.com/coral/com.amazon.sagemaker/'}, {
+                'ErrorCode': 'CLIENT_ERROR_FROM_MODEL' if self.status < 500 else 'SERVER_ERROR_FROM_MODEL',
+                'OriginalStatusCode': self.status,
+                'OriginalMessage': 'fake model error',
+                'Message': f'Received error ({self.status}) from model',
+            }
+        return self.status, {}, {'error': 'fake model error'}
+
+    def _make_handler(self):
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                self.send_json(200, {}, {'status': 'ok'} if self.path == '/ping' else {'error': 'not found'})
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                if self.path != '/invocations' and not (
+                        self.path.startswith('/endpoints/') and self.path.endswith('/invocations')):
+                    self.send_json(404, {}, {'error': 'not found'})
+                    return
+                self.send_json(*endpoint.respond(self.path))
+
+            def send_json(self, status, headers, payload):
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client timed out and hung up during the delay.
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,178 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import PredictionJob
+
+logger = logging.getLogger(__name__)
+
+
+def claim_job(job_id):
+    """
+    Moves a queued job to running. The conditional UPDATE is atomic on every
+    database, so when several workers race for a job exactly one wins.
+    """
+    return PredictionJob.objects.filter(pk=job_id, status=PredictionJob.STATUS_QUEUED).update(
+        status=PredictionJob.STATUS_RUNNING, started_at=timezone.now()
+    ) == 1
+
+
+def claim_next_job():
+    """
+    Claims the oldest queued job, or returns None when the queue is empty.
+    """
+    while True:
+        job_id = (
+            PredictionJob.objects.filter(status=PredictionJob.STATUS_QUEUED)
+            .order_by('created_at').values_list('pk', flat=True).first()
+        )
+        if job_id is None:
+            return None
+        if claim_job(job_id):
+            return job_id
+
+
+def run_job(job_id):
+    """
+    Runs a claimed job and stores the same payload /api/predict/ returns, or
+    the error. The image is dropped either way.
+    """
+    from .views import detected_issues, invoke_model
+
+    job = PredictionJob.objects.get(pk=job_id)
+    try:
+        predictions = invoke_model(bytes(job.image), job.user_id)
+        job.result = {'status': 'success', 'detected_issues': detected_issues(predictions)}
+        job.status = PredictionJob.STATUS_DONE
+    except Exception as e:
+        logger.error(f"Prediction job {job_id} failed: {e}")
+        job.error = 'Prediction failed. Please try again later.'
+        job.status = PredictionJob.STATUS_FAILED
+    job.image = b''
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'result', 'error', 'image', 'finished_at'])
+
+
+def run_next_job():
+    """
+    Entry point for the in-process job pool: runs the oldest queued job, if
+    any.
+    """
+    try:
+        job_id = claim_next_job()
+        if job_id is not None:
+            run_job(job_id)
+    except Exception as e:
+        logger.error(f"Prediction job worker error: {e}")
+    finally:
+        close_old_connections()
+
+
+def requeue_stale_jobs(timeout):
+    """
+    Puts jobs back in the queue whose worker died mid-run.
+    """
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    return PredictionJob.objects.filter(status=PredictionJob.STATUS_RUNNING, started_at__lt=cutoff).update(
+        status=PredictionJob.STATUS_QUEUED, started_at=None
+    )
+
+
+def purge_finished_jobs(retention):
+    cutoff = timezone.now() - timedelta(seconds=retention)
+    deleted, _ = PredictionJob.objects.filter(
+        status__in=[PredictionJob.STATUS_DONE, PredictionJob.STATUS_FAILED], finished_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+class JobWorker(threading.Thread):
+    """
+    Polls the job table and runs jobs one at a time until ``stop`` is set.
+    """
+
+    def __init__(self, stop, poll_interval=0.5, name=None):
+        super().__init__(name=name, daemon=True)
+        self.stop = stop
+        self.poll_interval = poll_interval
+
+    def run(self):
+        while not self.stop.is_set():
+            try:
+                job_id = claim_next_job()
+                if job_id is None:
+                    self.stop.wait(self.poll_interval)
+                    continue
+                run_job(job_id)
+            except Exception as e:
+                logger.error(f"Prediction job worker error: {e}")
+                self.stop.wait(self.poll_interval)
+            finally:
+                close_old_connections()
+
+
+class JobPool:
+    """
+    Runs jobs on a thread pool inside the web process. Each submitted job
+    schedules one run, and a maintenance thread requeues stale jobs, purges
+    finished ones and schedules any queued jobs every
+    ``maintenance_interval`` seconds, so jobs left behind by a restarted
+    process run without waiting for the next submit.
+
+    The maintenance thread starts on first use rather than at import, so a
+    gunicorn master that preloads the app does not start it before forking.
+    """
+
+    def __init__(self, threads, stale_timeout, retention, maintenance_interval=60):
+        self.threads = threads
+        self.stale_timeout = stale_timeout
+        self.retention = retention
+        self.maintenance_interval = maintenance_interval
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='prediction-job')
+        self._stop = threading.Event()
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            threading.Thread(target=self._maintain_forever, name='prediction-job-maintenance', daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def submit(self):
+        self.start()
+        return self.executor.submit(run_next_job)
+
+    def maintain(self):
+        """
+        One maintenance pass; returns ``(requeued, purged, scheduled)``.
+        """
+        try:
+            requeued = requeue_stale_jobs(self.stale_timeout)
+            purged = purge_finished_jobs(self.retention)
+            queued = PredictionJob.objects.filter(status=PredictionJob.STATUS_QUEUED).count()
+        finally:
+            close_old_connections()
+        scheduled = min(queued, self.threads)
+        for _ in range(scheduled):
+            self.executor.submit(run_next_job)
+        if requeued or purged:
+            logger.info(f"Requeued {requeued} stale prediction jobs, purged {purged} finished jobs")
+        return requeued, purged, scheduled
+
+    def _maintain_forever(self):
+        while not self._stop.is_set():
+            try:
+                self.maintain()
+            except Exception as e:
+                logger.error(f"Prediction job maintenance error: {e}")
+            self._stop.wait(self.maintenance_interval)
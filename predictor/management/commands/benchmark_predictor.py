@@ -0,0 +1,150 @@
+import io
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from PIL import Image
+
+from predictor.models import SkinCondition
+from predictor.perceptual import dhash
+from predictor.preprocessing import prepare_image
+from predictor.remedies import EMPTY_REMEDIES, RemedyIndex, build_remedies_payload
+from predictor.views import LABEL_MAP
+
+
+def query_remedies(condition_name):
+    """
+    Reference lookup: the per-detection queries predict_view used to run.
+    """
+    try:
+        condition = SkinCondition.objects.get(name__iexact=condition_name)
+    except SkinCondition.DoesNotExist:
+        return EMPTY_REMEDIES
+    return build_remedies_payload(condition)
+
+
+class Command(BaseCommand):
+    help = "Benchmark predictor helpers against the database"
+
+    targets = ("remedies", "preprocess", "phash")
+
+    def add_arguments(self, parser):
+        parser.add_argument("target", choices=self.targets)
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--image", action="append", default=[], help="Image file for the preprocess and phash targets")
+        parser.add_argument(
+            "--invoke", action="store_true",
+            help="Also time the inference backend with the original and the preprocessed bytes",
+        )
+
+    def handle(self, *args, **options):
+        if options["target"] == "preprocess":
+            return self.bench_preprocess(options["image"], options["iterations"], options["invoke"])
+        if options["target"] == "phash":
+            return self.bench_phash(options["image"], options["iterations"])
+        getattr(self, f"bench_{options['target']}")(options["iterations"])
+
+    def bench_remedies(self, iterations):
+        index = RemedyIndex(max_age=float("inf"))
+        index.get("")  # build outside the measured requests
+
+        for detections in (1, 10, 100):
+            names = [LABEL_MAP[i % len(LABEL_MAP) + 1] for i in range(detections)]
+
+            with CaptureQueriesContext(connection) as reference_queries:
+                for name in names:
+                    query_remedies(name)
+            with CaptureQueriesContext(connection) as index_queries:
+                for name in names:
+                    index.get(name)
+
+            reference_time = self.time_per_request(query_remedies, names, iterations)
+            index_time = self.time_per_request(index.get, names, iterations)
+            self.stdout.write(
+                f"{detections:>4} detections  reference {len(reference_queries):4} queries "
+                f"{reference_time * 1e3:8.2f} ms  index {len(index_queries)} queries {index_time * 1e3:8.3f} ms"
+            )
+
+        index.invalidate()
+        with CaptureQueriesContext(connection) as build_queries:
+            index.get("")
+        self.stdout.write(f"index rebuild: {len(build_queries)} queries for {SkinCondition.objects.count()} conditions")
+
+    def time_per_request(self, func, names, iterations):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for name in names:
+                func(name)
+        return (time.perf_counter() - start) / iterations
+
+    def bench_preprocess(self, paths, iterations, invoke):
+        if not paths:
+            raise CommandError("Pass at least one --image")
+        max_side, quality = settings.PREDICTION_IMAGE_MAX_SIDE, settings.PREDICTION_IMAGE_QUALITY
+        self.stdout.write(f"preprocess: max side {max_side}px, JPEG quality {quality}")
+        for path in paths:
+            with open(path, "rb") as f:
+                original = f.read()
+            start = time.perf_counter()
+            for _ in range(iterations):
+                body, scale = prepare_image(original, max_side, quality)
+            seconds = (time.perf_counter() - start) / iterations
+            self.stdout.write(
+                f"{path}: {len(original) / 1024:9.1f} KB -> {len(body) / 1024:8.1f} KB "
+                f"(scale {scale[0]:.2f}x{scale[1]:.2f}) in {seconds * 1e3:7.1f} ms"
+            )
+            if invoke:
+                self.stdout.write(
+                    f"{'':>{len(path)}}  {settings.PREDICTION_BACKEND}: original {self.time_invoke(original) * 1e3:8.1f} ms, "
+                    f"preprocessed {(self.time_invoke(body) + seconds) * 1e3:8.1f} ms"
+                )
+
+    def time_invoke(self, body):
+        from predictor.views import inference_backend
+
+        start = time.perf_counter()
+        inference_backend.invoke(body, "image/jpeg")
+        return time.perf_counter() - start
+
+    def bench_phash(self, paths, iterations):
+        """
+        Hashing cost per image, and the Hamming distance between each image
+        and typical re-uploads of it, to pick PREDICTION_NEAR_DUPLICATE_RADIUS.
+        """
+        if not paths:
+            raise CommandError("Pass at least one --image")
+        self.stdout.write(f"phash: radius {settings.PREDICTION_NEAR_DUPLICATE_RADIUS} bits of 64")
+        for path in paths:
+            with open(path, "rb") as f:
+                original = f.read()
+            start = time.perf_counter()
+            for _ in range(iterations):
+                reference = dhash(original)
+            seconds = (time.perf_counter() - start) / iterations
+            distances = {
+                label: bin(reference ^ dhash(variant)).count("1")
+                for label, variant in self.reupload_variants(original).items()
+            }
+            self.stdout.write(
+                f"{path}: {seconds * 1e3:6.2f} ms/hash  "
+                + "  ".join(f"{label} {distance}" for label, distance in distances.items())
+            )
+
+    def reupload_variants(self, image_bytes):
+        image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+        width, height = image.size
+        variants = {
+            "jpeg q60": image,
+            "half size": image.resize((width // 2, height // 2)),
+            "crop 5%": image.crop((width // 20, height // 20, width - width // 20, height - height // 20)),
+            "other photo": image.transpose(Image.FLIP_LEFT_RIGHT),
+        }
+        encoded = {}
+        for label, variant in variants.items():
+            output = io.BytesIO()
+            variant.save(output, format="JPEG", quality=60 if label == "jpeg q60" else 90)
+            encoded[label] = output.getvalue()
+        return encoded
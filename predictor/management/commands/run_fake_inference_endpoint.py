@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from predictor.fake_endpoint import FakeEndpoint
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve canned predictions on a local fake model endpoint, for trying timeouts and the "
+        "circuit breaker without torch or weights (point SAGEMAKER_RUNTIME_URL or PREDICTION_HTTP_URL at it)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8080)
+        parser.add_argument("--status", type=int, default=200, help="Status the fake model answers with")
+        parser.add_argument("--delay", type=float, default=0.0, help="Seconds to wait before answering")
+
+    def handle(self, *args, **options):
+        endpoint = FakeEndpoint(options["host"], options["port"], status=options["status"], delay=options["delay"])
+        self.stdout.write(
+            f"Fake endpoint on {endpoint.url} (status {endpoint.status}, delay {endpoint.delay}s): "
+            f"POST /invocations or /endpoints/<name>/invocations"
+        )
+        try:
+            endpoint.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,43 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from predictor.jobs import JobWorker, purge_finished_jobs, requeue_stale_jobs
+
+
+class Command(BaseCommand):
+    help = "Run queued prediction jobs (POST /api/predict/jobs/) until interrupted"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=settings.PREDICTION_JOB_WORKER_THREADS)
+        parser.add_argument("--poll-interval", type=float, default=0.5)
+        parser.add_argument(
+            "--maintenance-interval", type=float, default=settings.PREDICTION_JOB_MAINTENANCE_INTERVAL,
+            help="Seconds between requeuing stale running jobs and purging old finished ones",
+        )
+
+    def handle(self, *args, **options):
+        stop = threading.Event()
+        workers = [
+            JobWorker(stop, options["poll_interval"], name=f"prediction-job-{i}")
+            for i in range(options["threads"])
+        ]
+        for worker in workers:
+            worker.start()
+        self.stdout.write(f"Running prediction jobs on {len(workers)} threads")
+
+        try:
+            while True:
+                requeued = requeue_stale_jobs(settings.PREDICTION_JOB_TIMEOUT)
+                purged = purge_finished_jobs(settings.PREDICTION_JOB_RETENTION)
+                if requeued or purged:
+                    self.stdout.write(f"Requeued {requeued} stale jobs, purged {purged} finished jobs")
+                time.sleep(options["maintenance_interval"])
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping after the running jobs finish")
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
@@ -265,6 +265,7 @@ class SkinCondition_page(models.Model):
 from django.db import models
 from django.template.defaultfilters import slugify
 from django.contrib.auth import get_user_model # Recommended way to get the User model
+import uuid
 import json # You'll need this if you want to set a default for JSONField, though default=dict is often better
 
 # Get the custom User model if you have one, otherwise it defaults to django.contrib.auth.models.User
@@ -307,4 +308,37 @@ class Article(models.Model):
     class Meta:
         ordering = ['-published_date']
         verbose_name = "Article"
-        verbose_name_plural = "Articles"
\ No newline at end of file
+        verbose_name_plural = "Articles"
+
+class PredictionJob(models.Model):
+    """
+    A queued prediction. The uploaded image waits in the table until a job
+    worker claims it, and is dropped once the result is stored.
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='prediction_jobs')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    image = models.BinaryField(blank=True)
+    result = models.JSONField(blank=True, null=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [models.Index(fields=['status', 'created_at'])]
+
+    def __str__(self):
+        return f"{self.id} ({self.status})"
@@ -0,0 +1,94 @@
+import io
+import threading
+import time
+
+import numpy as np
+from django.core.cache import caches
+from PIL import Image, ImageOps
+
+from .preprocessing import InvalidImage
+
+
+def dhash(image_bytes, hash_size=8):
+    """
+    Difference hash of an image: the grayscale image is shrunk to
+    ``(hash_size + 1) x hash_size`` pixels and each bit records whether a
+    pixel is brighter than its right-hand neighbour. Recompression, resizing
+    and small crops flip only a few of the ``hash_size ** 2`` bits. JPEGs
+    are decoded in draft mode at 1/8 scale where possible.
+    """
+    try:
+        image = Image.open(io.BytesIO(image_bytes))
+        image.draft('L', (hash_size * 8, hash_size * 8))
+        image = ImageOps.exif_transpose(image).convert('L')
+    except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+        raise InvalidImage(f"Cannot decode image: {e}") from e
+    pixels = np.asarray(image.resize((hash_size + 1, hash_size), Image.BOX), dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+
+class NearDuplicateIndex:
+    """
+    Remembers the dHash and prediction cache key of each user's recent
+    uploads, so an upload within ``radius`` bits (Hamming distance) of an
+    earlier one can reuse that prediction. The per-user history lives in the
+    same Django cache alias as the predictions, so it is shared by every
+    worker when the backend is, and expires with them.
+    """
+
+    def __init__(self, alias="predictions", radius=8, history=20):
+        self.alias = alias
+        self.radius = radius
+        self.history = history
+        self.hashed = 0
+        self.lookups = 0
+        self.reuses = 0
+        self.hash_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def hash(self, image_bytes):
+        started = time.perf_counter()
+        value = dhash(image_bytes)
+        with self._lock:
+            self.hashed += 1
+            self.hash_seconds += time.perf_counter() - started
+        return value
+
+    def find(self, user_key, image_hash):
+        """
+        Returns the prediction cache key of the closest earlier upload by this
+        user within the radius, or None.
+        """
+        entries = caches[self.alias].get(self._key(user_key)) or []
+        match = None
+        if entries:
+            hashes = np.array([h for h, _ in entries], dtype=np.uint64)
+            distances = np.bitwise_count(hashes ^ np.uint64(image_hash))
+            best = int(distances.argmin())
+            if distances[best] <= self.radius:
+                match = entries[best][1]
+        with self._lock:
+            self.lookups += 1
+            if match:
+                self.reuses += 1
+        return match
+
+    def add(self, user_key, image_hash, cache_key):
+        cache = caches[self.alias]
+        entries = [e for e in cache.get(self._key(user_key)) or [] if e[1] != cache_key]
+        entries.append((image_hash, cache_key))
+        cache.set(self._key(user_key), entries[-self.history:])
+
+    def _key(self, user_key):
+        return f"phash:{user_key}"
+
+    def stats(self):
+        with self._lock:
+            return {
+                "radius": self.radius,
+                "lookups": self.lookups,
+                "reuses": self.reuses,
+                "reuse_rate": round(self.reuses / self.lookups, 4) if self.lookups else 0.0,
+                "avg_hash_ms": round(self.hash_seconds / self.hashed * 1000, 3) if self.hashed else 0.0,
+            }
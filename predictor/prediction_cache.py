@@ -0,0 +1,56 @@
+import hashlib
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class PredictionCache:
+    """
+    Content-addressed cache of model predictions. Entries are keyed by the
+    SHA-256 of the uploaded image bytes plus the model version, so retries and
+    re-uploads of the same photo skip the inference call entirely.
+
+    Storage, TTL and size-bounded eviction come from the Django cache alias
+    (settings.CACHES["predictions"]), so the backend can be local memory,
+    files or a database table. Hit/miss counters and the inference time saved
+    by hits are kept per process.
+    """
+
+    def __init__(self, alias="predictions", version=None):
+        self.alias = alias
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def key(self, image_bytes):
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        if self.version:
+            return f"prediction:{self.version}:{digest}"
+        return f"prediction:{digest}"
+
+    def get(self, key):
+        entry = caches[self.alias].get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.saved_seconds += entry["latency"]
+        return entry["predictions"]
+
+    def set(self, key, predictions, latency):
+        caches[self.alias].set(key, {"predictions": predictions, "latency": latency})
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": settings.CACHES[self.alias]["BACKEND"],
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "saved_seconds": round(self.saved_seconds, 3),
+            }
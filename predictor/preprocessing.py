@@ -0,0 +1,115 @@
+import io
+
+import numpy as np
+from PIL import Image, ImageOps
+
+# EXIF orientations that swap width and height (90/270 degree rotations).
+TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+class InvalidImage(ValueError):
+    """
+    Raised when an upload is not an image PIL can decode.
+    """
+
+
+def open_upright(image_bytes):
+    """
+    Opens an upload and returns ``(image, orientation, width, height)``, where
+    the size is that of the upright image, i.e. after the EXIF orientation is
+    applied.
+    """
+    try:
+        image = Image.open(io.BytesIO(image_bytes))
+    except (OSError, Image.DecompressionBombError) as e:
+        raise InvalidImage(f"Cannot open image: {e}") from e
+    orientation = image.getexif().get(0x0112, 1)
+    width, height = image.size
+    if orientation in TRANSPOSED_ORIENTATIONS:
+        width, height = height, width
+    return image, orientation, width, height
+
+
+def decode_image(image, max_side):
+    """
+    Decodes an opened image to an upright RGB image whose longest side is at
+    most ``max_side``. JPEGs are decoded with PIL's draft mode, so the decoder
+    itself downsamples by 1/2, 1/4 or 1/8 instead of expanding the
+    full-resolution pixels.
+    """
+    longest = max(image.size)
+    if max_side and longest > max_side:
+        ratio = max_side / longest
+        image.draft('RGB', (round(image.width * ratio), round(image.height * ratio)))
+    try:
+        image = ImageOps.exif_transpose(image).convert('RGB')
+    except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+        # Truncated or corrupt pixel data only shows up once it is decoded.
+        raise InvalidImage(f"Cannot decode image: {e}") from e
+    if max_side:
+        image.thumbnail((max_side, max_side), Image.LANCZOS)
+    return image
+
+
+def prepare_image(image_bytes, max_side, quality):
+    """
+    Shrinks an upload before it is sent to the model. Returns
+    ``(jpeg_bytes, scale)`` where ``scale`` is the ``(x, y)`` factor that maps
+    coordinates in the sent image back to the original, upright image.
+
+    The image is decoded with ``decode_image`` and re-encoded at ``quality``.
+    Uploads that are already small, upright JPEGs are passed through
+    untouched.
+    """
+    image, orientation, width, height = open_upright(image_bytes)
+    if image.format == 'JPEG' and orientation == 1 and (not max_side or max(width, height) <= max_side):
+        return image_bytes, (1.0, 1.0)
+
+    image = decode_image(image, max_side)
+    output = io.BytesIO()
+    image.save(output, format='JPEG', quality=quality, optimize=True)
+    return output.getvalue(), (width / image.width, height / image.height)
+
+
+def prepare_array(image_bytes, max_side, compress=False):
+    """
+    Decodes and shrinks an upload like ``prepare_image`` but sends the pixels
+    instead of a JPEG, so the model server skips the decode and wraps the
+    array with ``torch.from_numpy``. Returns ``(body, content_type, scale)``.
+
+    The array is uint8 HxWx3 RGB, a quarter of the float32 tensor the model
+    uses. It is sent as ``application/x-npy``, or with ``compress`` as a
+    deflated ``application/x-npz``, which is smaller on the wire but costs
+    the server a decompress.
+    """
+    image, _, width, height = open_upright(image_bytes)
+    image = decode_image(image, max_side)
+    array = np.asarray(image, dtype=np.uint8)
+
+    output = io.BytesIO()
+    if compress:
+        np.savez_compressed(output, image=array)
+        content_type = 'application/x-npz'
+    else:
+        np.save(output, array, allow_pickle=False)
+        content_type = 'application/x-npy'
+    return output.getvalue(), content_type, (width / image.width, height / image.height)
+
+
+def scale_boxes(predictions, scale):
+    """
+    Maps the ``box`` of each prediction from sent-image pixels back to the
+    original image.
+    """
+    scale_x, scale_y = scale
+    if scale_x == scale_y == 1.0:
+        return predictions
+    scaled = []
+    for pred in predictions:
+        box = pred.get('box')
+        if box:
+            x1, y1, x2, y2 = box
+            pred = {**pred, 'box': [round(x1 * scale_x, 2), round(y1 * scale_y, 2),
+                                    round(x2 * scale_x, 2), round(y2 * scale_y, 2)]}
+        scaled.append(pred)
+    return scaled
@@ -0,0 +1,70 @@
+import threading
+import time
+
+from django.conf import settings
+
+from .models import SkinCondition
+
+EMPTY_REMEDIES = {'causes': [], 'symptoms': [], 'remedies': []}
+
+
+def build_remedies_payload(condition):
+    return {
+        'causes': [c.strip() for c in condition.causes.split('\n') if c.strip()],
+        'symptoms': [s.strip() for s in condition.symptoms.split('\n') if s.strip()],
+        'remedies': [
+            {
+                'title': r.title,
+                'directions': r.formatted_directions(),
+                'amount': r.amount,
+                'image_url': r.image.url if r.image else None
+            } for r in condition.remedy_set.all()
+        ]
+    }
+
+
+class RemedyIndex:
+    """
+    In-process map from lowercased condition name to the remedies payload
+    returned by the predict API. The whole table is loaded with two queries
+    (conditions plus prefetched remedies) and the directions are split once
+    at build time instead of on every request.
+
+    Saving or deleting a SkinCondition or Remedy invalidates the index in the
+    process that made the change (see signals.py); other workers rebuild it
+    once it is older than ``max_age`` seconds.
+    """
+
+    def __init__(self, max_age=60.0):
+        self.max_age = max_age
+        self._payloads = None
+        self._built_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        payloads = self._payloads
+        if payloads is None or time.monotonic() - self._built_at >= self.max_age:
+            payloads = self._build()
+        return payloads.get(name.lower(), EMPTY_REMEDIES)
+
+    def invalidate(self):
+        self._generation += 1
+        self._payloads = None
+
+    def _build(self):
+        with self._lock:
+            if self._payloads is not None and time.monotonic() - self._built_at < self.max_age:
+                return self._payloads
+            generation = self._generation
+            conditions = SkinCondition.objects.prefetch_related('remedy_set')
+            payloads = {condition.name.lower(): build_remedies_payload(condition) for condition in conditions}
+            # An edit committed while loading may be missing from this read;
+            # serve it for this request but rebuild on the next.
+            if generation == self._generation:
+                self._payloads = payloads
+                self._built_at = time.monotonic()
+            return payloads
+
+
+remedy_index = RemedyIndex(max_age=settings.PREDICTION_REMEDY_INDEX_MAX_AGE)
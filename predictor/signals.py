@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Remedy, SkinCondition
+from .remedies import remedy_index
+
+
+@receiver(post_save, sender=SkinCondition)
+@receiver(post_delete, sender=SkinCondition)
+@receiver(post_save, sender=Remedy)
+@receiver(post_delete, sender=Remedy)
+def invalidate_remedy_index(sender, instance, **kwargs):
+    remedy_index.invalidate()
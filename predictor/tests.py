@@ -1,3 +1,985 @@
-from django.test import TestCase
+import importlib
+import importlib.util
+import io
+import json
+import os
+import runpy
+import shutil
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import types
+from datetime import timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+import numpy as np
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.contrib.auth.models import User
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.core.cache import caches
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from .backends import HttpBackend, LocalBackend, SageMakerBackend, get_backend, make_sagemaker_client
+from .circuit_breaker import CircuitBreaker
+from . import views
+from .admission import AdmissionController, AdmissionRejected, fcntl
+from .fake_endpoint import FakeEndpoint
+from .jobs import JobPool, run_next_job
+from .models import PredictionJob, Remedy, SkinCondition
+from .perceptual import NearDuplicateIndex, dhash
+from .preprocessing import open_upright, prepare_array, prepare_image, scale_boxes
+from .remedies import EMPTY_REMEDIES, build_remedies_payload, remedy_index
+from .views import LABEL_MAP, detected_issues, prediction_job_view
+
+
+def make_jpeg(size=(64, 48), color=(200, 80, 60), **save_kwargs):
+    output = io.BytesIO()
+    Image.new('RGB', size, color).save(output, format='JPEG', **save_kwargs)
+    return output.getvalue()
+
+
+def make_photo(seed, size=(96, 72), orientation=None, **save_kwargs):
+    """
+    A JPEG with coarse random structure, so different seeds have distant
+    perceptual hashes while recompressed or cropped copies stay close.
+    """
+    cells = np.random.default_rng(seed).integers(0, 256, (size[1] // 8, size[0] // 8, 3), dtype=np.uint8)
+    image = Image.fromarray(cells).resize(size, Image.BILINEAR)
+    if orientation:
+        exif = Image.Exif()
+        exif[0x0112] = orientation
+        save_kwargs['exif'] = exif.tobytes()
+    output = io.BytesIO()
+    image.save(output, format='JPEG', quality=90, **save_kwargs)
+    return output.getvalue()
+
+
+def uploaded(name, content):
+    from django.core.files.uploadedfile import SimpleUploadedFile
+
+    return SimpleUploadedFile(name, content, content_type='image/jpeg')
+
+
+class RemedyIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Every label but the last has a condition row, so unknown names are
+        # covered too.
+        for label_id, name in list(LABEL_MAP.items())[:-1]:
+            condition = SkinCondition.objects.create(
+                name=name.title(), causes="Sun\n\nGenetics\n", symptoms="Spots\nRedness"
+            )
+            for i in range(3):
+                Remedy.objects.create(
+                    skin_condition=condition, title=f"Remedy-{i + 1}", amount="1 tsp",
+                    directions="Mix, apply\nRinse after 10 minutes",
+                )
+
+    def setUp(self):
+        remedy_index.invalidate()
+
+    def predictions(self, detections):
+        return [{'label_id': i % len(LABEL_MAP) + 1, 'confidence': 0.9} for i in range(detections)]
+
+    def expected_payload(self, name):
+        try:
+            return build_remedies_payload(SkinCondition.objects.get(name__iexact=name))
+        except SkinCondition.DoesNotExist:
+            return EMPTY_REMEDIES
+
+    def test_constant_query_count(self):
+        with self.assertNumQueries(2):
+            remedy_index.get('')
+        for detections in (1, 10, 100):
+            predictions = self.predictions(detections)
+            with self.assertNumQueries(0):
+                results = detected_issues(predictions)
+            self.assertEqual(len(results), detections)
+            for result in results:
+                self.assertEqual(result['remedies_data'], self.expected_payload(result['disease_name']))
+
+    def test_rebuild_query_count(self):
+        remedy_index.get('')
+        remedy_index.invalidate()
+        with self.assertNumQueries(2):
+            remedy_index.get('acne')
+
+    def test_edit_invalidates_index(self):
+        self.assertEqual(len(remedy_index.get('acne')['remedies']), 3)
+        Remedy.objects.filter(skin_condition__name='Acne').first().delete()
+        self.assertEqual(len(remedy_index.get('acne')['remedies']), 2)
+
+
+class LocalBackendConfigTests(TestCase):
+    def test_missing_weights_fail_at_startup(self):
+        with tempfile.TemporaryDirectory() as model_dir:
+            with self.settings(PREDICTION_LOCAL_MODEL_DIR=model_dir, PREDICTION_LOCAL_WEIGHTS='model.pth'):
+                with self.assertRaisesMessage(ImproperlyConfigured, 'model.pth'):
+                    get_backend('local')
+
+    def test_lfs_pointer_fails_at_startup(self):
+        with tempfile.TemporaryDirectory() as model_dir:
+            with open(os.path.join(model_dir, 'model.pth'), 'w') as f:
+                f.write('version https://git-lfs.github.com/spec/v1\noid sha256:0\nsize 1\n')
+            with self.settings(PREDICTION_LOCAL_MODEL_DIR=model_dir, PREDICTION_LOCAL_WEIGHTS='model.pth'):
+                with self.assertRaisesMessage(ImproperlyConfigured, 'git lfs pull'):
+                    get_backend('local')
+
+    def test_configured_weights_are_passed_to_model_fn(self):
+        with tempfile.TemporaryDirectory() as model_dir:
+            with open(os.path.join(model_dir, 'weights.pth'), 'wb') as f:
+                f.write(b'PK')
+            with self.settings(PREDICTION_LOCAL_MODEL_DIR=model_dir, PREDICTION_LOCAL_WEIGHTS='weights.pth'):
+                backend = get_backend('local')
+        self.assertIsInstance(backend, LocalBackend)
+        self.assertEqual(backend.weights, 'weights.pth')
+
+
+class PreprocessingTests(SimpleTestCase):
+    def split_jpeg(self, size=(80, 40), orientation=None):
+        # Left half red, right half blue, as stored (before EXIF rotation).
+        image = Image.new('RGB', size, (255, 0, 0))
+        image.paste((0, 0, 255), (size[0] // 2, 0, size[0], size[1]))
+        save_kwargs = {}
+        if orientation:
+            exif = Image.Exif()
+            exif[0x0112] = orientation
+            save_kwargs['exif'] = exif.tobytes()
+        output = io.BytesIO()
+        image.save(output, format='JPEG', quality=95, **save_kwargs)
+        return output.getvalue()
+
+    def test_small_upright_jpeg_passes_through(self):
+        jpeg = self.split_jpeg()
+        self.assertEqual(prepare_image(jpeg, 1333, 90), (jpeg, (1.0, 1.0)))
+
+    def test_large_image_is_downscaled(self):
+        body, scale = prepare_image(make_jpeg(size=(2000, 1000)), 1333, 90)
+        image = Image.open(io.BytesIO(body))
+        self.assertEqual(max(image.size), 1333)
+        self.assertAlmostEqual(scale[0], 2000 / image.width)
+        self.assertAlmostEqual(scale[1], 1000 / image.height)
+
+    def test_png_is_reencoded(self):
+        output = io.BytesIO()
+        Image.new('RGB', (40, 30), (10, 20, 30)).save(output, format='PNG')
+        body, scale = prepare_image(output.getvalue(), 1333, 90)
+        self.assertEqual(Image.open(io.BytesIO(body)).format, 'JPEG')
+        self.assertEqual(scale, (1.0, 1.0))
+
+    def test_exif_orientation(self):
+        # 6: rotate 90 degrees clockwise to display, so the stored left half
+        # ends up on top; 8: counter-clockwise, so it ends up at the bottom.
+        for orientation, top_color in ((6, 'red'), (8, 'blue')):
+            with self.subTest(orientation=orientation):
+                jpeg = self.split_jpeg(orientation=orientation)
+                _, found, width, height = open_upright(jpeg)
+                self.assertEqual((found, width, height), (orientation, 40, 80))
+
+                body, scale = prepare_image(jpeg, 1333, 90)
+                image = Image.open(io.BytesIO(body)).convert('RGB')
+                self.assertEqual(image.size, (40, 80))
+                self.assertEqual(scale, (1.0, 1.0))
+                red, _, blue = image.getpixel((20, 10))
+                self.assertEqual('red' if red > blue else 'blue', top_color)
+
+    def test_rotated_image_scale_maps_to_upright_pixels(self):
+        body, scale = prepare_image(self.split_jpeg(size=(400, 200), orientation=6), 100, 90)
+        image = Image.open(io.BytesIO(body))
+        # Upright the upload is 200x400, not the stored 400x200.
+        self.assertEqual(image.size, (50, 100))
+        self.assertEqual(scale, (4.0, 4.0))
+
+    def test_prepare_array(self):
+        body, content_type, scale = prepare_array(make_jpeg(size=(200, 100)), 100)
+        self.assertEqual(content_type, 'application/x-npy')
+        array = np.load(io.BytesIO(body))
+        self.assertEqual((array.shape, array.dtype), ((50, 100, 3), np.uint8))
+        self.assertEqual(scale, (2.0, 2.0))
+
+        body, content_type, _ = prepare_array(make_jpeg(size=(200, 100)), 100, compress=True)
+        self.assertEqual(content_type, 'application/x-npz')
+        self.assertEqual(np.load(io.BytesIO(body))['image'].shape, (50, 100, 3))
+
+    def test_scale_boxes(self):
+        predictions = [{'label_id': 4, 'box': [10, 20, 30, 40]}, {'label_id': 5}]
+        self.assertEqual(scale_boxes(predictions, (2.0, 0.5)), [
+            {'label_id': 4, 'box': [20.0, 10.0, 60.0, 20.0]},
+            {'label_id': 5},
+        ])
+        self.assertIs(scale_boxes(predictions, (1.0, 1.0)), predictions)
+        self.assertEqual(predictions[0]['box'], [10, 20, 30, 40])
+
+
+class BatchPredictViewTests(TestCase):
+    def setUp(self):
+        caches['predictions'].clear()
+        self.client.force_login(User.objects.create_user('patient', password='secret'))
+        self.photos = {name: make_photo(seed) for seed, name in enumerate(('a', 'b', 'c'))}
+        labels = {self.photos[name]: label for name, label in (('a', 1), ('b', 4), ('c', 5))}
+        self.invoke = mock.Mock(side_effect=lambda body, content_type: {
+            'predictions': [{'label_id': labels[body], 'confidence': 0.9, 'box': [1, 2, 3, 4]}]
+        })
+        for name, value in (('near_duplicates', None), ('inference_backend', mock.Mock(invoke=self.invoke))):
+            patcher = mock.patch.object(views, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_dedupes_and_keeps_upload_order(self):
+        names = ['a', 'b', 'a', 'bad', 'c']
+        files = [uploaded(f'{name}.jpg', self.photos.get(name, b'not an image')) for name in names]
+        response = self.client.post(reverse('predictor:predict_batch_api'), {'files': files})
+        self.assertEqual(response.status_code, 200)
+
+        results = response.json()['results']
+        self.assertEqual([r['filename'] for r in results], [f'{name}.jpg' for name in names])
+        self.assertEqual([r['status'] for r in results], ['success'] * 3 + ['error', 'success'])
+        self.assertEqual([r['detected_issues'][0]['disease_name'] for r in results if r['status'] == 'success'],
+                         ['freckles', 'acne', 'freckles', 'rosacea'])
+        self.assertEqual(results[3]['error'], views.INVALID_IMAGE_ERROR)
+        # a, b and c once each; the bad file never reaches the backend.
+        self.assertEqual(self.invoke.call_count, 3)
+
+    def test_too_many_files(self):
+        files = [uploaded(f'{i}.jpg', self.photos['a']) for i in range(settings.PREDICTION_BATCH_MAX_FILES + 1)]
+        response = self.client.post(reverse('predictor:predict_batch_api'), {'files': files})
+        self.assertEqual(response.status_code, 400)
+        self.invoke.assert_not_called()
+
+
+class InvokeModelTests(TestCase):
+    def setUp(self):
+        caches['predictions'].clear()
+        self.invoke = mock.Mock(return_value={'predictions': [{'label_id': 4, 'confidence': 0.9, 'box': [1, 2, 3, 4]}]})
+        self.index = NearDuplicateIndex(radius=8, history=20)
+        for name, value in (('near_duplicates', self.index), ('inference_backend', mock.Mock(invoke=self.invoke))):
+            patcher = mock.patch.object(views, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.photo = make_photo(1)
+
+    def recompressed(self, image_bytes, quality=40, crop=None):
+        image = Image.open(io.BytesIO(image_bytes))
+        if crop:
+            image = image.crop(crop)
+        output = io.BytesIO()
+        image.save(output, format='JPEG', quality=quality)
+        return output.getvalue()
+
+    def test_exact_cache_hit(self):
+        hits = views.prediction_cache.hits
+        first = views.invoke_model(self.photo, 'alice')
+        self.assertEqual(views.invoke_model(self.photo, 'bob'), first)
+        self.assertEqual(self.invoke.call_count, 1)
+        self.assertEqual(views.prediction_cache.hits, hits + 1)
+
+    def test_near_duplicate_reuse(self):
+        first = views.invoke_model(self.photo, 'alice')
+        copy = self.recompressed(self.photo)
+        self.assertEqual(views.invoke_model(copy, 'alice'), first)
+        self.assertEqual(self.invoke.call_count, 1)
+        self.assertEqual(self.index.reuses, 1)
+        # The reused prediction is not stored as if computed from the copy.
+        self.assertIsNone(caches['predictions'].get(views.prediction_cache.key(copy)))
+        self.assertEqual(views.invoke_model(copy, 'alice'), first)
+        self.assertEqual(self.index.reuses, 2)
+
+    def test_near_duplicates_are_per_user(self):
+        views.invoke_model(self.photo, 'alice')
+        views.invoke_model(self.recompressed(self.photo), 'bob')
+        self.assertEqual(self.invoke.call_count, 2)
+
+    def test_unrelated_image_is_not_reused(self):
+        views.invoke_model(self.photo, 'alice')
+        views.invoke_model(make_photo(2), 'alice')
+        self.assertEqual(self.invoke.call_count, 2)
+
+    def test_radius(self):
+        crop = self.recompressed(self.photo, quality=90, crop=(4, 3, 96, 72))
+        distance = bin(dhash(self.photo) ^ dhash(crop)).count('1')
+        self.assertTrue(0 < distance <= 8, distance)
+
+        for radius, calls in ((distance - 1, 2), (distance, 1)):
+            with self.subTest(radius=radius):
+                caches['predictions'].clear()
+                self.invoke.reset_mock()
+                self.index.radius = radius
+                views.invoke_model(self.photo, 'alice')
+                views.invoke_model(crop, 'alice')
+                self.assertEqual(self.invoke.call_count, calls)
+
+    def test_radius_change_applies_to_earlier_reuses(self):
+        views.invoke_model(self.photo, 'alice')
+        copy = self.recompressed(self.photo)
+        views.invoke_model(copy, 'alice')
+        self.index.radius = -1
+        views.invoke_model(copy, 'alice')
+        self.assertEqual(self.invoke.call_count, 2)
+
+
+class NearDuplicateIndexTests(SimpleTestCase):
+    def setUp(self):
+        caches['predictions'].clear()
+
+    def test_history(self):
+        index = NearDuplicateIndex(radius=0, history=2)
+        for image_hash, cache_key in ((0b0001, 'one'), (0b0010, 'two'), (0b0100, 'three')):
+            index.add('alice', image_hash, cache_key)
+        self.assertIsNone(index.find('alice', 0b0001))
+        self.assertEqual(index.find('alice', 0b0010), 'two')
+        self.assertEqual(index.find('alice', 0b0100), 'three')
+        self.assertIsNone(index.find('bob', 0b0100))
+
+    def test_readding_key_keeps_one_entry(self):
+        index = NearDuplicateIndex(radius=0, history=2)
+        index.add('alice', 0b0001, 'one')
+        index.add('alice', 0b0010, 'two')
+        index.add('alice', 0b0011, 'one')
+        self.assertEqual(index.find('alice', 0b0010), 'two')
+        self.assertEqual(index.find('alice', 0b0011), 'one')
+
+    def test_closest_within_radius(self):
+        index = NearDuplicateIndex(radius=2, history=10)
+        index.add('alice', 0b1111_0000, 'far')
+        index.add('alice', 0b0000_0111, 'near')
+        self.assertEqual(index.find('alice', 0b0000_0011), 'near')
+        self.assertIsNone(index.find('alice', 0b0011_1000))
+
+
+class PredictionJobWaitTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('patient', password='secret')
+        self.job = PredictionJob.objects.create(user=self.user)
+        patcher = mock.patch.object(views, 'job_pool', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get(self, wait):
+        request = RequestFactory().get('/', {'wait': wait})
+        request.user = self.user
+        start = time.monotonic()
+        response = prediction_job_view(request, self.job.pk)
+        return response, time.monotonic() - start
+
+    def test_rejects_invalid_wait(self):
+        for wait in ('abc', 'nan', 'NaN', 'inf', '-inf'):
+            with self.subTest(wait=wait):
+                self.assertEqual(self.get(wait)[0].status_code, 400)
+
+    def test_clamps_wait(self):
+        with self.settings(PREDICTION_JOB_MAX_WAIT=0.1, PREDICTION_JOB_POLL_INTERVAL=0.02):
+            response, elapsed = self.get('1e9')
+            self.assertEqual(json.loads(response.content)['status'], PredictionJob.STATUS_QUEUED)
+            self.assertLess(elapsed, 1)
+            response, elapsed = self.get('-5')
+            self.assertEqual(response.status_code, 200)
+            self.assertLess(elapsed, 0.05)
+
+
+class PredictionJobTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('patient', password='secret')
+        acne = SkinCondition.objects.create(name='Acne', causes='Oil', symptoms='Spots')
+        Remedy.objects.create(skin_condition=acne, title='Tea tree', amount='1 drop', directions='Dab on')
+
+    def setUp(self):
+        caches['predictions'].clear()
+        remedy_index.invalidate()
+        self.client.force_login(self.user)
+        self.pool = mock.Mock()
+        patcher = mock.patch.object(views, 'job_pool', self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def submit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('predictor:prediction_job_submit'),
+                                        {'file': uploaded('face.jpg', make_jpeg())})
+        self.assertEqual(response.status_code, 202)
+        return response.json()
+
+    def test_submit_run_poll(self):
+        submitted = self.submit()
+        self.assertEqual(submitted['status'], PredictionJob.STATUS_QUEUED)
+        self.pool.submit.assert_called_once_with()
+
+        result = {'predictions': [{'label_id': 4, 'confidence': 0.9, 'box': [1, 2, 3, 4]}]}
+        with mock.patch.object(views.inference_backend, 'invoke', return_value=result):
+            run_next_job()
+        job = PredictionJob.objects.get(pk=submitted['job_id'])
+        self.assertEqual(bytes(job.image), b'')
+
+        polled = self.client.get(submitted['poll_url'], {'wait': 1}).json()
+        self.assertEqual(polled['status'], PredictionJob.STATUS_DONE)
+        [issue] = polled['result']['detected_issues']
+        self.assertEqual(issue['disease_name'], 'acne')
+        self.assertEqual([r['title'] for r in issue['remedies_data']['remedies']], ['Tea tree'])
+
+    def test_failed_job(self):
+        submitted = self.submit()
+        with mock.patch.object(views.inference_backend, 'invoke', side_effect=RuntimeError('endpoint down')):
+            run_next_job()
+        polled = self.client.get(submitted['poll_url']).json()
+        self.assertEqual(polled['status'], PredictionJob.STATUS_FAILED)
+        self.assertEqual(polled['error'], 'Prediction failed. Please try again later.')
+        self.assertNotIn('result', polled)
+
+    def test_maintenance_requeues_stale_and_purges_finished(self):
+        now = timezone.now()
+        stale = PredictionJob.objects.create(user=self.user, status=PredictionJob.STATUS_RUNNING,
+                                             started_at=now - timedelta(seconds=600))
+        running = PredictionJob.objects.create(user=self.user, status=PredictionJob.STATUS_RUNNING,
+                                               started_at=now)
+        old = PredictionJob.objects.create(user=self.user, status=PredictionJob.STATUS_DONE,
+                                           finished_at=now - timedelta(days=2))
+        recent = PredictionJob.objects.create(user=self.user, status=PredictionJob.STATUS_FAILED,
+                                              finished_at=now)
+
+        pool = JobPool(2, stale_timeout=300, retention=86400)
+        self.addCleanup(pool.executor.shutdown)
+        with mock.patch.object(pool, 'executor') as executor:
+            self.assertEqual(pool.maintain(), (1, 1, 1))
+        executor.submit.assert_called_once_with(run_next_job)
+
+        statuses = dict(PredictionJob.objects.values_list('pk', 'status'))
+        self.assertEqual(statuses, {
+            stale.pk: PredictionJob.STATUS_QUEUED,
+            running.pk: PredictionJob.STATUS_RUNNING,
+            recent.pk: PredictionJob.STATUS_FAILED,
+        })
+        self.assertNotIn(old.pk, statuses)
+
+
+class PredictViewErrorTests(TestCase):
+    """
+    Only failures caused by the upload itself are answered with a 400.
+    """
+
+    def setUp(self):
+        caches['predictions'].clear()
+        self.client.force_login(User.objects.create_user('patient', password='secret'))
+        self.sagemaker = mock.Mock()
+        backend = SageMakerBackend('skin-endpoint', self.sagemaker)
+        breaker = CircuitBreaker(backend.name, is_failure=backend.is_outage)
+        for name, value in (('inference_backend', backend), ('backend_breaker', breaker)):
+            patcher = mock.patch.object(views, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def client_error(self, code, status, **extra):
+        from botocore.exceptions import ClientError
+
+        response = {'Error': {'Code': code, 'Message': code}, 'ResponseMetadata': {'HTTPStatusCode': status}}
+        return ClientError({**response, **extra}, 'InvokeEndpoint')
+
+    def post(self, content=None):
+        return self.client.post(reverse('predictor:predict_api'), {'file': uploaded('face.jpg', content or make_jpeg())})
+
+    def test_undecodable_upload(self):
+        for content in (b'not an image', make_jpeg()[:200]):
+            with self.subTest(size=len(content)):
+                response = self.post(content)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()['error'], views.INVALID_IMAGE_ERROR)
+        self.sagemaker.invoke_endpoint.assert_not_called()
+
+    def test_model_rejects_upload(self):
+        self.sagemaker.invoke_endpoint.side_effect = self.client_error('ModelError', 424, OriginalStatusCode=400)
+        self.assertEqual(self.post().status_code, 400)
+        self.assertEqual(views.backend_breaker.failures, 0)
+
+    def test_deployment_faults_are_server_errors(self):
+        from botocore.exceptions import NoCredentialsError
+
+        errors = [
+            NoCredentialsError(),
+            self.client_error('ValidationError', 400),
+            self.client_error('ThrottlingException', 400),
+            self.client_error('ModelError', 424, OriginalStatusCode=500),
+        ]
+        for i, error in enumerate(errors):
+            with self.subTest(error=type(error).__name__):
+                self.sagemaker.invoke_endpoint.side_effect = error
+                self.assertEqual(self.post(make_jpeg(color=(i, 0, 0))).status_code, 500)
+
+    def test_unparsable_response(self):
+        self.sagemaker.invoke_endpoint.return_value = {'Body': io.BytesIO(b'<html>')}
+        self.assertEqual(self.post().status_code, 500)
+
+    def test_cache_error(self):
+        with mock.patch.object(views.prediction_cache, 'get', side_effect=RuntimeError('cache down')):
+            self.assertEqual(self.post().status_code, 500)
+
+
+class CircuitBreakerOutageTests(SimpleTestCase):
+    """
+    Runs both remote backends against a fake endpoint: rejected requests must
+    leave the circuit closed, outages must open it.
+    """
+
+    def setUp(self):
+        self.endpoint = FakeEndpoint().start()
+        self.addCleanup(self.endpoint.stop)
+        with mock.patch.dict(os.environ, {'AWS_ACCESS_KEY_ID': 'test', 'AWS_SECRET_ACCESS_KEY': 'test'}):
+            client = make_sagemaker_client('us-east-1', endpoint_url=self.endpoint.url,
+                                           connect_timeout=0.5, read_timeout=0.5, max_attempts=1)
+        self.backends = [
+            SageMakerBackend('skin-endpoint', client),
+            HttpBackend(f'{self.endpoint.url}/invocations', timeout=0.5),
+        ]
+
+    def call_times(self, backend, times):
+        breaker = CircuitBreaker(backend.name, failure_threshold=2, reset_timeout=60, is_failure=backend.is_outage)
+        for _ in range(times):
+            try:
+                breaker.call(backend.invoke, b'image')
+            except Exception:
+                pass
+        return breaker
+
+    def test_success(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend.name):
+                self.assertEqual(backend.invoke(b'image')['predictions'][0]['label_id'], 4)
+
+    def test_client_errors_keep_circuit_closed(self):
+        self.endpoint.status = 400
+        for backend in self.backends:
+            with self.subTest(backend=backend.name):
+                self.assertEqual(self.call_times(backend, 5).state, 'closed')
+
+    def test_server_errors_open_circuit(self):
+        self.endpoint.status = 500
+        for backend in self.backends:
+            with self.subTest(backend=backend.name):
+                self.assertEqual(self.call_times(backend, 2).state, 'open')
+
+    def test_timeouts_open_circuit(self):
+        self.endpoint.delay = 1.0
+        for backend in self.backends:
+            with self.subTest(backend=backend.name):
+                self.assertEqual(self.call_times(backend, 2).state, 'open')
+
+    def test_unreachable_endpoint_opens_circuit(self):
+        self.endpoint.stop()
+        for backend in self.backends:
+            with self.subTest(backend=backend.name):
+                self.assertEqual(self.call_times(backend, 2).state, 'open')
+
+    def test_sagemaker_deployment_errors_open_circuit(self):
+        # SageMaker answers these with a 4xx, but the upload is not at fault.
+        backend = self.backends[0]
+        self.endpoint.status = 400
+        for error_code in ('ValidationError', 'ThrottlingException'):
+            with self.subTest(error_code=error_code):
+                self.endpoint.error_code = error_code
+                self.assertEqual(self.call_times(backend, 2).state, 'open')
+
+    def test_missing_credentials_open_circuit(self):
+        env = {'AWS_SHARED_CREDENTIALS_FILE': os.devnull, 'AWS_CONFIG_FILE': os.devnull,
+               'AWS_EC2_METADATA_DISABLED': 'true'}
+        # boto3's default session caches the credentials found by earlier tests.
+        with mock.patch.dict(os.environ, env), mock.patch('boto3.DEFAULT_SESSION', None):
+            for name in ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN', 'AWS_PROFILE'):
+                os.environ.pop(name, None)
+            client = make_sagemaker_client('us-east-1', endpoint_url=self.endpoint.url, max_attempts=1)
+            backend = SageMakerBackend('skin-endpoint', client)
+            self.assertEqual(self.call_times(backend, 2).state, 'open')
+        self.assertEqual(self.endpoint.calls, 0)
+
+    def test_misconfigured_http_url_opens_circuit(self):
+        backend = HttpBackend(f'{self.endpoint.url}/wrong', timeout=0.5)
+        self.assertEqual(self.call_times(backend, 2).state, 'open')
+
+    def test_unparsable_response_is_an_outage(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend.name):
+                self.assertTrue(backend.is_outage(json.JSONDecodeError('Expecting value', '<html>', 0)))
+
+    def test_client_error_after_failure_resets_count(self):
+        backend = self.backends[1]
+        breaker = CircuitBreaker(backend.name, failure_threshold=2, reset_timeout=60, is_failure=backend.is_outage)
+        for status in (500, 400, 500):
+            self.endpoint.status = status
+            with self.assertRaises(Exception):
+                breaker.call(backend.invoke, b'image')
+        self.assertEqual(breaker.state, 'closed')
+
+
+class AdmissionControllerTests(SimpleTestCase):
+    def assert_rejected(self, controller, user_key, reason):
+        with self.assertRaises(AdmissionRejected) as cm:
+            with controller.admit(user_key):
+                pass
+        self.assertEqual(cm.exception.reason, reason)
+
+    def assert_idle(self, controller):
+        stats = controller.stats()
+        self.assertEqual((stats['active'], stats['waiting']), (0, 0))
+        self.assertEqual(dict(controller._by_user), {})
+
+    def test_user_limit(self):
+        controller = AdmissionController(max_concurrent=4, per_user_limit=1)
+        with controller.admit('alice'):
+            self.assert_rejected(controller, 'alice', 'user_limit')
+            with controller.admit('bob'):
+                pass
+        self.assert_idle(controller)
+
+    def test_queue_full(self):
+        controller = AdmissionController(max_concurrent=1, queue_size=0)
+        with controller.admit('alice'):
+            self.assert_rejected(controller, 'bob', 'queue_full')
+        self.assertEqual(controller.stats()['rejected'], {'queue_full': 1})
+        self.assert_idle(controller)
+
+    def test_timeout(self):
+        controller = AdmissionController(max_concurrent=1, queue_size=1, max_wait=0.05)
+        with controller.admit('alice'):
+            self.assert_rejected(controller, 'bob', 'timeout')
+            self.assertNotIn('bob', controller._by_user)
+        self.assert_idle(controller)
+
+    def test_waiter_gets_released_slot(self):
+        controller = AdmissionController(max_concurrent=1, queue_size=1, max_wait=5)
+        holding = threading.Event()
+
+        def hold():
+            with controller.admit('alice'):
+                holding.set()
+                time.sleep(0.05)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        holding.wait()
+        with controller.admit('bob'):
+            self.assertEqual(controller.stats()['active'], 1)
+        thread.join()
+        self.assertEqual(controller.stats()['admitted'], 2)
+        self.assert_idle(controller)
+
+    def test_slot_released_after_exception(self):
+        slot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, slot_dir)
+        controller = AdmissionController(max_concurrent=1, queue_size=0, max_wait=0.05, per_user_limit=1,
+                                         shared_slots=1, slot_dir=slot_dir)
+        with self.assertRaises(RuntimeError):
+            with controller.admit('alice'):
+                self.assert_rejected(controller, 'bob', 'queue_full')
+                raise RuntimeError('view failed')
+        self.assert_idle(controller)
+        with controller.admit('alice'):
+            pass
+
+    @skipUnless(fcntl, 'shared slots need fcntl')
+    def test_shared_limit(self):
+        slot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, slot_dir)
+        # Two controllers stand in for two worker processes on one host.
+        first, second = (
+            AdmissionController(max_concurrent=4, max_wait=0.05, shared_slots=1, slot_dir=slot_dir)
+            for _ in range(2)
+        )
+        with first.admit('alice'):
+            self.assert_rejected(second, 'bob', 'shared_limit')
+        with second.admit('bob'):
+            pass
+        self.assert_idle(second)
+
+
+class AdmissionViewTests(TestCase):
+    def test_rejected_prediction_gets_429(self):
+        self.client.force_login(User.objects.create_user('patient', password='secret'))
+        controller = AdmissionController(per_user_limit=0, retry_after=7)
+        with mock.patch.object(views, 'prediction_admission', controller), \
+                mock.patch.object(views.inference_backend, 'invoke') as invoke:
+            response = self.client.post(reverse('predictor:predict_api'), {'file': uploaded('face.jpg', make_jpeg())})
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '7')
+        self.assertEqual(response.json()['status'], 'busy')
+        invoke.assert_not_called()
+
+
+class GunicornConfigTests(SimpleTestCase):
+    """
+    Admission control only engages when a worker process serves several
+    requests at once, so gunicorn must run threaded workers with room left
+    over once predictions hold every slot they may.
+    """
+
+    def load_config(self, **env):
+        with mock.patch.dict(os.environ, env):
+            return runpy.run_path(os.path.join(settings.BASE_DIR, 'gunicorn.conf.py'))
+
+    def test_threads_exceed_prediction_slots(self):
+        for env in ({}, {'PREDICTION_MAX_CONCURRENT': '10', 'PREDICTION_ADMISSION_QUEUE_SIZE': '20'}):
+            with self.subTest(env=env):
+                config = self.load_config(**env)
+                prediction_slots = (int(env.get('PREDICTION_MAX_CONCURRENT', 4))
+                                    + int(env.get('PREDICTION_ADMISSION_QUEUE_SIZE', 8)))
+                self.assertEqual(config['worker_class'], 'gthread')
+                self.assertGreater(config['threads'], prediction_slots)
+
+    def test_threads_override(self):
+        self.assertEqual(self.load_config(GUNICORN_THREADS='6')['threads'], 6)
+
+
+class MicroBatcherTests(SimpleTestCase):
+    """
+    Runs model/code/serve.py's MicroBatcher without torch: serve.py is loaded
+    with a stand-in ``inference`` module and predict_fn is replaced by a stub
+    that echoes each input and records the batch sizes it saw.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        inference = types.ModuleType('inference')
+        inference.MODEL_WEIGHTS = 'model.pth'
+        inference.input_fn = inference.model_fn = inference.output_fn = inference.predict_fn = None
+        spec = importlib.util.spec_from_file_location(
+            'predictor_test_serve', os.path.join(settings.PREDICTION_LOCAL_CODE_DIR, 'serve.py')
+        )
+        cls.serve = importlib.util.module_from_spec(spec)
+        with mock.patch.dict(sys.modules, {'inference': inference}):
+            spec.loader.exec_module(cls.serve)
+
+    def setUp(self):
+        self.batch_sizes = []
+
+        def predict_fn(tensors, model):
+            self.batch_sizes.append(len(tensors))
+            if 'fail' in tensors:
+                raise RuntimeError('model failed')
+            return [{'input': tensor, 'model': model} for tensor in tensors]
+
+        patcher = mock.patch.object(self.serve, 'predict_fn', predict_fn)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_concurrent_submits_get_their_own_results(self):
+        batcher = self.serve.MicroBatcher('model', max_batch_size=4, max_wait_ms=20)
+        results = {}
+
+        def submit(i):
+            results[i] = batcher.submit(i).result(timeout=5)
+
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {i: {'input': i, 'model': 'model'} for i in range(32)})
+        self.assertEqual(sum(self.batch_sizes), 32)
+        self.assertLessEqual(max(self.batch_sizes), 4)
+        self.assertEqual((batcher.batches, batcher.images), (len(self.batch_sizes), 32))
+
+    def test_batch_closes_when_full(self):
+        # With a 10 second wait only a full batch can be flushed in time.
+        batcher = self.serve.MicroBatcher('model', max_batch_size=4, max_wait_ms=10_000)
+        futures = [batcher.submit(i) for i in range(8)]
+        self.assertEqual([f.result(timeout=5)['input'] for f in futures], list(range(8)))
+        self.assertEqual(self.batch_sizes, [4, 4])
+
+    def test_batch_closes_after_max_wait(self):
+        batcher = self.serve.MicroBatcher('model', max_batch_size=100, max_wait_ms=50)
+        started = time.monotonic()
+        futures = [batcher.submit(i) for i in range(3)]
+        self.assertEqual([f.result(timeout=5)['input'] for f in futures], [0, 1, 2])
+        self.assertGreaterEqual(time.monotonic() - started, 0.045)
+        self.assertEqual(self.batch_sizes, [3])
+
+    def test_failure_reaches_every_caller_in_the_batch(self):
+        batcher = self.serve.MicroBatcher('model', max_batch_size=2, max_wait_ms=10_000)
+        futures = [batcher.submit(tensor) for tensor in ('ok', 'fail')]
+        for future in futures:
+            with self.assertRaises(RuntimeError):
+                future.result(timeout=5)
+        # The worker keeps serving later batches.
+        futures = [batcher.submit(tensor) for tensor in ('next', 'one')]
+        self.assertEqual([f.result(timeout=5)['input'] for f in futures], ['next', 'one'])
+
+
+TORCH_AVAILABLE = all(importlib.util.find_spec(name) for name in ('torch', 'torchvision'))
+
+# A Faster R-CNN small enough to build, script and quantize in a test: one
+# strided conv as the backbone and 64px inputs.
+TINY_MODEL_DEFINITION = """
+import torch
+from torchvision.models.detection import FasterRCNN
+from torchvision.models.detection.rpn import AnchorGenerator
+from torchvision.ops import MultiScaleRoIAlign
+
+
+def get_model(num_classes):
+    backbone = torch.nn.Sequential(torch.nn.Conv2d(3, 8, 3, stride=4, padding=1), torch.nn.ReLU())
+    backbone.out_channels = 8
+    return FasterRCNN(
+        backbone, num_classes=num_classes, min_size=64, max_size=64,
+        rpn_anchor_generator=AnchorGenerator(sizes=((16, 32),), aspect_ratios=((1.0,),)),
+        box_roi_pool=MultiScaleRoIAlign(featmap_names=['0'], output_size=7, sampling_ratio=2),
+        box_score_thresh=0.0,
+    )
+"""
+
+
+@skipUnless(TORCH_AVAILABLE, 'torch and torchvision are not installed')
+class InferenceHandlerTests(SimpleTestCase):
+    """
+    Runs model/code/inference.py, the SageMaker handler, on a tiny untrained
+    detector through the same LocalBackend the 'local' prediction backend
+    uses.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        import torch
+
+        cls.model_dir = tempfile.mkdtemp()
+        with open(os.path.join(cls.model_dir, 'model_definition.py'), 'w') as f:
+            f.write(TINY_MODEL_DEFINITION)
+        sys.modules.pop('model_definition', None)
+        cls.backend = LocalBackend(settings.PREDICTION_LOCAL_CODE_DIR, cls.model_dir, 'model.pth')
+        cls.handlers = cls.backend._import_handlers()
+
+        torch.manual_seed(0)
+        model = importlib.import_module('model_definition').get_model(11)
+        torch.save(model.state_dict(), os.path.join(cls.model_dir, 'model.pth'))
+        torch.save(model, os.path.join(cls.model_dir, 'full.pth'))
+        cls.model = cls.handlers.model_fn(cls.model_dir)
+
+        image = Image.fromarray(np.random.default_rng(0).integers(0, 256, (80, 96, 3), dtype=np.uint8))
+        output = io.BytesIO()
+        image.save(output, format='JPEG')
+        cls.jpeg = output.getvalue()
+        cls.pixels = np.asarray(Image.open(io.BytesIO(cls.jpeg)).convert('RGB'))
+
+    @classmethod
+    def tearDownClass(cls):
+        for path in (cls.backend.code_dir, cls.model_dir):
+            if path in sys.path:
+                sys.path.remove(path)
+        sys.modules.pop('model_definition', None)
+        shutil.rmtree(cls.model_dir)
+        super().tearDownClass()
+
+    def run_handler(self, body, content_type, model=None, accept='application/json; threshold=0'):
+        data = self.handlers.input_fn(body, content_type)
+        prediction = self.handlers.predict_fn(data, model or self.model)
+        return json.loads(self.handlers.output_fn(prediction, accept))
+
+    def assert_same_predictions(self, first, second):
+        self.assertEqual([p['label_id'] for p in first], [p['label_id'] for p in second])
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a['confidence'], b['confidence'], places=3)
+            for x, y in zip(a['box'], b['box']):
+                self.assertAlmostEqual(x, y, delta=0.05)
+
+    def assert_predictions(self, predictions):
+        self.assertLessEqual(len(predictions), self.handlers.MAX_DETECTIONS)
+        for pred in predictions:
+            self.assertEqual(len(pred['box']), 4)
+            self.assertIn(pred['label_id'], range(1, 11))
+            self.assertGreaterEqual(pred['confidence'], 0)
+
+    def npy(self, array):
+        output = io.BytesIO()
+        np.save(output, array)
+        return output.getvalue()
+
+    def test_jpeg(self):
+        result = self.run_handler(self.jpeg, 'image/jpeg')
+        self.assert_predictions(result['predictions'])
+        self.assertTrue(result['predictions'])
+
+    def test_tar_batch(self):
+        output = io.BytesIO()
+        with tarfile.open(fileobj=output, mode='w') as archive:
+            for name in ('a.jpg', 'b.jpg', 'c.jpg'):
+                info = tarfile.TarInfo(name)
+                info.size = len(self.jpeg)
+                archive.addfile(info, io.BytesIO(self.jpeg))
+        with mock.patch.object(self.handlers, 'MAX_BATCH_SIZE', 2):
+            result = self.run_handler(output.getvalue(), 'application/x-tar')
+        self.assertEqual(len(result['results']), 3)
+        for item in result['results']:
+            self.assert_predictions(item['predictions'])
+
+    def test_array_inputs_match_jpeg(self):
+        import torch
+
+        expected = self.handlers.input_fn(self.jpeg, 'image/jpeg')
+        uint8 = self.handlers.input_fn(self.npy(self.pixels), 'application/x-npy')
+        float32 = self.handlers.input_fn(self.npy(expected.numpy()), 'application/x-npy')
+        self.assertTrue(torch.allclose(uint8, expected))
+        self.assertTrue(torch.equal(float32, expected))
+        self.assert_same_predictions(self.run_handler(self.npy(self.pixels), 'application/x-npy')['predictions'],
+                                     self.run_handler(self.jpeg, 'image/jpeg')['predictions'])
+
+    def test_npy_and_npz_batches(self):
+        stacked = self.handlers.input_fn(self.npy(np.stack([self.pixels, self.pixels])), 'application/x-npy')
+        self.assertEqual(len(stacked), 2)
+
+        output = io.BytesIO()
+        np.savez_compressed(output, first=self.pixels, second=self.pixels[:64, :64])
+        result = self.run_handler(output.getvalue(), 'application/x-npz')
+        self.assertEqual(len(result['results']), 2)
+
+    def test_unsupported_array_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.handlers.input_fn(self.npy(self.pixels.astype(np.int64)), 'application/x-npy')
+        with self.assertRaises(ValueError):
+            self.handlers.input_fn(self.npy(self.pixels[:, :, 0]), 'application/x-npy')
+
+    def test_whole_pickled_model(self):
+        model = self.handlers.model_fn(self.model_dir, weights='full.pth')
+        self.assert_same_predictions(self.run_handler(self.jpeg, 'image/jpeg', model=model)['predictions'],
+                                     self.run_handler(self.jpeg, 'image/jpeg')['predictions'])
+
+    def test_torchscript_cache(self):
+        import torch
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        with mock.patch.object(self.handlers, 'TORCHSCRIPT_CACHE_DIR', cache_dir):
+            eager = self.handlers.model_fn(self.model_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            scripted = self.handlers.model_fn(self.model_dir)
+        self.assertIsInstance(scripted, torch.jit.ScriptModule)
+
+        # Scripted detection models return (losses, detections)
+        tensor = self.handlers.input_fn(self.jpeg, 'image/jpeg')
+        prediction = self.handlers.predict_fn(tensor, scripted)
+        self.assertEqual(set(prediction), {'boxes', 'labels', 'scores'})
+        self.assert_same_predictions(self.run_handler(self.jpeg, 'image/jpeg', model=scripted)['predictions'],
+                                     self.run_handler(self.jpeg, 'image/jpeg', model=eager)['predictions'])
+
+    def test_int8(self):
+        import torch
+
+        model = self.handlers.model_fn(self.model_dir, quantize='int8')
+        self.assertIsInstance(model.roi_heads.box_head.fc6, torch.ao.nn.quantized.dynamic.Linear)
+        self.assert_predictions(self.run_handler(self.jpeg, 'image/jpeg', model=model)['predictions'])
+
+    def test_accept_parameters(self):
+        defaults = self.run_handler(self.jpeg, 'image/jpeg', accept='application/json')
+        for accept in (None, '*/*', 'application/json; threshold=abc', 'application/json; max_detections=-1'):
+            self.assertEqual(self.run_handler(self.jpeg, 'image/jpeg', accept=accept), defaults)
+
+        limited = self.run_handler(self.jpeg, 'image/jpeg', accept='application/json; threshold=0; max_detections=2')
+        self.assertLessEqual(len(limited['predictions']), 2)
+        with self.assertRaises(ValueError):
+            self.run_handler(self.jpeg, 'image/jpeg', accept='text/csv')
+
+    def test_local_backend(self):
+        with mock.patch.object(self.backend, '_model', self.model), \
+                mock.patch.object(self.backend, '_handlers', self.handlers):
+            result = self.backend.invoke(self.jpeg, 'image/jpeg')
+        self.assertIn('predictions', result)
@@ -26,6 +26,10 @@ urlpatterns = [
         path('predict/', views.predict_page_view, name='predict_page'), 
         
         path('api/predict/', views.predict_view, name='predict_api'),  # Predict API
+        path('api/predict/batch/', views.predict_batch_view, name='predict_batch_api'),
+        path('api/predict/jobs/', views.prediction_job_submit_view, name='prediction_job_submit'),
+        path('api/predict/jobs/<uuid:job_id>/', views.prediction_job_view, name='prediction_job'),
+        path('api/predict/stats/', views.prediction_stats, name='prediction_stats'),
         path('capture/', views.capture, name='capture'),  
         # path('skin-conditions/<slug:condition_slug>/', views.skin_condition_detail_view, name='skin_condition_detail'),
 
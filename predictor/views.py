@@ -9,14 +9,27 @@ from django.views.decorators.http import require_POST
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render
 import io
-
-from .models import SkinCondition,SkinCondition_page
+import math
+import os
+
+from .models import PredictionJob, SkinCondition,SkinCondition_page
+from .jobs import JobPool
+from .admission import AdmissionController, AdmissionRejected
+from .backends import get_backend
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .perceptual import NearDuplicateIndex
+from .prediction_cache import PredictionCache
+from .preprocessing import InvalidImage, prepare_array, prepare_image, scale_boxes
+from .remedies import remedy_index
 from utils.aliases import CONDITION_ALIASES
 from django.shortcuts import render, get_object_or_404
-import hashlib # <--- ADD THIS IMPORT
-# The Django view for handling requests
-import boto3
-import json
+from django.contrib.admin.views.decorators import staff_member_required
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from django.db import close_old_connections, transaction
+from django.urls import reverse
 from django.conf import settings
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
@@ -24,10 +37,48 @@ from django.views.decorators.http import require_POST
 from django.contrib.auth.decorators import login_required
 from .models import SkinCondition
 logger = logging.getLogger(__name__)
-# Initialize the SageMaker client (can be done globally)
-SAGEMAKER_ENDPOINT_NAME = settings.SAGEMAKER_ENDPOINT_NAME
-REGION_NAME = settings.AWS_REGION
-runtime_client = boto3.client('sagemaker-runtime', region_name=REGION_NAME)
+# SageMaker endpoint, local server or in-process model, per PREDICTION_BACKEND
+inference_backend = get_backend()
+backend_breaker = CircuitBreaker(
+    inference_backend.name,
+    failure_threshold=settings.PREDICTION_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=settings.PREDICTION_CIRCUIT_RESET_TIMEOUT,
+    is_failure=inference_backend.is_outage,
+)
+# Predictions keyed by SHA-256 of the image bytes and the model version
+prediction_cache = PredictionCache(version=settings.PREDICTION_MODEL_VERSION)
+# Perceptual hashes of each user's recent uploads, for near-duplicate reuse
+near_duplicates = (
+    NearDuplicateIndex(
+        radius=settings.PREDICTION_NEAR_DUPLICATE_RADIUS,
+        history=settings.PREDICTION_NEAR_DUPLICATE_HISTORY,
+    )
+    if settings.PREDICTION_NEAR_DUPLICATES else None
+)
+# Caps prediction requests per process (and optionally per host) so uploads
+# cannot tie up every worker
+prediction_admission = AdmissionController(
+    max_concurrent=settings.PREDICTION_MAX_CONCURRENT,
+    queue_size=settings.PREDICTION_ADMISSION_QUEUE_SIZE,
+    max_wait=settings.PREDICTION_ADMISSION_MAX_WAIT,
+    per_user_limit=settings.PREDICTION_PER_USER_LIMIT,
+    shared_slots=settings.PREDICTION_SHARED_SLOTS,
+    slot_dir=settings.PREDICTION_SHARED_SLOT_DIR,
+    retry_after=settings.PREDICTION_ADMISSION_RETRY_AFTER,
+)
+# Runs submitted prediction jobs inside the web process; with 0 threads they
+# wait for `manage.py run_prediction_jobs`
+job_pool = (
+    JobPool(
+        settings.PREDICTION_JOB_THREADS,
+        stale_timeout=settings.PREDICTION_JOB_TIMEOUT,
+        retention=settings.PREDICTION_JOB_RETENTION,
+        maintenance_interval=settings.PREDICTION_JOB_MAINTENANCE_INTERVAL,
+    )
+    if settings.PREDICTION_JOB_THREADS else None
+)
+# Shared by all batch requests, so concurrent endpoint calls per worker stay bounded
+batch_executor = ThreadPoolExecutor(max_workers=settings.PREDICTION_BATCH_WORKERS, thread_name_prefix='predict-batch')
 
 # Your CLASS_MAP should be kept in Django, as it's part of the application logic
 LABEL_MAP = {
@@ -43,9 +94,125 @@ LABEL_MAP = {
     10: 'sun spots',
 }
 
+def invoke_model(image_bytes, user_key=None):
+    """
+    Returns the model's predictions for an image, serving repeated uploads of
+    the same bytes from the prediction cache. With a ``user_key`` and near
+    duplicate reuse enabled, a recompressed or slightly cropped re-upload of
+    one of that user's recent images reuses its prediction as well.
+    """
+    cache_key = prediction_cache.key(image_bytes)
+    predictions = prediction_cache.get(cache_key)
+    if predictions is not None:
+        return predictions
+
+    image_hash = None
+    if near_duplicates and user_key is not None:
+        image_hash = near_duplicates.hash(image_bytes)
+        duplicate_key = near_duplicates.find(user_key, image_hash)
+        predictions = prediction_cache.get(duplicate_key) if duplicate_key else None
+        # Not stored under this image's key: the entry belongs to the other
+        # upload, and each reuse is judged against the current radius.
+        if predictions is not None:
+            return predictions
+
+    started = time.perf_counter()
+    # 1. Downscale the image and run the model on it
+    if settings.PREDICTION_INPUT_FORMAT in ('npy', 'npz'):
+        body, content_type, scale = prepare_array(
+            image_bytes, settings.PREDICTION_IMAGE_MAX_SIDE, compress=settings.PREDICTION_INPUT_FORMAT == 'npz'
+        )
+    else:
+        body, scale = prepare_image(
+            image_bytes, settings.PREDICTION_IMAGE_MAX_SIDE, settings.PREDICTION_IMAGE_QUALITY
+        )
+        content_type = 'image/jpeg'
+    result = backend_breaker.call(inference_backend.invoke, body, content_type)
+
+    # 2. Map the predicted boxes back to original image pixels
+    predictions = scale_boxes(result.get('predictions', []), scale)
+    prediction_cache.set(cache_key, predictions, time.perf_counter() - started)
+    if image_hash is not None:
+        near_duplicates.add(user_key, image_hash, cache_key)
+    return predictions
+
+def invoke_model_in_pool(image_bytes, user_key=None):
+    """
+    invoke_model for batch pool threads. Django only closes connections at
+    the end of a request thread, so a database cache backend would otherwise
+    leave each pool thread holding its connection indefinitely.
+    """
+    close_old_connections()
+    try:
+        return invoke_model(image_bytes, user_key)
+    finally:
+        close_old_connections()
+
+def detected_issues(predictions):
+    """
+    Attaches the remedies for each detected condition from the in-process index.
+    """
+    final_results = []
+    for pred in predictions:
+        label_id = pred.get('label_id')
+
+        # Use the label_id to get the condition name from your map
+        condition_name = LABEL_MAP.get(label_id, "unknown").lower()
+
+        final_results.append({
+            "confidence": pred.get('confidence'),
+            "disease_name": condition_name,
+            "remedies_data": remedy_index.get(condition_name)
+        })
+    return final_results
+
+INVALID_IMAGE_ERROR = 'This image could not be processed.'
+
+def is_client_error(error):
+    """
+    Whether a prediction failed because of the upload itself: PIL could not
+    decode it, or the model rejected it with a 4xx. Everything else is a
+    server-side failure.
+    """
+    return isinstance(error, InvalidImage) or inference_backend.is_client_error(error)
+
+def degraded_response(error):
+    """
+    Answer sent while the inference backend's circuit is open.
+    """
+    retry_after = int(error.retry_after)
+    response = JsonResponse({
+        'status': 'degraded',
+        'error': 'Prediction is temporarily unavailable. Please try again shortly.',
+        'retry_after': retry_after,
+    }, status=503)
+    response['Retry-After'] = str(retry_after)
+    return response
+
+def admission_controlled(view):
+    """
+    Runs the view only when prediction_admission lets the user in, answering
+    429 with Retry-After otherwise.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        try:
+            with prediction_admission.admit(request.user.pk):
+                return view(request, *args, **kwargs)
+        except AdmissionRejected as e:
+            response = JsonResponse({
+                'status': 'busy',
+                'error': 'Too many predictions in progress. Please try again shortly.',
+                'retry_after': e.retry_after,
+            }, status=429)
+            response['Retry-After'] = str(e.retry_after)
+            return response
+    return wrapper
+
 @csrf_exempt
 @require_POST
 @login_required
+@admission_controlled
 def predict_view(request):
     if 'file' not in request.FILES:
         return JsonResponse({'error': 'No file provided'}, status=400)
@@ -54,58 +221,150 @@ def predict_view(request):
     image_bytes = image_file.read()
     
     try:
-        # 1. Invoke the SageMaker endpoint with the image bytes
-        response = runtime_client.invoke_endpoint(
-            EndpointName=SAGEMAKER_ENDPOINT_NAME,
-            ContentType='image/jpeg',  # Send the raw image bytes
-            Body=image_bytes
+        predictions = invoke_model(image_bytes, request.user.pk)
+        return JsonResponse({'status': 'success', 'detected_issues': detected_issues(predictions)})
+
+    except CircuitOpenError as e:
+        return degraded_response(e)
+    except Exception as e:
+        logger.error(f"Error invoking {inference_backend.name} inference backend: {e}")
+        if is_client_error(e):
+            return JsonResponse({'error': INVALID_IMAGE_ERROR}, status=400)
+        return JsonResponse({'error': 'Prediction failed. Please try again later.'}, status=500)
+
+
+@csrf_exempt
+@require_POST
+@login_required
+@admission_controlled
+def predict_batch_view(request):
+    """
+    Predicts several images (``files``) in one request. Identical images are
+    sent to the model once and the distinct ones are invoked concurrently on
+    the shared batch pool, so the request takes about as long as the slowest
+    call. Results come back in upload order; a failed image gets an error
+    entry without failing the others.
+    """
+    image_files = request.FILES.getlist('files')
+    if not image_files:
+        return JsonResponse({'error': 'No files provided'}, status=400)
+    if len(image_files) > settings.PREDICTION_BATCH_MAX_FILES:
+        return JsonResponse(
+            {'error': f'At most {settings.PREDICTION_BATCH_MAX_FILES} files per request'}, status=400
         )
-        
-        # 2. Decode and parse the JSON response from SageMaker
-        sagemaker_result = json.loads(response['Body'].read().decode('utf-8'))
-        predictions = sagemaker_result.get('predictions', [])
-        
-        # 3. Process the predictions and fetch remedies from your Django database
-        final_results = []
-        for pred in predictions:
-            label_id = pred.get('label_id')
-            
-            # Use the label_id to get the condition name from your map
-            condition_name = LABEL_MAP.get(label_id, "unknown").lower()
-            
-            # Fetch the remedy data from your Django ORM
-            try:
-                condition = SkinCondition.objects.get(name__iexact=condition_name)
-                remedies_data = {
-                    'causes': [c.strip() for c in condition.causes.split('\n') if c.strip()],
-                    'symptoms': [s.strip() for s in condition.symptoms.split('\n') if s.strip()],
-                    'remedies': [
-                        {
-                            'title': r.title,
-                            'directions': r.formatted_directions(),
-                            'amount': r.amount,
-                            'image_url': r.image.url if r.image else None
-                        } for r in condition.remedy_set.all()
-                    ]
-                }
-            except SkinCondition.DoesNotExist:
-                remedies_data = {
-                    'causes': [],
-                    'symptoms': [],
-                    'remedies': []
-                }
-
-            final_results.append({
-                "confidence": pred.get('confidence'),
-                "disease_name": condition_name,
-                "remedies_data": remedies_data
+
+    images = [image_file.read() for image_file in image_files]
+    futures = {}
+    for image_bytes in images:
+        digest = hashlib.sha256(image_bytes).digest()
+        if digest not in futures:
+            futures[digest] = batch_executor.submit(invoke_model_in_pool, image_bytes, request.user.pk)
+
+    results = []
+    for image_file, image_bytes in zip(image_files, images):
+        future = futures[hashlib.sha256(image_bytes).digest()]
+        try:
+            results.append({
+                'filename': image_file.name,
+                'status': 'success',
+                'detected_issues': detected_issues(future.result()),
+            })
+        except CircuitOpenError:
+            results.append({
+                'filename': image_file.name,
+                'status': 'degraded',
+                'error': 'Prediction is temporarily unavailable. Please try again shortly.',
+            })
+        except Exception as e:
+            logger.error(f"Error invoking {inference_backend.name} inference backend for {image_file.name}: {e}")
+            results.append({
+                'filename': image_file.name,
+                'status': 'error',
+                'error': INVALID_IMAGE_ERROR if is_client_error(e) else 'Prediction failed. Please try again later.',
             })
 
-        return JsonResponse({'status': 'success', 'detected_issues': final_results})
+    return JsonResponse({'status': 'success', 'results': results})
 
-    except Exception as e:
-        logger.error(f"Error invoking SageMaker endpoint: {e}")
-        return JsonResponse({'error': 'Prediction failed. Please try again later.'}, status=500)
+
+@csrf_exempt
+@require_POST
+@login_required
+def prediction_job_submit_view(request):
+    """
+    Queues a prediction and answers 202 with the job id straight away; the
+    result is fetched from prediction_job_view.
+    """
+    if 'file' not in request.FILES:
+        return JsonResponse({'error': 'No file provided'}, status=400)
+
+    pending = PredictionJob.objects.filter(
+        user=request.user, status__in=[PredictionJob.STATUS_QUEUED, PredictionJob.STATUS_RUNNING]
+    ).count()
+    if pending >= settings.PREDICTION_JOB_MAX_PENDING_PER_USER:
+        response = JsonResponse({'status': 'busy', 'error': 'Too many predictions pending.'}, status=429)
+        response['Retry-After'] = str(settings.PREDICTION_ADMISSION_RETRY_AFTER)
+        return response
+
+    job = PredictionJob.objects.create(user=request.user, image=request.FILES['file'].read())
+    if job_pool:
+        transaction.on_commit(job_pool.submit)
+
+    return JsonResponse({
+        'job_id': str(job.pk),
+        'status': job.status,
+        'poll_url': reverse('predictor:prediction_job', args=[job.pk]),
+    }, status=202)
+
+
+@login_required
+def prediction_job_view(request, job_id):
+    """
+    Returns a job's status and, once done, its result. With ``?wait=<seconds>``
+    the request long-polls until the job finishes or the wait (clamped to
+    ``[0, PREDICTION_JOB_MAX_WAIT]``) runs out.
+    """
+    try:
+        wait = float(request.GET.get('wait', 0))
+    except ValueError:
+        wait = math.nan
+    if not math.isfinite(wait):
+        return JsonResponse({'error': 'Invalid wait'}, status=400)
+    wait = min(max(wait, 0.0), settings.PREDICTION_JOB_MAX_WAIT)
+
+    if job_pool:
+        job_pool.start()
+    jobs = PredictionJob.objects.filter(pk=job_id, user=request.user).defer('image')
+    deadline = time.monotonic() + wait
+    while True:
+        job = jobs.first()
+        if job is None:
+            return JsonResponse({'error': 'Job not found'}, status=404)
+        finished = job.status in (PredictionJob.STATUS_DONE, PredictionJob.STATUS_FAILED)
+        if finished or time.monotonic() >= deadline:
+            break
+        time.sleep(min(settings.PREDICTION_JOB_POLL_INTERVAL, max(deadline - time.monotonic(), 0)))
+
+    data = {'job_id': str(job.pk), 'status': job.status}
+    if job.status == PredictionJob.STATUS_DONE:
+        data['result'] = job.result
+    elif job.status == PredictionJob.STATUS_FAILED:
+        data['error'] = job.error
+    return JsonResponse(data)
+
+
+@staff_member_required
+def prediction_stats(request):
+    """
+    Prediction cache, near-duplicate, circuit breaker and admission counters
+    for this worker process.
+    """
+    return JsonResponse({
+        'pid': os.getpid(),
+        'prediction_cache': prediction_cache.stats(),
+        'circuit_breaker': backend_breaker.stats(),
+        'admission': prediction_admission.stats(),
+        'near_duplicates': near_duplicates.stats() if near_duplicates else None,
+    })
 
 
 def capture(request):
@@ -256,4 +256,132 @@ else: # Development Environment
     
 # --- AWS & Sagemaker Configuration ---
 AWS_REGION = os.environ.get('AWS_REGION', 'eu-north-1')
-SAGEMAKER_ENDPOINT_NAME = os.environ.get('SAGEMAKER_ENDPOINT_NAME', "pytorch-inference-2025-08-31-15-00-44-822")
\ No newline at end of file
+SAGEMAKER_ENDPOINT_NAME = os.environ.get('SAGEMAKER_ENDPOINT_NAME', "pytorch-inference-2025-08-31-15-00-44-822")
+
+# --- Chatbot Configuration ---
+# Seconds between checks for admin edits to chatbot questions/answers.
+CHATBOT_CACHE_CHECK_INTERVAL = float(os.environ.get('CHATBOT_CACHE_CHECK_INTERVAL', 2))
+# Concurrent admin saves can commit out of id order, so workers also re-scan
+# changes created in the last CHATBOT_CACHE_CHANGE_WINDOW seconds. Changes
+# older than CHATBOT_CACHE_CHANGE_RETENTION seconds are pruned; a worker idle
+# for longer than that minus the window reloads all questions instead.
+CHATBOT_CACHE_CHANGE_WINDOW = int(os.environ.get('CHATBOT_CACHE_CHANGE_WINDOW', 300))
+CHATBOT_CACHE_CHANGE_RETENTION = int(os.environ.get('CHATBOT_CACHE_CHANGE_RETENTION', 86400))
+# spaCy model for semantic matching, loaded on first use by chatbot.nlp.
+CHATBOT_SPACY_MODEL = os.environ.get('CHATBOT_SPACY_MODEL', 'en_core_web_md')
+# Load only the tokenizer and vectors table; similarity never uses the
+# tagger, parser or NER pipes.
+CHATBOT_SPACY_VECTORS_ONLY = os.environ.get('CHATBOT_SPACY_VECTORS_ONLY', 'False') == 'True'
+# Load the model while Django starts. Together with gunicorn's preload_app
+# (see gunicorn.conf.py) that happens once in the master process.
+CHATBOT_PRELOAD_SPACY = os.environ.get('CHATBOT_PRELOAD_SPACY', 'False') == 'True'
+# Directory for the memory-mapped question embedding cache. Set to an empty
+# string to always re-embed questions at startup.
+CHATBOT_EMBEDDING_CACHE_DIR = os.environ.get('CHATBOT_EMBEDDING_CACHE_DIR', os.path.join(BASE_DIR, 'embedding_cache'))
+# Number of normalized messages whose resolved answer each worker remembers.
+CHATBOT_RESPONSE_CACHE_SIZE = int(os.environ.get('CHATBOT_RESPONSE_CACHE_SIZE', 1024))
+# JSONL log of chatbot messages that found no answer, rotated by size.
+CHATBOT_UNMATCHED_LOG_PATH = os.environ.get('CHATBOT_UNMATCHED_LOG_PATH', os.path.join(BASE_DIR, 'unmatched_queries.jsonl'))
+CHATBOT_UNMATCHED_LOG_MAX_BYTES = int(os.environ.get('CHATBOT_UNMATCHED_LOG_MAX_BYTES', 10 * 1024 * 1024))
+CHATBOT_UNMATCHED_LOG_BACKUPS = int(os.environ.get('CHATBOT_UNMATCHED_LOG_BACKUPS', 5))
+
+# --- Prediction Configuration ---
+# Where inference runs: 'sagemaker' (the endpoint above), 'http' (a
+# SageMaker-compatible model server, e.g. the inference container on the same
+# host) or 'local' (model/code/inference.py loaded into this process; needs
+# torch and torchvision installed).
+PREDICTION_BACKEND = os.environ.get('PREDICTION_BACKEND', 'sagemaker')
+# sagemaker-runtime client tuning. SAGEMAKER_RUNTIME_URL overrides the AWS
+# endpoint, e.g. to run against `manage.py run_fake_inference_endpoint`.
+# Attempts include the first call.
+SAGEMAKER_RUNTIME_URL = os.environ.get('SAGEMAKER_RUNTIME_URL', '')
+SAGEMAKER_MAX_POOL_CONNECTIONS = int(os.environ.get('SAGEMAKER_MAX_POOL_CONNECTIONS', 16))
+SAGEMAKER_CONNECT_TIMEOUT = float(os.environ.get('SAGEMAKER_CONNECT_TIMEOUT', 2))
+SAGEMAKER_READ_TIMEOUT = float(os.environ.get('SAGEMAKER_READ_TIMEOUT', 10))
+SAGEMAKER_MAX_ATTEMPTS = int(os.environ.get('SAGEMAKER_MAX_ATTEMPTS', 3))
+# After this many consecutive backend failures, predictions fail fast with a
+# 503 for PREDICTION_CIRCUIT_RESET_TIMEOUT seconds before a trial call.
+PREDICTION_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get('PREDICTION_CIRCUIT_FAILURE_THRESHOLD', 5))
+PREDICTION_CIRCUIT_RESET_TIMEOUT = float(os.environ.get('PREDICTION_CIRCUIT_RESET_TIMEOUT', 30))
+PREDICTION_HTTP_URL = os.environ.get('PREDICTION_HTTP_URL', 'http://127.0.0.1:8080/invocations')
+PREDICTION_HTTP_TIMEOUT = float(os.environ.get('PREDICTION_HTTP_TIMEOUT', 30))
+PREDICTION_LOCAL_CODE_DIR = os.environ.get('PREDICTION_LOCAL_CODE_DIR', os.path.join(BASE_DIR, 'model', 'code'))
+# Directory holding the weights and, if not next to inference.py, model_definition.py
+PREDICTION_LOCAL_MODEL_DIR = os.environ.get('PREDICTION_LOCAL_MODEL_DIR', os.path.join(BASE_DIR, 'model'))
+# Weights file in PREDICTION_LOCAL_MODEL_DIR (a state dict or a pickled model)
+PREDICTION_LOCAL_WEIGHTS = os.environ.get('PREDICTION_LOCAL_WEIGHTS', 'model_V2_full_cpu_compatible.pth')
+# Part of the prediction cache key, so results of an older model are never
+# served after a deployment. Defaults to the endpoint name.
+PREDICTION_MODEL_VERSION = os.environ.get('PREDICTION_MODEL_VERSION', SAGEMAKER_ENDPOINT_NAME)
+# Seconds a worker keeps its remedies index before reloading it. Admin edits
+# refresh the editing worker immediately and the others within this window.
+PREDICTION_REMEDY_INDEX_MAX_AGE = float(os.environ.get('PREDICTION_REMEDY_INDEX_MAX_AGE', 60))
+# Reuse the prediction of a user's earlier upload when the new image's dHash
+# (64 bits) is within PREDICTION_NEAR_DUPLICATE_RADIUS bits of it, i.e. the
+# same photo recompressed, resized or slightly cropped. The last
+# PREDICTION_NEAR_DUPLICATE_HISTORY uploads per user are compared.
+PREDICTION_NEAR_DUPLICATES = os.environ.get('PREDICTION_NEAR_DUPLICATES', 'True') == 'True'
+PREDICTION_NEAR_DUPLICATE_RADIUS = int(os.environ.get('PREDICTION_NEAR_DUPLICATE_RADIUS', 8))
+PREDICTION_NEAR_DUPLICATE_HISTORY = int(os.environ.get('PREDICTION_NEAR_DUPLICATE_HISTORY', 20))
+# Uploads are downscaled so their longest side is at most this many pixels
+# before being sent to the endpoint (0 disables). torchvision detection models
+# resize inputs to at most 1333px by default, so larger images only cost
+# bandwidth and decoding time.
+PREDICTION_IMAGE_MAX_SIDE = int(os.environ.get('PREDICTION_IMAGE_MAX_SIDE', 1333))
+PREDICTION_IMAGE_QUALITY = int(os.environ.get('PREDICTION_IMAGE_QUALITY', 90))
+# How the downscaled image is sent: 'jpeg' (re-encoded at PREDICTION_IMAGE_QUALITY),
+# 'npy' (raw uint8 pixels, no decode on the model server, largest payload) or
+# 'npz' (the same pixels deflated). The array formats suit the 'local' and
+# 'http' backends, where the payload does not cross the network to SageMaker.
+PREDICTION_INPUT_FORMAT = os.environ.get('PREDICTION_INPUT_FORMAT', 'jpeg')
+# Admission control for the predict APIs. Per worker process: requests running
+# at once, requests allowed to wait, how long they wait (seconds) and requests
+# one user may have running or waiting. These need threaded gunicorn workers
+# (gunicorn.conf.py) with GUNICORN_THREADS above running + waiting; a sync
+# worker only ever has one request in flight. PREDICTION_SHARED_SLOTS > 0 also
+# caps prediction requests across all workers on the host using lock files in
+# PREDICTION_SHARED_SLOT_DIR. Rejected requests get a 429.
+PREDICTION_MAX_CONCURRENT = int(os.environ.get('PREDICTION_MAX_CONCURRENT', 4))
+PREDICTION_ADMISSION_QUEUE_SIZE = int(os.environ.get('PREDICTION_ADMISSION_QUEUE_SIZE', 8))
+PREDICTION_ADMISSION_MAX_WAIT = float(os.environ.get('PREDICTION_ADMISSION_MAX_WAIT', 2))
+PREDICTION_PER_USER_LIMIT = int(os.environ.get('PREDICTION_PER_USER_LIMIT', 2))
+PREDICTION_SHARED_SLOTS = int(os.environ.get('PREDICTION_SHARED_SLOTS', 0))
+PREDICTION_SHARED_SLOT_DIR = os.environ.get('PREDICTION_SHARED_SLOT_DIR', os.path.join(BASE_DIR, 'prediction_slots'))
+PREDICTION_ADMISSION_RETRY_AFTER = int(os.environ.get('PREDICTION_ADMISSION_RETRY_AFTER', 2))
+
+# Async prediction jobs (/api/predict/jobs/). PREDICTION_JOB_THREADS > 0 runs
+# them on a thread pool in each web process; otherwise start
+# `manage.py run_prediction_jobs` (PREDICTION_JOB_WORKER_THREADS threads).
+# Every PREDICTION_JOB_MAINTENANCE_INTERVAL seconds, running jobs older than
+# PREDICTION_JOB_TIMEOUT seconds are requeued and finished jobs older than
+# PREDICTION_JOB_RETENTION seconds are deleted.
+PREDICTION_JOB_THREADS = int(os.environ.get('PREDICTION_JOB_THREADS', 2))
+PREDICTION_JOB_WORKER_THREADS = int(os.environ.get('PREDICTION_JOB_WORKER_THREADS', 4))
+PREDICTION_JOB_MAX_PENDING_PER_USER = int(os.environ.get('PREDICTION_JOB_MAX_PENDING_PER_USER', 5))
+PREDICTION_JOB_MAX_WAIT = float(os.environ.get('PREDICTION_JOB_MAX_WAIT', 20))
+PREDICTION_JOB_POLL_INTERVAL = float(os.environ.get('PREDICTION_JOB_POLL_INTERVAL', 0.25))
+PREDICTION_JOB_TIMEOUT = int(os.environ.get('PREDICTION_JOB_TIMEOUT', 300))
+PREDICTION_JOB_RETENTION = int(os.environ.get('PREDICTION_JOB_RETENTION', 24 * 60 * 60))
+PREDICTION_JOB_MAINTENANCE_INTERVAL = float(os.environ.get('PREDICTION_JOB_MAINTENANCE_INTERVAL', 60))
+
+# /api/predict/batch/: images accepted per request, and endpoint calls each
+# worker runs at once (keep at or below SAGEMAKER_MAX_POOL_CONNECTIONS).
+PREDICTION_BATCH_MAX_FILES = int(os.environ.get('PREDICTION_BATCH_MAX_FILES', 10))
+PREDICTION_BATCH_WORKERS = int(os.environ.get('PREDICTION_BATCH_WORKERS', 8))
+
+# The "predictions" cache stores model results keyed by image hash. Pick the
+# backend with PREDICTION_CACHE_BACKEND, e.g. locmem, filebased (LOCATION is a
+# directory) or db (LOCATION is a table; run `manage.py createcachetable`).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'predictions': {
+        'BACKEND': os.environ.get('PREDICTION_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('PREDICTION_CACHE_LOCATION', 'prediction_results'),
+        'TIMEOUT': int(os.environ.get('PREDICTION_CACHE_TTL', 24 * 60 * 60)),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('PREDICTION_CACHE_MAX_ENTRIES', 1000)),
+        },
+    },
+}